@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional, Tuple
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.aggregates import VALUE_BUCKETS
+from polysynergy_section_field.section_field_runner.sql.filters import NULL_OPERATORS
 
 
 @field_type(category="basic", icon="toggle.svg")
@@ -71,6 +73,14 @@ class BooleanField(FieldType):
 
         return sql
 
+    def get_filter_operators(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Booleans only support (in)equality"""
+        return ("eq", "neq") + NULL_OPERATORS
+
+    def get_group_buckets(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Booleans group by value"""
+        return VALUE_BUCKETS
+
     def get_table_cell_config(
         self,
         value: Any,
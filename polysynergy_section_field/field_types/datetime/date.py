@@ -2,6 +2,11 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.aggregates import DATE_BUCKETS, ORDERED_AGGREGATES
+from polysynergy_section_field.section_field_runner.sql.filters import RANGE_OPERATORS
+
+from .iso import parse_date, parse_date_bounds, parse_dates
+from .vectorized import dates_to_datetime64
 
 
 @field_type(category="datetime", icon="calendar.svg")
@@ -39,6 +44,72 @@ class DateField(FieldType):
             }
         }
 
+    def validate(self, value, settings=None):
+        """Validate an ISO-8601 date and the minDate/maxDate bounds"""
+        if value is None:
+            return (True, None)
+
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            return (False, "Invalid date (expected YYYY-MM-DD)")
+
+        if settings:
+            try:
+                min_date, max_date = parse_date_bounds(settings.get("minDate"), settings.get("maxDate"))
+            except (TypeError, ValueError):
+                # TypeError: unhashable bounds never reach the cached parser
+                return (False, "Invalid minDate/maxDate setting")
+
+            if min_date and parsed < min_date:
+                return (False, f"Date must be on or after {min_date.isoformat()}")
+            if max_date and parsed > max_date:
+                return (False, f"Date must be on or before {max_date.isoformat()}")
+
+        return (True, None)
+
+    def serialize(self, value, settings=None):
+        """Convert to a date for DATE"""
+        return None if value is None else parse_date(value)
+
+    def deserialize(self, value, settings=None):
+        """Convert a database value to a date"""
+        return None if value is None else parse_date(value)
+
+    def serialize_many(self, values, settings=None):
+        """Serialize a column of dates"""
+        return parse_dates(values)
+
+    def deserialize_many(self, values, settings=None):
+        """Deserialize a column of dates"""
+        return parse_dates(values)
+
+    def deserialize_array(self, values):
+        """
+        Deserialize a column into a numpy datetime64[D] array (requires numpy).
+
+        Skips creating a date object per value; use with the helpers in
+        vectorized (bucket, range_mask, bucket_counts) for analytics.
+        """
+        return dates_to_datetime64(values)
+
+    def get_filter_operators(self, settings=None):
+        """Dates support comparisons and ranges"""
+        return RANGE_OPERATORS
+
+    def get_aggregate_functions(self, settings=None):
+        """Dates support earliest/latest"""
+        return ORDERED_AGGREGATES
+
+    def get_group_buckets(self, settings=None):
+        """Dates can be grouped per day, week, month, quarter or year"""
+        return DATE_BUCKETS
+
+    def compile_group_by(self, field_name, bucket, params, settings=None, options=None):
+        """Truncate to the bucket and cast back to DATE (date_trunc returns a timestamp)"""
+        options = {key: value for key, value in (options or {}).items() if key != "timezone"}
+        return f"{super().compile_group_by(field_name, bucket, params, settings, options)}::date"
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
@@ -2,11 +2,22 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.aggregates import ORDERED_AGGREGATES, TIMESTAMP_BUCKETS
+from polysynergy_section_field.section_field_runner.sql.filters import RANGE_OPERATORS
+
+from .iso import get_timezone, parse_datetime, parse_datetimes
+from .vectorized import to_datetime64
 
 
 @field_type(category="datetime", icon="calendar-clock.svg")
 class DateTimeField(FieldType):
-    """DateTime field - stores date and time"""
+    """
+    DateTime field - stores date and time.
+
+    Values are normalized to UTC: serialize and deserialize both return
+    timezone-aware UTC datetimes, as $n drivers bind them. Naive input is
+    interpreted in the defaultTimezone setting (UTC by default).
+    """
 
     handle = "datetime"
     label = "Date Time"
@@ -34,10 +45,73 @@ class DateTimeField(FieldType):
                     "default": True,
                     "title": "Show Timezone",
                     "description": "Display timezone information"
+                },
+                "defaultTimezone": {
+                    "type": "string",
+                    "default": "UTC",
+                    "title": "Default Timezone",
+                    "description": "IANA timezone (e.g. Europe/Amsterdam) or offset for input without one"
                 }
             }
         }
 
+    def _default_timezone(self, settings):
+        return get_timezone(settings.get("defaultTimezone", "UTC") if settings else "UTC")
+
+    def validate(self, value, settings=None):
+        """Validate an ISO-8601 timestamp"""
+        if value is None:
+            return (True, None)
+
+        try:
+            default_timezone = self._default_timezone(settings)
+        except ValueError as e:
+            return (False, str(e))
+
+        try:
+            parse_datetime(value, default_timezone)
+        except ValueError:
+            return (False, "Invalid date/time (expected ISO-8601, e.g. 2025-10-31T10:30:00Z)")
+
+        return (True, None)
+
+    def serialize(self, value, settings=None):
+        """Convert to an aware UTC datetime for TIMESTAMP WITH TIME ZONE"""
+        return None if value is None else parse_datetime(value, self._default_timezone(settings))
+
+    def deserialize(self, value, settings=None):
+        """Convert a database value to an aware UTC datetime"""
+        return None if value is None else parse_datetime(value)
+
+    def serialize_many(self, values, settings=None):
+        """Serialize a column of timestamps"""
+        return parse_datetimes(values, self._default_timezone(settings))
+
+    def deserialize_many(self, values, settings=None):
+        """Deserialize a column of timestamps"""
+        return parse_datetimes(values)
+
+    def deserialize_array(self, values, unit="us"):
+        """
+        Deserialize a column into a UTC numpy datetime64 array (requires numpy).
+
+        Skips creating a datetime object per value; use with the helpers in
+        vectorized (bucket, range_mask, bucket_counts) for analytics.
+        """
+        return to_datetime64(values, unit)
+
+    def get_filter_operators(self, settings=None):
+        """Timestamps support comparisons and ranges"""
+        return RANGE_OPERATORS
+
+    def get_aggregate_functions(self, settings=None):
+        """Timestamps support earliest/latest"""
+        return ORDERED_AGGREGATES
+
+    def get_group_buckets(self, settings=None):
+        """Timestamps can be grouped per minute up to per year, optionally in a timezone"""
+        return TIMESTAMP_BUCKETS
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         date_format = settings.get("dateFormat", "YYYY-MM-DD") if settings else "YYYY-MM-DD"
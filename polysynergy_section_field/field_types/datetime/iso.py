@@ -0,0 +1,175 @@
+"""Strict ISO-8601 conversion helpers for date and time field types"""
+
+import re
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+UTC = timezone.utc
+
+_ZERO = timedelta(0)
+
+# fromisoformat also accepts basic ('20251031') and week ('2025-W44-5')
+# forms since Python 3.11; only the extended calendar forms are valid here
+_TIME = r"\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?"
+_OFFSET = r"(?:Z|[+-]\d{2}:\d{2})"
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TIME_RE = re.compile(rf"{_TIME}{_OFFSET}?")
+_DATETIME_RE = re.compile(rf"\d{{4}}-\d{{2}}-\d{{2}}(?:[T ]{_TIME}{_OFFSET}?)?")
+
+
+def _check_format(pattern: "re.Pattern[str]", value: str, kind: str) -> str:
+    if not pattern.fullmatch(value):
+        raise ValueError(f"Invalid ISO-8601 {kind}: '{value}'")
+    return value
+
+
+@lru_cache(maxsize=256)
+def get_timezone(name: str) -> tzinfo:
+    """
+    Cached tzinfo for an IANA name ('Europe/Amsterdam'), 'UTC'/'Z' or a
+    fixed offset ('+02:00').
+
+    Raises:
+        ValueError: If the name is not a known timezone or offset
+    """
+    if name in ("UTC", "Z", "+00:00", "-00:00"):
+        return UTC
+
+    if name[:1] in ("+", "-"):
+        offset = time.fromisoformat(name[1:])
+        delta = timedelta(hours=offset.hour, minutes=offset.minute)
+        return timezone(delta if name[0] == "+" else -delta)
+
+    try:
+        return ZoneInfo(name)
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Unknown timezone '{name}'") from e
+
+
+def parse_date(value: Any) -> date:
+    """
+    Parse a date from an ISO-8601 string ('2025-10-31'), date or datetime.
+
+    Raises:
+        ValueError: If the value is not a valid date
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return date.fromisoformat(_check_format(_DATE_RE, value, "date"))
+    raise ValueError(f"Cannot parse date from {type(value).__name__}")
+
+
+def parse_time(value: Any) -> time:
+    """
+    Parse a time of day from an ISO-8601 string ('10:30', '10:30:15') or time.
+
+    Offsets are dropped, as PostgreSQL does for TIME columns.
+
+    Raises:
+        ValueError: If the value is not a valid time
+    """
+    if isinstance(value, time):
+        parsed = value
+    elif isinstance(value, str):
+        parsed = time.fromisoformat(_check_format(_TIME_RE, value, "time"))
+    else:
+        raise ValueError(f"Cannot parse time from {type(value).__name__}")
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.replace(tzinfo=None)
+    return parsed
+
+
+def parse_datetime(value: Any, default_timezone: tzinfo = UTC) -> datetime:
+    """
+    Parse a timestamp and normalize it to UTC.
+
+    Accepts ISO-8601 strings (with 'Z', an offset or naive), datetimes and
+    dates (midnight). Naive values are interpreted in default_timezone.
+
+    Raises:
+        ValueError: If the value is not a valid timestamp
+
+    Example:
+        >>> parse_datetime("2025-10-31T12:30:00+02:00")
+        datetime.datetime(2025, 10, 31, 10, 30, tzinfo=datetime.timezone.utc)
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        parsed = datetime.fromisoformat(_check_format(_DATETIME_RE, value, "date/time"))
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        raise ValueError(f"Cannot parse datetime from {type(value).__name__}")
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=default_timezone)
+
+    if parsed.tzinfo is UTC:
+        return parsed
+    if parsed.utcoffset() == _ZERO:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def parse_dates(values: Iterable[Any]) -> List[Optional[date]]:
+    """Parse a column of dates; None stays None"""
+    fromisoformat = date.fromisoformat
+    match = _DATE_RE.fullmatch
+    result = []
+    append = result.append
+    for value in values:
+        if value is None:
+            append(None)
+        elif type(value) is str and match(value):
+            append(fromisoformat(value))
+        else:
+            append(parse_date(value))
+    return result
+
+
+def parse_times(values: Iterable[Any]) -> List[Optional[time]]:
+    """Parse a column of times; None stays None"""
+    return [None if value is None else parse_time(value) for value in values]
+
+
+def parse_datetimes(values: Iterable[Any], default_timezone: tzinfo = UTC) -> List[Optional[datetime]]:
+    """Parse a column of timestamps, normalized to UTC; None stays None"""
+    fromisoformat = datetime.fromisoformat
+    match = _DATETIME_RE.fullmatch
+    result = []
+    append = result.append
+    for value in values:
+        if value is None:
+            append(None)
+            continue
+
+        parsed = fromisoformat(value) if type(value) is str and match(value) else value
+        if type(parsed) is datetime and parsed.tzinfo is UTC:
+            append(parsed)
+        else:
+            append(parse_datetime(parsed, default_timezone))
+    return result
+
+
+@lru_cache(maxsize=1024)
+def parse_date_bounds(min_date: Optional[str], max_date: Optional[str]) -> Tuple[Optional[date], Optional[date]]:
+    """
+    Parse minDate/maxDate settings once per distinct pair of values.
+
+    Raises:
+        ValueError: If a bound is not a valid ISO-8601 date string
+    """
+    for bound in (min_date, max_date):
+        if bound and not isinstance(bound, str):
+            raise ValueError(f"Date bound must be an ISO-8601 string, not {type(bound).__name__}")
+    return (
+        parse_date(min_date) if min_date else None,
+        parse_date(max_date) if max_date else None,
+    )
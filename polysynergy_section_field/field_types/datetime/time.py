@@ -2,6 +2,9 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import RANGE_OPERATORS
+
+from .iso import parse_time, parse_times
 
 
 @field_type(category="datetime", icon="clock.svg")
@@ -34,6 +37,34 @@ class TimeField(FieldType):
             }
         }
 
+    def validate(self, value, settings=None):
+        """Validate an ISO-8601 time of day"""
+        if value is None:
+            return (True, None)
+
+        try:
+            parse_time(value)
+        except ValueError:
+            return (False, "Invalid time (expected HH:mm or HH:mm:ss)")
+
+        return (True, None)
+
+    def serialize(self, value, settings=None):
+        """Convert to a time for TIME"""
+        return None if value is None else parse_time(value)
+
+    def deserialize(self, value, settings=None):
+        """Convert a database value to a time"""
+        return None if value is None else parse_time(value)
+
+    def deserialize_many(self, values, settings=None):
+        """Deserialize a column of times"""
+        return parse_times(values)
+
+    def get_filter_operators(self, settings=None):
+        """Times support comparisons and ranges"""
+        return RANGE_OPERATORS
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
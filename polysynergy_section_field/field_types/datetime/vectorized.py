@@ -0,0 +1,201 @@
+"""
+Vectorized date/time columns as numpy.datetime64 arrays.
+
+Converts whole DateTimeField/DateField columns into datetime64 arrays
+without creating a Python datetime per value, and provides bucketing,
+range filtering and UTC offset shifts on those arrays for analytics.
+
+Requires numpy (install the 'analytics' extra).
+"""
+
+import re
+from datetime import date, datetime
+from typing import Any, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from .iso import parse_datetime
+
+# Bucket name -> datetime64 unit code
+BUCKET_UNITS = {
+    "minute": "m",
+    "hour": "h",
+    "day": "D",
+    "week": "W",
+    "month": "M",
+    "year": "Y",
+}
+
+# Trailing UTC offset in ISO-8601 / PostgreSQL text output: Z, +02, +0200, +02:00
+_OFFSET = re.compile(r"(Z|[+-]\d{2}(?::?\d{2})?)$")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for vectorized datetime columns "
+            "(install polysynergy_section_field with the 'analytics' extra)"
+        )
+
+
+def _offset_minutes(offset: str) -> int:
+    if offset == "Z":
+        return 0
+    sign = -1 if offset[0] == "-" else 1
+    digits = offset[1:].replace(":", "")
+    minutes = int(digits[:2]) * 60 + (int(digits[2:4]) if len(digits) > 2 else 0)
+    return sign * minutes
+
+
+def to_datetime64(values: Iterable[Any], unit: str = "us") -> "np.ndarray":
+    """
+    Convert a column of timestamps to a UTC datetime64 array.
+
+    ISO-8601 strings (including PostgreSQL text output such as
+    '2025-10-31 10:30:00+02') are parsed by numpy in bulk; offsets are
+    applied as one vectorized subtraction. datetime/date objects are
+    accepted too. None becomes NaT. Naive values are taken as UTC.
+
+    Args:
+        values: Column of strings, datetimes, dates or None
+        unit: datetime64 resolution ('us', 'ms', 's', ...)
+
+    Returns:
+        numpy array of dtype datetime64[unit]
+
+    Example:
+        >>> to_datetime64(["2025-10-31T12:30:00+02:00", None])
+        array(['2025-10-31T10:30:00.000000', 'NaT'], dtype='datetime64[us]')
+    """
+    _require_numpy()
+
+    naive: List[Optional[str]] = []
+    offsets: List[int] = []
+    has_offsets = False
+
+    for value in values:
+        if value is None:
+            naive.append(None)
+            offsets.append(0)
+            continue
+
+        if isinstance(value, str):
+            match = _OFFSET.search(value, 10)
+            if match:
+                minutes = _offset_minutes(match.group(1))
+                naive.append(value[:match.start()])
+                offsets.append(minutes)
+                has_offsets = has_offsets or minutes != 0
+            else:
+                naive.append(value)
+                offsets.append(0)
+            continue
+
+        if isinstance(value, (datetime, date)):
+            naive.append(parse_datetime(value).replace(tzinfo=None).isoformat())
+            offsets.append(0)
+            continue
+
+        raise ValueError(f"Cannot convert {type(value).__name__} to datetime64")
+
+    result = np.array(naive, dtype=f"datetime64[{unit}]")
+    if has_offsets:
+        result = result - np.array(offsets, dtype="timedelta64[m]")
+    return result
+
+
+def dates_to_datetime64(values: Iterable[Any]) -> "np.ndarray":
+    """
+    Convert a column of dates to a datetime64[D] array (None becomes NaT).
+
+    Example:
+        >>> dates_to_datetime64(["2025-10-31", None])
+        array(['2025-10-31', 'NaT'], dtype='datetime64[D]')
+    """
+    _require_numpy()
+    return np.array(
+        [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values],
+        dtype="datetime64[D]"
+    )
+
+
+def to_iso_strings(array: "np.ndarray") -> List[Optional[str]]:
+    """Format a UTC datetime64 array as ISO-8601 strings with 'Z' (NaT becomes None)"""
+    _require_numpy()
+    strings = np.datetime_as_string(array, timezone="UTC")
+    mask = np.isnat(array)
+    return [None if missing else text for text, missing in zip(strings.tolist(), mask.tolist())]
+
+
+def shift_offset(array: "np.ndarray", offset_minutes: int) -> "np.ndarray":
+    """
+    Shift UTC timestamps to wall-clock time at a fixed UTC offset.
+
+    Example: offset_minutes=120 turns 10:30 UTC into 12:30 (UTC+2).
+    """
+    _require_numpy()
+    if not offset_minutes:
+        return array
+    return array + np.timedelta64(offset_minutes, "m")
+
+
+def bucket(array: "np.ndarray", unit: str, offset_minutes: int = 0) -> "np.ndarray":
+    """
+    Truncate timestamps to the start of their bucket.
+
+    Weeks start on Monday, as with PostgreSQL date_trunc('week').
+    With offset_minutes, buckets follow wall-clock time at that fixed
+    offset and labels are in that local time.
+
+    Args:
+        array: datetime64 array (UTC)
+        unit: 'minute', 'hour', 'day', 'week', 'month' or 'year'
+        offset_minutes: Fixed UTC offset to bucket in
+
+    Returns:
+        datetime64 array of bucket starts (NaT stays NaT)
+    """
+    _require_numpy()
+    if unit not in BUCKET_UNITS:
+        raise ValueError(f"Unknown bucket unit '{unit}'")
+
+    local = shift_offset(array, offset_minutes)
+
+    if unit != "week":
+        return local.astype(f"datetime64[{BUCKET_UNITS[unit]}]")
+
+    days = local.astype("datetime64[D]")
+    # 1970-01-01 was a Thursday; Monday is weekday 0
+    weekday = (days.astype("int64") + 3) % 7
+    starts = days - weekday.astype("timedelta64[D]")
+    return np.where(np.isnat(days), np.datetime64("NaT", "D"), starts)
+
+
+def range_mask(array: "np.ndarray", start: Any = None, end: Any = None) -> "np.ndarray":
+    """
+    Boolean mask of timestamps within [start, end).
+
+    Bounds may be ISO strings, datetimes or None (open). NaT never matches.
+    """
+    _require_numpy()
+    mask = ~np.isnat(array)
+    if start is not None:
+        mask &= array >= to_datetime64([start], unit=np.datetime_data(array.dtype)[0])[0]
+    if end is not None:
+        mask &= array < to_datetime64([end], unit=np.datetime_data(array.dtype)[0])[0]
+    return mask
+
+
+def bucket_counts(array: "np.ndarray", unit: str, offset_minutes: int = 0) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Count timestamps per bucket.
+
+    Returns:
+        Tuple of (bucket_starts, counts), sorted by bucket; NaT is ignored
+    """
+    _require_numpy()
+    buckets = bucket(array, unit, offset_minutes)
+    return np.unique(buckets[~np.isnat(buckets)], return_counts=True)
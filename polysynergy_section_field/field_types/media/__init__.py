@@ -1,6 +1,21 @@
 """Media field types"""
 
-from .image import ImageField
+from .image import ImageField, ImageUploadValidator
 from .file import FileField
+from .sniff import ImageInfo, sniff_image
+from .storage import ContentStore, LocalContentStore, is_content_key
+from .thumbnails import (
+    ImageBackend,
+    PillowBackend,
+    PlaceholderBackend,
+    ThumbnailPipeline,
+    get_thumbnail_sizes,
+    thumbnail_key
+)
+from .upload import UploadRejected, UploadResult, UploadValidator, validate_upload, avalidate_upload
 
-__all__ = ['ImageField', 'FileField']
+__all__ = ['ImageField', 'ImageUploadValidator', 'FileField', 'ImageInfo', 'sniff_image',
+           'UploadRejected', 'UploadResult', 'UploadValidator', 'validate_upload', 'avalidate_upload',
+           'ContentStore', 'LocalContentStore', 'is_content_key',
+           'ImageBackend', 'PillowBackend', 'PlaceholderBackend', 'ThumbnailPipeline', 'get_thumbnail_sizes',
+           'thumbnail_key']
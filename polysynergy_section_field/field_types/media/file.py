@@ -2,6 +2,10 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import NULL_OPERATORS
+
+from .storage import get_storage_mode, is_content_key
+from .upload import UploadValidator
 
 
 @field_type(category="media", icon="file.svg")
@@ -40,6 +44,13 @@ class FileField(FieldType):
                     "title": "Allowed MIME Types",
                     "description": "Additional MIME type restrictions"
                 },
+                "storageMode": {
+                    "type": "string",
+                    "enum": ["path", "content"],
+                    "default": "path",
+                    "title": "Storage Mode",
+                    "description": "Store a path/URL, or a content key (sha256:...) in a deduplicating content store"
+                },
                 "multipleFiles": {
                     "type": "boolean",
                     "default": False,
@@ -49,6 +60,42 @@ class FileField(FieldType):
             }
         }
 
+    def validate(self, value, settings=None):
+        """Validate stored file paths or content keys (a list if multipleFiles is enabled)"""
+        if value is None:
+            return (True, None)
+
+        multiple = settings.get("multipleFiles", False) if settings else False
+        paths = value if multiple and isinstance(value, list) else [value]
+        content_mode = get_storage_mode(settings) == "content"
+
+        for path in paths:
+            if not isinstance(path, str):
+                return (False, "File must be stored as a path")
+            if content_mode and not is_content_key(path):
+                return (False, "File must be stored as a content key")
+            if len(path) > 500:
+                return (False, "File path too long (maximum 500 characters)")
+
+        return (True, None)
+
+    def create_upload_validator(self, settings=None, filename=None):
+        """
+        Streaming validator for one uploaded file.
+
+        Feed it the upload chunk by chunk; it enforces maxFileSize,
+        allowedExtensions and allowedMimeTypes and hashes the content
+        without buffering. With multipleFiles, use one per file.
+
+        Raises:
+            UploadRejected: If the extension is not allowed
+        """
+        return UploadValidator(settings, filename)
+
+    def get_filter_operators(self, settings=None):
+        """Files can only be filtered on presence"""
+        return NULL_OPERATORS
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
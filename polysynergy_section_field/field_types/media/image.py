@@ -2,6 +2,104 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import NULL_OPERATORS
+
+from .sniff import DEFAULT_MAX_HEADER_BYTES, sniff_image
+from .storage import get_storage_mode, is_content_key
+from .upload import UploadRejected, UploadValidator
+
+DEFAULT_MAX_FILE_SIZE = 5242880
+DEFAULT_ALLOWED_FORMATS = ["jpg", "jpeg", "png", "gif", "webp"]
+
+
+def _upload_size(value):
+    """Size of an upload in bytes, or None for a stream that cannot seek"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    try:
+        if value.seekable():
+            position = value.tell()
+            size = value.seek(0, 2) - position
+            value.seek(position)
+            return size
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def _check_image(info, settings):
+    """Error message if sniffed image info violates the settings, else None"""
+    if info is None:
+        return "File is not a recognized image"
+
+    allowed_formats = settings.get("allowedFormats", DEFAULT_ALLOWED_FORMATS)
+    names = ("jpg", "jpeg") if info.format == "jpeg" else (info.format,)
+    if not any(name in allowed_formats for name in names):
+        return f"Image format '{info.format}' is not allowed"
+
+    max_width = settings.get("maxWidth")
+    if max_width and info.width is not None and info.width > max_width:
+        return f"Image too wide (maximum {max_width}px)"
+
+    max_height = settings.get("maxHeight")
+    if max_height and info.height is not None and info.height > max_height:
+        return f"Image too high (maximum {max_height}px)"
+
+    return None
+
+
+class ImageUploadValidator(UploadValidator):
+    """
+    Validate a streamed image upload chunk by chunk.
+
+    UploadValidator counts bytes against maxFileSize and hashes the
+    content; the image header is collected (up to DEFAULT_MAX_HEADER_BYTES)
+    until sniff_image recognizes it, then checked against allowedFormats,
+    maxWidth and maxHeight. The caller keeps every chunk it feeds, so
+    nothing is lost for storage.
+
+    Example:
+        >>> validator = ImageField().create_upload_validator(settings, "photo.jpg")
+        >>> async for chunk in request.stream():
+        ...     validator.feed(chunk)
+        ...     await storage.write(chunk)
+        >>> validator.finish()
+        UploadResult(size=183112, sha256='4e07a1...', mime_type='image/jpeg', extension='jpg')
+    """
+
+    def __init__(self, settings=None, filename=None):
+        settings = settings or {}
+        super().__init__(
+            {"maxFileSize": settings.get("maxFileSize", DEFAULT_MAX_FILE_SIZE), "allowedExtensions": []},
+            filename
+        )
+        self.image_settings = settings
+        self.info = None
+        self._image_head = bytearray()
+        self._image_checked = False
+
+    def feed(self, chunk):
+        super().feed(chunk)
+        if not self._image_checked:
+            self._image_head += chunk[:DEFAULT_MAX_HEADER_BYTES - len(self._image_head)]
+            info = sniff_image(bytes(self._image_head))
+            if info is not None or len(self._image_head) >= DEFAULT_MAX_HEADER_BYTES:
+                self._finish_image(info)
+
+    def finish(self):
+        if not self._image_checked:
+            self._finish_image(sniff_image(bytes(self._image_head)))
+        return super().finish()
+
+    def _finish_image(self, info):
+        self._image_checked = True
+        self._image_head = bytearray()
+        self.info = info
+        error = _check_image(info, self.image_settings)
+        if error:
+            raise UploadRejected(error)
 
 
 @field_type(category="media", icon="image.svg")
@@ -42,6 +140,13 @@ class ImageField(FieldType):
                     "title": "Max Height (px)",
                     "description": "Maximum image height in pixels"
                 },
+                "storageMode": {
+                    "type": "string",
+                    "enum": ["path", "content"],
+                    "default": "path",
+                    "title": "Storage Mode",
+                    "description": "Store a path/URL, or a content key (sha256:...) in a deduplicating content store"
+                },
                 "generateThumbnails": {
                     "type": "boolean",
                     "default": True,
@@ -67,6 +172,54 @@ class ImageField(FieldType):
             }
         }
 
+    def validate(self, value, settings=None):
+        """
+        Validate a stored image path (or content key), or an upload against the settings.
+
+        Uploads (bytes, memoryview or a seekable binary stream) are checked
+        on maxFileSize, allowedFormats, maxWidth and maxHeight using only the
+        image header; the image is never decoded and streams are rewound.
+        Streams that cannot seek would lose the header bytes read here, so
+        they are rejected; validate those with create_upload_validator().
+        """
+        if value is None or isinstance(value, str):
+            if value is not None and get_storage_mode(settings) == "content" and not is_content_key(value):
+                return (False, "Image must be stored as a content key")
+            if value is not None and len(value) > 500:
+                return (False, "Image path too long (maximum 500 characters)")
+            return (True, None)
+
+        if not isinstance(value, (bytes, bytearray, memoryview)) and not hasattr(value, "read"):
+            return (False, "Image must be a path or an uploaded file")
+
+        settings = settings or {}
+
+        size = _upload_size(value)
+        if size is None:
+            return (False, "Image upload stream must be seekable")
+
+        max_file_size = settings.get("maxFileSize", DEFAULT_MAX_FILE_SIZE)
+        if max_file_size and size > max_file_size:
+            return (False, f"Image too large (maximum {max_file_size} bytes)")
+
+        error = _check_image(sniff_image(value), settings)
+        if error:
+            return (False, error)
+        return (True, None)
+
+    def create_upload_validator(self, settings=None, filename=None):
+        """
+        Streaming validator for one uploaded image.
+
+        Use it for uploads that arrive as chunks or as a stream that
+        cannot seek; it enforces maxFileSize as bytes arrive.
+        """
+        return ImageUploadValidator(settings, filename)
+
+    def get_filter_operators(self, settings=None):
+        """Images can only be filtered on presence"""
+        return NULL_OPERATORS
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
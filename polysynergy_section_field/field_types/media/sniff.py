@@ -0,0 +1,255 @@
+"""
+Header-only image format and dimension sniffing.
+
+Reads just enough of an image to learn its format and size: a few dozen
+bytes for PNG/GIF/WebP, the segment headers up to the frame header for
+JPEG and the opening tag for SVG. Works on bytes, memoryviews and
+binary streams; a stream is read forward only and, when seekable,
+rewound afterwards so the upload can still be stored.
+"""
+
+import re
+import struct
+from typing import Any, NamedTuple, Optional
+
+# JPEG metadata segments (EXIF, ICC profiles) are skipped, not buffered;
+# give up if no frame header appears within this many bytes
+DEFAULT_MAX_HEADER_BYTES = 1024 * 1024
+
+# Bytes of an SVG document searched for the <svg> tag
+SVG_HEADER_BYTES = 4096
+
+MIME_TYPES = {
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+}
+
+# JPEG start-of-frame markers (all except DHT, JPG and DAC)
+_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Markers without a length field
+_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+_SVG_TAG = re.compile(rb"<svg\b[^>]*>", re.IGNORECASE | re.DOTALL)
+_SVG_LENGTH = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$")
+
+
+class ImageInfo(NamedTuple):
+    """Format and dimensions of an image; SVG dimensions may be unknown (None)"""
+
+    format: str
+    width: Optional[int]
+    height: Optional[int]
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.format]
+
+
+class _HeaderReader:
+    """Forward-only reader over bytes, memoryviews or binary streams"""
+
+    def __init__(self, source: Any, limit: int):
+        self.limit = limit
+        self.consumed = 0
+        self._pending = b""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._view: Optional[memoryview] = memoryview(source).cast("B")
+            self._stream = None
+        else:
+            self._view = None
+            self._stream = source
+
+    def read(self, size: int) -> bytes:
+        size = max(0, min(size, self.limit - self.consumed))
+        data = self._pending[:size]
+        self._pending = self._pending[size:]
+        if len(data) < size:
+            wanted = size - len(data)
+            if self._view is not None:
+                position = self.consumed + len(data)
+                data += bytes(self._view[position:position + wanted])
+            else:
+                data += self._stream.read(wanted) or b""
+        self.consumed += len(data)
+        return data
+
+    def unread(self, data: bytes) -> None:
+        """Push bytes back so the next read returns them first"""
+        self._pending = data + self._pending
+        self.consumed -= len(data)
+
+    def skip(self, size: int) -> bool:
+        """Skip forward; False if the limit or end of data is reached first"""
+        if self.consumed + size > self.limit:
+            return False
+        if self._view is not None and not self._pending:
+            if self.consumed + size > len(self._view):
+                return False
+            self.consumed += size
+            return True
+        while size > 0:
+            chunk = self.read(min(size, 65536))
+            if not chunk:
+                return False
+            size -= len(chunk)
+        return True
+
+
+def _sniff_png(head: bytes) -> Optional[ImageInfo]:
+    if len(head) < 24 or head[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", head[16:24])
+    return ImageInfo("png", width, height)
+
+
+def _sniff_gif(head: bytes) -> Optional[ImageInfo]:
+    if len(head) < 10:
+        return None
+    width, height = struct.unpack("<HH", head[6:10])
+    return ImageInfo("gif", width, height)
+
+
+def _sniff_webp(head: bytes) -> Optional[ImageInfo]:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and len(head) >= 30 and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageInfo("webp", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L" and len(head) >= 25 and head[20] == 0x2F:
+        bits = struct.unpack("<I", head[21:25])[0]
+        return ImageInfo("webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X" and len(head) >= 30:
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageInfo("webp", width, height)
+    return None
+
+
+def _sniff_jpeg(reader: _HeaderReader) -> Optional[ImageInfo]:
+    """Walk JPEG segments after SOI until a start-of-frame header"""
+    while True:
+        byte = reader.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            # Garbage between segments; tolerated as most decoders do
+            continue
+
+        marker = reader.read(1)
+        while marker == b"\xff":
+            marker = reader.read(1)
+        if not marker:
+            return None
+
+        code = marker[0]
+        if code in _STANDALONE_MARKERS or code == 0x00:
+            continue
+        if code in (0xD9, 0xDA):
+            # End of image or start of scan before any frame header
+            return None
+
+        length_bytes = reader.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+        if length < 2:
+            return None
+
+        if code in _SOF_MARKERS:
+            frame = reader.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            return ImageInfo("jpeg", width, height)
+
+        if not reader.skip(length - 2):
+            return None
+
+
+def _svg_length(value: Optional[bytes]) -> Optional[float]:
+    if value is None:
+        return None
+    match = _SVG_LENGTH.match(value.decode("utf-8", "replace"))
+    return float(match.group(1)) if match else None
+
+
+def _svg_attribute(tag: bytes, name: bytes) -> Optional[bytes]:
+    match = re.search(rb"\s" + name + rb"\s*=\s*([\"'])(.*?)\1", tag, re.DOTALL)
+    return match.group(2) if match else None
+
+
+def _sniff_svg(head: bytes) -> Optional[ImageInfo]:
+    match = _SVG_TAG.search(head)
+    if match is None:
+        return None
+
+    tag = match.group(0)
+    width = _svg_length(_svg_attribute(tag, b"width"))
+    height = _svg_length(_svg_attribute(tag, b"height"))
+
+    if width is None or height is None:
+        view_box = _svg_attribute(tag, b"viewBox")
+        parts = view_box.replace(b",", b" ").split() if view_box else []
+        if len(parts) == 4:
+            try:
+                width = width if width is not None else float(parts[2])
+                height = height if height is not None else float(parts[3])
+            except ValueError:
+                pass
+
+    return ImageInfo(
+        "svg",
+        round(width) if width is not None else None,
+        round(height) if height is not None else None
+    )
+
+
+def sniff_image(source: Any, max_bytes: int = DEFAULT_MAX_HEADER_BYTES) -> Optional[ImageInfo]:
+    """
+    Detect image format and dimensions from the header only.
+
+    Args:
+        source: bytes, bytearray, memoryview or binary stream (anything with
+                read()); seekable streams are rewound to where they were
+        max_bytes: Upper bound on bytes read (JPEG metadata is skipped)
+
+    Returns:
+        ImageInfo, or None if the data is not a recognized image
+
+    Example:
+        >>> with open("logo.png", "rb") as upload:
+        ...     sniff_image(upload)
+        ImageInfo(format='png', width=512, height=128)
+    """
+    start = None
+    if not isinstance(source, (bytes, bytearray, memoryview)):
+        try:
+            if source.seekable():
+                start = source.tell()
+        except (AttributeError, OSError):
+            start = None
+
+    try:
+        reader = _HeaderReader(source, max_bytes)
+        head = reader.read(32)
+
+        if head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return _sniff_png(head)
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return _sniff_gif(head)
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _sniff_webp(head)
+        if head[:3] == b"\xff\xd8\xff":
+            # The segment walker starts right after the SOI marker
+            reader.unread(head[2:])
+            return _sniff_jpeg(reader)
+        if b"<" in head:
+            head += reader.read(SVG_HEADER_BYTES - len(head))
+            return _sniff_svg(head)
+        return None
+    finally:
+        if start is not None:
+            source.seek(start)
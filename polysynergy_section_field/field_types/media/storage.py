@@ -0,0 +1,214 @@
+"""Content-addressed, deduplicating storage for FileField and ImageField"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Iterable, Optional
+
+# Stored value of a file in 'content' storage mode: "sha256:<64 hex digits>"
+CONTENT_KEY_PREFIX = "sha256:"
+CONTENT_KEY_PATTERN = re.compile(r"^sha256:[0-9a-f]{64}$")
+
+STORAGE_MODES = ("path", "content")
+
+
+def make_content_key(digest: str) -> str:
+    """Content key for a SHA-256 hex digest"""
+    return CONTENT_KEY_PREFIX + digest
+
+
+def is_content_key(value: Any) -> bool:
+    """Whether a value is a valid content key"""
+    return isinstance(value, str) and CONTENT_KEY_PATTERN.match(value) is not None
+
+
+def get_storage_mode(settings: Optional[dict] = None) -> str:
+    """
+    storageMode setting of a media field: 'path' (default) or 'content'.
+
+    Raises:
+        ValueError: If storageMode is not a known mode
+    """
+    mode = settings.get("storageMode", "path") if settings else "path"
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"Unknown storageMode '{mode}'")
+    return mode
+
+
+class ContentStore(ABC):
+    """
+    Storage backend that keys files by the SHA-256 of their content.
+
+    Storing content that is already present only adds a reference, so
+    identical uploads cost no extra bytes. Each reference is released
+    separately; the content is deleted with its last reference.
+    """
+
+    @abstractmethod
+    def put(self, chunks: Iterable[bytes], sha256: Optional[str] = None) -> str:
+        """
+        Store content and add a reference to it.
+
+        Args:
+            chunks: Content, chunk by chunk
+            sha256: Hex digest if already known (e.g. from UploadValidator);
+                    if that content exists, chunks are not read at all
+
+        Returns:
+            Content key ("sha256:...")
+        """
+
+    @abstractmethod
+    def add_reference(self, key: str) -> int:
+        """Add a reference to existing content; returns the new count"""
+
+    @abstractmethod
+    def release(self, key: str) -> int:
+        """Drop a reference, deleting the content at zero; returns the remaining count"""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Whether content is stored under this key"""
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """Open stored content for reading"""
+
+    @abstractmethod
+    def reference_count(self, key: str) -> int:
+        """Number of references to the content (0 if not stored)"""
+
+    def put_bytes(self, data: bytes) -> str:
+        """Store a bytes object; see put()"""
+        return self.put([data], hashlib.sha256(data).hexdigest())
+
+
+class LocalContentStore(ContentStore):
+    """
+    Content-addressed store on the local filesystem.
+
+    Layout (shard_depth=2, shard_width=2):
+        <root>/objects/9f/86/9f86d081...      content
+        <root>/objects/9f/86/9f86d081....refs reference count
+        <root>/tmp/                           uploads in progress
+
+    Sharding keeps directories small with millions of files. New content
+    is streamed to a temporary file while hashing and moved into place
+    atomically; if the content already exists the temporary file is
+    dropped. Reference counts are updated under a lock with atomic
+    replaces, so this store is safe for threads of one process; use a
+    database-backed ContentStore when several processes share a root.
+
+    Example:
+        >>> store = LocalContentStore("/var/lib/media")
+        >>> key = store.put(iter(lambda: upload.read(65536), b""))
+        >>> key == store.put_bytes(same_content)   # no extra bytes written
+        True
+        >>> store.reference_count(key)
+        2
+    """
+
+    def __init__(self, root: str, shard_depth: int = 2, shard_width: int = 2):
+        self.root = root
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+        self._objects = os.path.join(root, "objects")
+        self._tmp = os.path.join(root, "tmp")
+        self._lock = threading.Lock()
+        os.makedirs(self._objects, exist_ok=True)
+        os.makedirs(self._tmp, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """Filesystem path of the content for a key"""
+        if not is_content_key(key):
+            raise ValueError(f"Invalid content key '{key}'")
+        digest = key[len(CONTENT_KEY_PREFIX):]
+        shards = [
+            digest[index * self.shard_width:(index + 1) * self.shard_width]
+            for index in range(self.shard_depth)
+        ]
+        return os.path.join(self._objects, *shards, digest)
+
+    def put(self, chunks: Iterable[bytes], sha256: Optional[str] = None) -> str:
+        if sha256 is not None:
+            key = make_content_key(sha256)
+            with self._lock:
+                if os.path.exists(self.path(key)):
+                    self._write_count(key, self._read_count(key) + 1)
+                    return key
+
+        digest = hashlib.sha256()
+        handle, temp_path = tempfile.mkstemp(dir=self._tmp)
+        try:
+            with os.fdopen(handle, "wb") as temp_file:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+
+            key = make_content_key(digest.hexdigest())
+            if sha256 is not None and key != make_content_key(sha256):
+                raise ValueError("Content does not match the given SHA-256")
+
+            target = self.path(key)
+            with self._lock:
+                if not os.path.exists(target):
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(temp_path, target)
+                    temp_path = None
+                self._write_count(key, self._read_count(key) + 1)
+            return key
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def add_reference(self, key: str) -> int:
+        with self._lock:
+            if not os.path.exists(self.path(key)):
+                raise FileNotFoundError(f"No content stored under '{key}'")
+            count = self._read_count(key) + 1
+            self._write_count(key, count)
+            return count
+
+    def release(self, key: str) -> int:
+        with self._lock:
+            count = max(self._read_count(key) - 1, 0)
+            if count:
+                self._write_count(key, count)
+                return count
+
+            for path in (self.path(key), self._count_path(key)):
+                if os.path.exists(path):
+                    os.unlink(path)
+            return 0
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self.path(key), "rb")
+
+    def reference_count(self, key: str) -> int:
+        with self._lock:
+            return self._read_count(key)
+
+    def _count_path(self, key: str) -> str:
+        return self.path(key) + ".refs"
+
+    def _read_count(self, key: str) -> int:
+        try:
+            with open(self._count_path(key), "r", encoding="utf-8") as count_file:
+                return int(json.load(count_file))
+        except FileNotFoundError:
+            return 0
+
+    def _write_count(self, key: str, count: int) -> None:
+        count_path = self._count_path(key)
+        # Callers hold the lock, so one temporary name per key suffices
+        temp_path = count_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as count_file:
+            json.dump(count, count_file)
+        os.replace(temp_path, count_path)
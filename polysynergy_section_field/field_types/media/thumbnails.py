@@ -0,0 +1,310 @@
+"""
+Thumbnail generation for ImageField thumbnailSizes.
+
+Thumbnails are rendered in a process pool by a pluggable ImageBackend:
+each source image is decoded once and every configured size is derived
+from that single decode. Thumbnails are identified by the source's
+content hash, so sizes that already exist are skipped without decoding.
+
+PillowBackend needs Pillow (install the 'thumbnails' extra);
+PlaceholderBackend renders stand-in bytes without any dependency.
+"""
+
+import asyncio
+import hashlib
+import io
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .sniff import sniff_image
+
+DEFAULT_THUMBNAIL_SIZES = [
+    {"name": "thumb", "width": 150, "height": 150},
+    {"name": "medium", "width": 300, "height": 300},
+]
+
+# Pillow output formats that store an alpha channel; others are written as RGB
+ALPHA_FORMATS = frozenset({"WEBP", "PNG", "GIF", "TIFF"})
+
+
+class ThumbnailSize(NamedTuple):
+    """A configured thumbnail size; images are scaled to fit within width x height"""
+
+    name: str
+    width: int
+    height: int
+
+
+class ThumbnailJob(NamedTuple):
+    """A source image to render thumbnails for"""
+
+    data: bytes
+    sha256: str
+
+
+def get_thumbnail_sizes(settings: Optional[Dict] = None) -> Tuple[ThumbnailSize, ...]:
+    """
+    Thumbnail sizes of an ImageField (empty if generateThumbnails is off).
+
+    Raises:
+        ValueError: If a size lacks a name or has non-positive dimensions
+    """
+    settings = settings or {}
+    if not settings.get("generateThumbnails", True):
+        return ()
+
+    sizes = []
+    for size in settings.get("thumbnailSizes") or DEFAULT_THUMBNAIL_SIZES:
+        name, width, height = size.get("name"), size.get("width"), size.get("height")
+        if not name or not isinstance(width, int) or not isinstance(height, int) or width < 1 or height < 1:
+            raise ValueError(f"Invalid thumbnail size: {size!r}")
+        sizes.append(ThumbnailSize(name, width, height))
+    return tuple(sizes)
+
+
+def thumbnail_key(sha256: str, size: ThumbnailSize) -> str:
+    """Stable identifier of a thumbnail: source content hash plus target box"""
+    return f"{sha256}/{size.name}-{size.width}x{size.height}"
+
+
+def fit_within(width: int, height: int, box_width: int, box_height: int) -> Tuple[int, int]:
+    """Dimensions scaled down (never up) to fit a box, keeping the aspect ratio"""
+    scale = min(box_width / width, box_height / height, 1.0)
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
+
+
+class ImageBackend(ABC):
+    """
+    Decodes, resizes and encodes images for the thumbnail pipeline.
+
+    Backends run inside worker processes, so they must be picklable
+    (plain attributes only, no open handles).
+    """
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode image bytes into the backend's image object"""
+
+    @abstractmethod
+    def size(self, image: Any) -> Tuple[int, int]:
+        """(width, height) of a decoded image"""
+
+    @abstractmethod
+    def resize(self, image: Any, width: int, height: int) -> Any:
+        """Resize a decoded image to exactly width x height"""
+
+    @abstractmethod
+    def encode(self, image: Any) -> bytes:
+        """Encode a resized image to bytes"""
+
+
+def _pillow_image() -> Any:
+    """PIL.Image, imported on first use (Pillow is an optional dependency)"""
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise ImportError(
+            "Pillow is required for PillowBackend "
+            "(install polysynergy_section_field with the 'thumbnails' extra)"
+        ) from e
+    return Image
+
+
+class PillowBackend(ImageBackend):
+    """Pillow-based backend, encoding thumbnails as WebP (or another Pillow format)"""
+
+    def __init__(self, format: str = "WEBP", quality: int = 80):
+        _pillow_image()
+        self.format = format.upper()
+        self.quality = quality
+
+    def decode(self, data: bytes) -> Any:
+        image = _pillow_image().open(io.BytesIO(data))
+        image.load()
+        return image
+
+    def size(self, image: Any) -> Tuple[int, int]:
+        return image.size
+
+    def resize(self, image: Any, width: int, height: int) -> Any:
+        return image.resize((width, height), _pillow_image().Resampling.LANCZOS)
+
+    def encode(self, image: Any) -> bytes:
+        output = io.BytesIO()
+        if self.format in ALPHA_FORMATS:
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+        elif image.mode != "RGB":
+            # JPEG and other formats without alpha cannot save RGBA
+            image = image.convert("RGB")
+        image.save(output, format=self.format, quality=self.quality)
+        return output.getvalue()
+
+
+class PlaceholderBackend(ImageBackend):
+    """
+    Dependency-free stand-in backend for tests and local development.
+
+    "Decoding" reads the dimensions from the header; the encoded
+    thumbnail is a short text describing the result.
+    """
+
+    def decode(self, data: bytes) -> Any:
+        info = sniff_image(data)
+        if info is None or info.width is None or info.height is None:
+            raise ValueError("Cannot read image dimensions")
+        return (info.width, info.height, hashlib.sha256(data).hexdigest()[:16])
+
+    def size(self, image: Any) -> Tuple[int, int]:
+        return (image[0], image[1])
+
+    def resize(self, image: Any, width: int, height: int) -> Any:
+        return (width, height, image[2])
+
+    def encode(self, image: Any) -> bytes:
+        return f"thumbnail:{image[2]}:{image[0]}x{image[1]}".encode("ascii")
+
+
+def render_thumbnails(
+    backend: ImageBackend,
+    data: bytes,
+    sizes: Sequence[ThumbnailSize]
+) -> Dict[str, bytes]:
+    """
+    Render all sizes of one image from a single decode.
+
+    Runs in a worker process; every size is resampled from the one
+    decoded original. Images are never scaled up.
+
+    Returns:
+        Encoded thumbnail bytes by size name
+    """
+    original = backend.decode(data)
+    width, height = backend.size(original)
+
+    results = {}
+    for size in sizes:
+        target = fit_within(width, height, size.width, size.height)
+        resized = original if target == (width, height) else backend.resize(original, *target)
+        results[size.name] = backend.encode(resized)
+    return results
+
+
+class ThumbnailPipeline:
+    """
+    Render thumbnails for many images in a process pool.
+
+    Example:
+        >>> pipeline = ThumbnailPipeline(PillowBackend())
+        >>> sizes = get_thumbnail_sizes(field.settings)
+        >>> results = pipeline.run(
+        ...     jobs,
+        ...     sizes,
+        ...     exists=lambda key: store.exists(key),
+        ...     progress=lambda done, total: print(f"{done}/{total}")
+        ... )
+        >>> results["9f86d0..."]["thumb"]
+        b'RIFF...'
+    """
+
+    def __init__(
+        self,
+        backend: ImageBackend,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            backend: Image backend (picklable; runs in the workers)
+            max_workers: Pool size for the default ProcessPoolExecutor
+            executor: Executor to use instead of a new process pool
+        """
+        self.backend = backend
+        self.max_workers = max_workers
+        self.executor = executor
+
+    @staticmethod
+    def make_job(data: bytes) -> ThumbnailJob:
+        """Job for image bytes, hashing the content"""
+        return ThumbnailJob(data, hashlib.sha256(data).hexdigest())
+
+    def _plan(
+        self,
+        jobs: Iterable[ThumbnailJob],
+        sizes: Sequence[ThumbnailSize],
+        exists: Optional[Callable[[str], bool]]
+    ) -> List[Tuple[ThumbnailJob, Tuple[ThumbnailSize, ...]]]:
+        """Missing sizes per job; identical sources are rendered once"""
+        planned = {}
+        for job in jobs:
+            if job.sha256 in planned:
+                continue
+            missing = tuple(
+                size for size in sizes
+                if exists is None or not exists(thumbnail_key(job.sha256, size))
+            )
+            if missing:
+                planned[job.sha256] = (job, missing)
+        return list(planned.values())
+
+    def run(
+        self,
+        jobs: Iterable[ThumbnailJob],
+        sizes: Sequence[ThumbnailSize],
+        exists: Optional[Callable[[str], bool]] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Dict[str, bytes]]:
+        """
+        Render all missing thumbnails.
+
+        Args:
+            jobs: Source images
+            sizes: Sizes to render (see get_thumbnail_sizes)
+            exists: Returns True for thumbnail keys (thumbnail_key) that are
+                    already stored; those sizes are skipped
+            progress: Called with (done, total) after each image
+
+        Returns:
+            Thumbnail bytes by source sha256, then by size name. A failing
+            image raises after the other images finished.
+        """
+        plan = self._plan(jobs, sizes, exists)
+        total = len(plan)
+        results: Dict[str, Dict[str, bytes]] = {}
+        if not plan:
+            return results
+
+        executor = self.executor or ProcessPoolExecutor(max_workers=self.max_workers)
+        errors = []
+        try:
+            futures = {
+                executor.submit(render_thumbnails, self.backend, job.data, missing): job.sha256
+                for job, missing in plan
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    errors.append(e)
+                if progress is not None:
+                    progress(done, total)
+        finally:
+            if self.executor is None:
+                executor.shutdown()
+
+        if errors:
+            raise errors[0]
+        return results
+
+    async def arun(
+        self,
+        jobs: Iterable[ThumbnailJob],
+        sizes: Sequence[ThumbnailSize],
+        exists: Optional[Callable[[str], bool]] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Dict[str, bytes]]:
+        """run() without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.run, list(jobs), sizes, exists, progress
+        )
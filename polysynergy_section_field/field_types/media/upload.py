@@ -0,0 +1,227 @@
+"""Streaming validation and hashing of file uploads"""
+
+import hashlib
+from typing import Any, AsyncIterable, Dict, Iterable, NamedTuple, Optional
+
+# Bytes of the upload inspected for magic numbers
+MAGIC_BYTES = 512
+
+# (offset, signature, MIME type), checked in order
+MAGIC_SIGNATURES = (
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (0, b"PK\x05\x06", "application/zip"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/x-ole-storage"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (0, b"Rar!\x1a\x07", "application/vnd.rar"),
+    (0, b"{\\rtf", "application/rtf"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"fLaC", "audio/flac"),
+    (4, b"ftyp", "video/mp4"),
+)
+
+# Office formats are containers; the extension tells which document it is
+CONTAINER_EXTENSIONS = {
+    "application/zip": {
+        "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "odt": "application/vnd.oasis.opendocument.text",
+        "ods": "application/vnd.oasis.opendocument.spreadsheet",
+        "zip": "application/zip",
+    },
+    "application/x-ole-storage": {
+        "doc": "application/msword",
+        "xls": "application/vnd.ms-excel",
+        "ppt": "application/vnd.ms-powerpoint",
+    },
+}
+
+# Extensions whose content must carry a known signature
+EXTENSION_MIME_TYPES = {
+    "pdf": "application/pdf",
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "gz": "application/gzip",
+    "7z": "application/x-7z-compressed",
+    "rar": "application/vnd.rar",
+    "rtf": "application/rtf",
+}
+for _container, _extensions in CONTAINER_EXTENSIONS.items():
+    EXTENSION_MIME_TYPES.update(_extensions)
+
+DEFAULT_MAX_FILE_SIZE = 10485760
+DEFAULT_ALLOWED_EXTENSIONS = ["pdf", "doc", "docx", "xls", "xlsx", "txt", "zip"]
+
+
+class UploadRejected(ValueError):
+    """Raised as soon as an upload is known to violate the field settings"""
+
+
+class UploadResult(NamedTuple):
+    """Outcome of a fully consumed, valid upload"""
+
+    size: int
+    sha256: str
+    mime_type: str
+    extension: Optional[str]
+
+
+def get_extension(filename: Optional[str]) -> Optional[str]:
+    """Lowercase extension without the dot, or None"""
+    if not filename or "." not in filename.rsplit("/", 1)[-1]:
+        return None
+    return filename.rsplit(".", 1)[1].lower()
+
+
+def detect_mime_type(head: bytes, extension: Optional[str] = None) -> str:
+    """
+    Detect the MIME type of a file from its first bytes.
+
+    ZIP and OLE containers are narrowed down by extension (docx, xls, ...).
+    Data without a known signature is text/plain if it decodes as UTF-8
+    without NUL bytes, application/octet-stream otherwise.
+
+    Example:
+        >>> detect_mime_type(b"%PDF-1.7...")
+        'application/pdf'
+    """
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+
+    for offset, signature, mime_type in MAGIC_SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            return CONTAINER_EXTENSIONS.get(mime_type, {}).get(extension, mime_type)
+
+    if b"\x00" not in head:
+        try:
+            head.decode("utf-8")
+            return "text/plain"
+        except UnicodeDecodeError as e:
+            # A multi-byte character may be cut off at the end of the head
+            if e.start >= len(head) - 3 and e.reason == "unexpected end of data":
+                return "text/plain"
+
+    return "application/octet-stream"
+
+
+def _mime_allowed(mime_type: str, allowed: Iterable[str]) -> bool:
+    for pattern in allowed:
+        if pattern == mime_type or (pattern.endswith("/*") and mime_type.startswith(pattern[:-1])):
+            return True
+    return False
+
+
+class UploadValidator:
+    """
+    Validate and hash an upload chunk by chunk, without buffering it.
+
+    - The extension is checked against allowedExtensions up front
+    - The MIME type is detected from the first MAGIC_BYTES and checked
+      against allowedMimeTypes and against the extension
+    - maxFileSize is enforced as bytes arrive, so an oversized upload is
+      rejected at the first chunk that crosses the limit
+    - A SHA-256 of the content is computed incrementally
+
+    Raises UploadRejected from the constructor, feed() or finish().
+
+    Example:
+        >>> validator = UploadValidator(settings, filename="report.pdf")
+        >>> async for chunk in request.stream():
+        ...     validator.feed(chunk)
+        ...     await storage.write(chunk)
+        >>> validator.finish()
+        UploadResult(size=48213, sha256='9f86d0...', mime_type='application/pdf', extension='pdf')
+    """
+
+    def __init__(self, settings: Optional[Dict] = None, filename: Optional[str] = None):
+        settings = settings or {}
+        self.max_file_size: Optional[int] = settings.get("maxFileSize", DEFAULT_MAX_FILE_SIZE)
+        self.allowed_mime_types = settings.get("allowedMimeTypes") or None
+        self.extension = get_extension(filename)
+
+        allowed_extensions = settings.get("allowedExtensions", DEFAULT_ALLOWED_EXTENSIONS)
+        if allowed_extensions:
+            allowed = {extension.lower().lstrip(".") for extension in allowed_extensions}
+            if self.extension not in allowed:
+                raise UploadRejected(f"File extension '{self.extension or ''}' is not allowed")
+
+        self.size = 0
+        self.mime_type: Optional[str] = None
+        self._hash = hashlib.sha256()
+        self._head = bytearray()
+
+    def feed(self, chunk: Any) -> None:
+        """
+        Consume the next chunk (bytes, bytearray or memoryview).
+
+        Raises:
+            UploadRejected: If the upload exceeds maxFileSize or its content
+                            type is not allowed
+        """
+        self.size += memoryview(chunk).nbytes
+        if self.max_file_size and self.size > self.max_file_size:
+            raise UploadRejected(f"File too large (maximum {self.max_file_size} bytes)")
+
+        if self.mime_type is None:
+            self._head += chunk[:MAGIC_BYTES - len(self._head)]
+            if len(self._head) >= MAGIC_BYTES:
+                self._check_content()
+
+        self._hash.update(chunk)
+
+    def finish(self) -> UploadResult:
+        """
+        Complete validation after the last chunk.
+
+        Raises:
+            UploadRejected: If the content type is not allowed
+        """
+        if self.mime_type is None:
+            self._check_content()
+        return UploadResult(self.size, self._hash.hexdigest(), self.mime_type, self.extension)
+
+    def _check_content(self) -> None:
+        head = bytes(self._head)
+        self._head = bytearray()
+        self.mime_type = detect_mime_type(head, self.extension)
+
+        if self.allowed_mime_types and not _mime_allowed(self.mime_type, self.allowed_mime_types):
+            raise UploadRejected(f"File type '{self.mime_type}' is not allowed")
+
+        expected = EXTENSION_MIME_TYPES.get(self.extension)
+        if expected is not None and expected != self.mime_type:
+            raise UploadRejected(f"File content does not match extension '{self.extension}'")
+
+
+def validate_upload(
+    chunks: Iterable[Any],
+    settings: Optional[Dict] = None,
+    filename: Optional[str] = None
+) -> UploadResult:
+    """Validate an iterable of chunks (e.g. iter(lambda: f.read(65536), b""))"""
+    validator = UploadValidator(settings, filename)
+    for chunk in chunks:
+        validator.feed(chunk)
+    return validator.finish()
+
+
+async def avalidate_upload(
+    chunks: AsyncIterable[Any],
+    settings: Optional[Dict] = None,
+    filename: Optional[str] = None
+) -> UploadResult:
+    """Validate an async stream of chunks, e.g. an ASGI request body"""
+    validator = UploadValidator(settings, filename)
+    async for chunk in chunks:
+        validator.feed(chunk)
+    return validator.finish()
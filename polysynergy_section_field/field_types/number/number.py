@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional, Tuple
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.aggregates import HISTOGRAM_BUCKETS, NUMERIC_AGGREGATES
+from polysynergy_section_field.section_field_runner.sql.filters import RANGE_OPERATORS
 from polysynergy_section_field.section_field_runner.validation.validators import validate_number_range
 
 
@@ -96,6 +98,18 @@ class NumberField(FieldType):
 
         return sql
 
+    def get_filter_operators(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Numbers support comparisons and ranges"""
+        return RANGE_OPERATORS
+
+    def get_aggregate_functions(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Numbers support sums, averages, extremes and percentiles"""
+        return NUMERIC_AGGREGATES
+
+    def get_group_buckets(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Numbers can be grouped into histogram buckets"""
+        return HISTOGRAM_BUCKETS
+
     def get_table_cell_config(
         self,
         value: Any,
@@ -0,0 +1,239 @@
+"""Bulk existence checks for relation field values"""
+
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from polysynergy_section_field.section_field_runner.sql.helpers import qualified_table_name
+from polysynergy_section_field.section_field_runner.validation.async_validation import AsyncChecker
+
+from .many_to_many import RelationManyToManyField
+from .many_to_one import RelationManyToOneField
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+
+# Fetcher: (related_section, ids) -> ids that exist
+RelationFetcher = Callable[[str, List[str]], Awaitable[Iterable[Any]]]
+
+
+def build_existence_query(table_name: str, schema_name: Optional[str] = "custom") -> str:
+    """
+    Query a fetcher can use to look up a whole chunk of ids at once.
+
+    Bind the list of ids as the only parameter.
+
+    Example:
+        >>> build_existence_query("authors")
+        'SELECT "id" FROM "custom"."authors" WHERE "id" = ANY($1::uuid[])'
+    """
+    return f'SELECT "id" FROM {qualified_table_name(table_name, schema_name)} WHERE "id" = ANY($1::uuid[])'
+
+
+class _BoundedSet:
+    """Set with least-recently-used eviction once max_size is reached"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        if key in self._items:
+            self._items.move_to_end(key)
+            return True
+        return False
+
+    def add(self, key: Tuple[str, str]) -> None:
+        self._items[key] = None
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def discard(self, key: Tuple[str, str]) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class RelationExistenceChecker:
+    """
+    Verifies that referenced entries exist, one query per related section.
+
+    All ids referenced by RelationManyToOneField and RelationManyToManyField
+    values in a chunk of rows are de-duplicated per relatedSection and
+    passed to the fetcher in a single call, which should run one
+    `= ANY($1)` query (see build_existence_query).
+
+    Results are kept in two bounded caches: ids known to exist and ids
+    known to be missing. Call mark_present() after creating entries (or
+    invalidate()) so the negative cache does not hide them.
+
+    Example:
+        >>> async def fetch(related_section, ids):
+        ...     table = await table_for_section(related_section)
+        ...     rows = await connection.fetch(build_existence_query(table), ids)
+        ...     return [row["id"] for row in rows]
+        >>> checker = RelationExistenceChecker(fetch)
+        >>> await checker.check_rows(schema, rows)
+        [{}, {'author': ['0b6d...']}, {}]
+    """
+
+    def __init__(
+        self,
+        fetcher: RelationFetcher,
+        max_present: int = 100000,
+        max_missing: int = 10000
+    ):
+        self.fetcher = fetcher
+        self._present = _BoundedSet(max_present)
+        self._missing = _BoundedSet(max_missing)
+
+    @staticmethod
+    def _normalize(value: Any) -> Optional[str]:
+        """Canonical UUID text as PostgreSQL returns it, or None if not a UUID"""
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return None
+
+    async def find_missing(self, related_section: str, ids: Iterable[Any]) -> Set[str]:
+        """
+        Return the ids that do not exist in the related section.
+
+        Only ids not already cached are sent to the fetcher, in one call.
+        Ids that are not valid UUIDs are reported missing without a lookup,
+        so one malformed value cannot fail the query for the whole chunk.
+        Valid ids are returned in canonical form, malformed ones as given.
+        """
+        unknown: Dict[str, None] = {}
+        missing = set()
+
+        for item in ids:
+            entry_id = self._normalize(item)
+            if entry_id is None:
+                missing.add(str(item))
+                continue
+            key = (related_section, entry_id)
+            if key in self._present:
+                continue
+            if key in self._missing:
+                missing.add(entry_id)
+                continue
+            unknown[entry_id] = None
+
+        if unknown:
+            found = {self._normalize(item) for item in await self.fetcher(related_section, list(unknown))}
+            for entry_id in unknown:
+                key = (related_section, entry_id)
+                if entry_id in found:
+                    self._present.add(key)
+                else:
+                    self._missing.add(key)
+                    missing.add(entry_id)
+
+        return missing
+
+    async def check_rows(
+        self,
+        schema: "SectionSchema",
+        rows: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, List[str]]]:
+        """
+        Check all relation values in a chunk of rows.
+
+        Returns:
+            One dict per row mapping field handle to its missing ids;
+            rows without missing references get an empty dict
+        """
+        rows = list(rows)
+        relation_fields = [
+            field for field in schema.fields
+            if isinstance(field.field_type, (RelationManyToOneField, RelationManyToManyField))
+            and field.settings.get("relatedSection")
+        ]
+
+        # Collect every referenced id per related section
+        ids_by_section: Dict[str, Set[str]] = {}
+        for row in rows:
+            for field in relation_fields:
+                ids = self._get_ids(row.get(field.handle))
+                if ids:
+                    ids_by_section.setdefault(field.settings["relatedSection"], set()).update(ids)
+
+        missing_by_section = {}
+        for related_section, ids in ids_by_section.items():
+            missing_by_section[related_section] = await self.find_missing(related_section, ids)
+
+        results = []
+        for row in rows:
+            row_missing = {}
+            for field in relation_fields:
+                missing = missing_by_section.get(field.settings["relatedSection"], set())
+                field_missing = [entry_id for entry_id in self._get_ids(row.get(field.handle)) if entry_id in missing]
+                if field_missing:
+                    row_missing[field.handle] = field_missing
+            results.append(row_missing)
+        return results
+
+    def mark_present(self, related_section: str, ids: Iterable[Any]) -> None:
+        """Record ids as existing, e.g. right after inserting them"""
+        for item in ids:
+            entry_id = self._normalize(item)
+            if entry_id is not None:
+                key = (related_section, entry_id)
+                self._missing.discard(key)
+                self._present.add(key)
+
+    def invalidate(self, related_section: str, ids: Iterable[Any]) -> None:
+        """Forget cached results for ids, e.g. after deleting entries"""
+        for item in ids:
+            key = (related_section, self._normalize(item))
+            self._present.discard(key)
+            self._missing.discard(key)
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        self._present.clear()
+        self._missing.clear()
+
+    def _get_ids(self, value: Any) -> List[str]:
+        if value is None:
+            return []
+        items = value if isinstance(value, (list, tuple, set)) else [value]
+        # Malformed ids keep their text, matching what find_missing reports
+        return [self._normalize(item) or str(item) for item in items if item is not None]
+
+
+class RelationExistsChecker(AsyncChecker):
+    """
+    AsyncChecker adapter so relation existence runs in AsyncValidationPipeline.
+
+    Register it for both 'relation_many_to_one' and 'relation_many_to_many'.
+    Lookups go through the shared RelationExistenceChecker and its caches.
+    """
+
+    def __init__(self, existence: RelationExistenceChecker):
+        self.existence = existence
+
+    async def check(
+        self,
+        value: Any,
+        settings: Optional[Dict],
+        context: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str]]:
+        related_section = settings.get("relatedSection") if settings else None
+        if not related_section:
+            return (True, None)
+
+        ids = value if isinstance(value, list) else [value]
+        missing = await self.existence.find_missing(related_section, ids)
+        if missing:
+            return (False, f"Related entries do not exist: {', '.join(sorted(missing))}")
+        return (True, None)
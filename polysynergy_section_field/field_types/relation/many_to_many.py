@@ -1,9 +1,10 @@
 """Many-to-Many Relation field type"""
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.helpers import add_param, qualified_table_name
 
 
 @field_type(category="relation", icon="network.svg")
@@ -130,10 +131,7 @@ class RelationManyToManyField(FieldType):
         - sort_order (INTEGER for ordering)
         - created_at (TIMESTAMP)
         """
-        junction_table = settings.get("junctionTableName") if settings else None
-        if not junction_table:
-            # Auto-generate: {section}_{field_name}_relations
-            junction_table = f"{{section}}_{field_name}_relations"
+        junction_table = self.get_junction_table_name(field_name, settings)
 
         # Note: {section} and {related_section} are placeholders
         # that will be replaced by the migration generator
@@ -163,6 +161,72 @@ CREATE UNIQUE INDEX "idx_{junction_table}_unique" ON "{junction_table}"("source_
 
         return sql.strip()
 
+    def get_junction_table_name(
+        self,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        table_name: Optional[str] = None
+    ) -> str:
+        """
+        Name of the junction table backing this field.
+
+        Without table_name the '{section}' placeholder is kept, to be
+        replaced by the migration generator.
+        """
+        junction_table = settings.get("junctionTableName") if settings else None
+        if not junction_table:
+            # Auto-generate: {section}_{field_name}_relations
+            junction_table = f"{{section}}_{field_name}_relations"
+
+        if table_name:
+            junction_table = junction_table.replace("{section}", table_name)
+
+        return junction_table
+
+    def get_filter_operators(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Filters run as EXISTS subqueries on the junction table"""
+        return ("contains_any", "contains_all", "is_empty")
+
+    def compile_filter(
+        self,
+        field_name: str,
+        operator: str,
+        value: Any,
+        params: List[Any],
+        settings: Optional[Dict] = None,
+        table_name: Optional[str] = None,
+        schema_name: Optional[str] = None
+    ) -> str:
+        """
+        Compile a filter to a correlated subquery on the junction table.
+
+        The subqueries use the source/target indexes created with the
+        junction table and bind ids as a single uuid[] parameter.
+        """
+        self._check_filter_operator(operator, settings)
+
+        if not table_name:
+            raise ValueError("Filtering a many-to-many relation requires the section table name")
+
+        junction = qualified_table_name(self.get_junction_table_name(field_name, settings, table_name), schema_name)
+        correlation = f'{junction}."source_id" = {qualified_table_name(table_name, schema_name)}."id"'
+
+        if operator == "is_empty":
+            return f"NOT EXISTS (SELECT 1 FROM {junction} WHERE {correlation})"
+
+        ids = list(dict.fromkeys(value))
+        placeholder = add_param(params, ids)
+        target_match = f'{junction}."target_id" = ANY({placeholder}::uuid[])'
+
+        if operator == "contains_any":
+            return f"EXISTS (SELECT 1 FROM {junction} WHERE {correlation} AND {target_match})"
+
+        # contains_all: every requested id must be linked
+        return (
+            f'(SELECT count(DISTINCT {junction}."target_id") FROM {junction} '
+            f"WHERE {correlation} AND {target_match}) = {len(ids)}"
+        )
+
     def get_table_cell_config(
         self,
         value: Any,
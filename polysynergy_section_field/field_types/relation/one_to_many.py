@@ -1,9 +1,10 @@
 """One-to-Many Relation field type"""
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.pagination import KeysetPagination
 
 
 @field_type(category="relation", icon="list-tree.svg")
@@ -80,6 +81,37 @@ class RelationOneToManyField(FieldType):
         """Virtual fields don't store values, always valid"""
         return (True, None)
 
+    def get_filter_operators(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Virtual fields have no column to filter on"""
+        return ()
+
+    def get_pagination(self, related_schema: Any, settings: Optional[Dict] = None) -> KeysetPagination:
+        """
+        Keyset pagination over the related entries, from limit/sortBy/sortOrder.
+
+        Combine with get_related_filters; index_sql() recommends an index
+        on the back-reference plus the sort, so every page is an index scan.
+
+        Example:
+            >>> pagination = field.get_pagination(posts_schema, settings)
+            >>> sql, params = pagination.build(field.get_related_filters(author_id, settings), cursor)
+        """
+        settings = settings or {}
+        return KeysetPagination(
+            related_schema,
+            settings.get("sortBy", "created_at"),
+            settings.get("sortOrder", "DESC"),
+            settings.get("limit", 10),
+            index_prefix=(settings["relatedField"],) if settings.get("relatedField") else ()
+        )
+
+    def get_related_filters(self, entry_id: Any, settings: Optional[Dict] = None) -> List[Dict]:
+        """Filters selecting the related entries that point back to an entry"""
+        related_field = settings.get("relatedField") if settings else None
+        if not related_field:
+            raise ValueError("relatedField is required to load related entries")
+        return [{"field": related_field, "operator": "eq", "value": entry_id}]
+
     def get_migration_sql(
         self,
         field_name: str,
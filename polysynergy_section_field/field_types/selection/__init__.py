@@ -2,5 +2,12 @@
 
 from .select import SelectField
 from .multi_select import MultiSelectField
+from .option_codes import assign_option_codes, get_option_codec, get_option_codes
 
-__all__ = ['SelectField', 'MultiSelectField']
+__all__ = [
+    'SelectField',
+    'MultiSelectField',
+    'assign_option_codes',
+    'get_option_codec',
+    'get_option_codes',
+]
@@ -1,12 +1,35 @@
 """Multi-select field type - multiple choice"""
 
+import json
+
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import NULL_OPERATORS, compile_comparison
+from polysynergy_section_field.section_field_runner.sql.helpers import add_param, quote_identifier, quote_literal
+from polysynergy_section_field.section_field_runner.sql.projection import compile_array_slice_projection
+
+from .option_codes import (
+    get_option_bitmask_codec,
+    get_option_codes,
+    pack_options,
+    to_signed64,
+    unpack_options,
+    update_option_codes,
+)
+
+STORAGE_MODES = ("jsonb", "bitmask")
+
+
+def _bitmask(settings):
+    mode = settings.get("storageMode", "jsonb") if settings else "jsonb"
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"Unknown storageMode '{mode}'")
+    return mode == "bitmask"
 
 
 @field_type(category="selection", icon="list-checks.svg")
 class MultiSelectField(FieldType):
-    """Multi-select field - multiple choices stored as JSON array"""
+    """Multi-select field - multiple choices stored as JSON array (or a BIGINT bitmask)"""
 
     handle = "multi_select"
     label = "Multi Select"
@@ -49,6 +72,25 @@ class MultiSelectField(FieldType):
                     "title": "Maximum Selections",
                     "description": "Maximum number of allowed selections"
                 },
+                "storageMode": {
+                    "type": "string",
+                    "enum": ["jsonb", "bitmask"],
+                    "default": "jsonb",
+                    "title": "Storage Mode",
+                    "description": "Store selections as a JSONB array, or as a BIGINT bitmask (at most 64 options)"
+                },
+                "optionCodes": {
+                    "type": "object",
+                    "additionalProperties": {"type": "integer", "minimum": 1},
+                    "title": "Option Codes",
+                    "description": "Stable code per option value; in bitmask mode the option's bit is code - 1"
+                },
+                "tableMaxTags": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "title": "Table Max Tags",
+                    "description": "Tags shown (and loaded) in table views; all when empty"
+                },
                 "searchable": {
                     "type": "boolean",
                     "default": True,
@@ -59,6 +101,149 @@ class MultiSelectField(FieldType):
             "required": ["options"]
         }
 
+    def serialize(self, value, settings=None):
+        """Pack the selected values into a mask in bitmask storage mode"""
+        if not _bitmask(settings) or value is None or isinstance(value, int):
+            return value
+        return pack_options(value, settings)
+
+    def deserialize(self, value, settings=None):
+        """Unpack a mask into the selected values, in option order"""
+        if not _bitmask(settings) or not isinstance(value, int):
+            return value
+        return unpack_options(value, settings)
+
+    def serialize_many(self, values, settings=None):
+        """Pack a column of selections"""
+        if not _bitmask(settings):
+            return list(values)
+        return [None if value is None else pack_options(value, settings) for value in values]
+
+    def deserialize_many(self, values, settings=None):
+        """Unpack a column of masks"""
+        if not _bitmask(settings):
+            return list(values)
+        return [None if value is None else unpack_options(value, settings) for value in values]
+
+    def with_option_codes(self, settings, previous_settings=None):
+        """
+        Settings with optionCodes filled in for the current options.
+
+        Call when options are edited so bits survive reordering. In
+        bitmask mode only 64 bits exist, so the bits of removed options are
+        freed and new options take the lowest free bit; run
+        get_options_migration_sql (which clears removed bits) before
+        storing values with the new settings.
+        """
+        reuse_codes = _bitmask(settings)
+        return {**settings, "optionCodes": update_option_codes(settings, previous_settings, reuse_codes)}
+
+    def is_sortable(self, settings=None):
+        """Sets of options (arrays or masks) have no meaningful order"""
+        return False
+
+    def get_filter_operators(self, settings=None):
+        """JSONB containment operators (GIN index), or bitwise tests on the mask"""
+        return ("contains_any", "contains_all", "is_empty") + NULL_OPERATORS
+
+    def compile_filter(self, field_name, operator, value, params, settings=None, table_name=None, schema_name=None):
+        """Compile to JSONB operators (@>, ?|) that the GIN index supports, or to & on the mask"""
+        self._check_filter_operator(operator, settings)
+        column = quote_identifier(field_name)
+
+        if _bitmask(settings) and operator in ("contains_any", "contains_all", "is_empty"):
+            if operator == "is_empty":
+                return f"{column} = 0"
+            mask = add_param(params, pack_options(value, settings))
+            if operator == "contains_all":
+                return f"({column} & {mask}) = {mask}"
+            return f"({column} & {mask}) <> 0"
+
+        if operator == "contains_all":
+            return f"{column} @> {add_param(params, json.dumps(list(value)))}::jsonb"
+
+        if operator == "contains_any":
+            return f"{column} ?| {add_param(params, [str(item) for item in value])}::text[]"
+
+        if operator == "is_empty":
+            return f"{column} = '[]'::jsonb"
+
+        return compile_comparison(column, operator, value, params)
+
+    def get_migration_sql(self, field_name, settings=None, is_required=False):
+        """JSONB array, or BIGINT in bitmask storage mode"""
+        if not _bitmask(settings):
+            return super().get_migration_sql(field_name, settings, is_required)
+
+        # Fail early if the options do not fit in 64 bits
+        get_option_bitmask_codec(settings)
+        sql = f'"{field_name}" BIGINT'
+
+        if is_required:
+            sql += ' NOT NULL'
+
+        return sql
+
+    def get_options_migration_sql(self, table_name, field_name, old_settings, new_settings):
+        """
+        Statements that move stored data from old to new settings.
+
+        In bitmask mode the bits of removed options are cleared; switching
+        storage mode converts the column in place. new_settings should
+        come from with_option_codes so bits stay stable.
+
+        Returns:
+            List of SQL statements, in order
+        """
+        old_bitmask, new_bitmask = _bitmask(old_settings), _bitmask(new_settings)
+        column = quote_identifier(field_name)
+
+        if old_bitmask and new_bitmask:
+            new_codes = get_option_codes(new_settings)
+            removed = 0
+            for value, code in get_option_codes(old_settings).items():
+                if new_codes.get(value) != code:
+                    removed |= 1 << (code - 1)
+            if not removed:
+                return []
+            removed = f"({to_signed64(removed)})::bigint"
+            return [f"UPDATE {table_name} SET {column} = {column} & ~{removed} WHERE ({column} & {removed}) <> 0;"]
+
+        if new_bitmask and not old_bitmask:
+            bits = " | ".join(
+                f"CASE WHEN {column} ? {quote_literal(value)} THEN ({bit})::bigint ELSE 0 END"
+                for value, bit in get_option_bitmask_codec(new_settings)[0].items()
+            ) or "0"
+            return [
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE BIGINT USING "
+                f"CASE WHEN {column} IS NOT NULL THEN {bits} END;"
+            ]
+
+        if old_bitmask and not new_bitmask:
+            elements = ", ".join(
+                f"CASE WHEN ({column} & ({bit})::bigint) <> 0 THEN {quote_literal(value)} END"
+                for bit, value in get_option_bitmask_codec(old_settings)[1]
+            )
+            return [
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE JSONB USING "
+                f"CASE WHEN {column} IS NOT NULL THEN to_jsonb(array_remove(ARRAY[{elements}]::text[], NULL)) END;"
+            ]
+
+        return []
+
+    def get_index_sql(self, table_name, field_name, settings=None):
+        """GIN index for containment filters; bitwise tests scan the compact mask column instead"""
+        if _bitmask(settings):
+            return None
+        return f'CREATE INDEX idx_{table_name}_{field_name} ON {table_name} USING GIN ("{field_name}");'
+
+    def compile_projection(self, field_name, settings=None, cell_config=None):
+        """Load only the tags the table cell shows (a mask is already compact)"""
+        column = quote_identifier(field_name)
+        if _bitmask(settings):
+            return column
+        return compile_array_slice_projection(column, settings.get("tableMaxTags") if settings else None)
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         if not value or not isinstance(value, list):
@@ -79,7 +264,20 @@ class MultiSelectField(FieldType):
         return {
             "component": "TagsCell",
             "props": {
-                "tags": labels
+                "tags": labels,
+                "maxTags": settings.get("tableMaxTags") if settings else None
+            }
+        }
+
+    def get_table_cell_template(self, settings, field_config):
+        """Tags cell with the option labels, so clients can label each row's values"""
+        options = settings.get("options", []) if settings else []
+        return {
+            "component": "TagsCell",
+            "props": {
+                "tags": [],
+                "labels": {option.get("value"): option.get("label", option.get("value")) for option in options},
+                "maxTags": settings.get("tableMaxTags") if settings else None
             }
         }
 
@@ -0,0 +1,169 @@
+"""Stable integer codes for select options"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Options representable in a BIGINT bitmask (one bit per code)
+MAX_BITMASK_OPTIONS = 64
+
+
+def get_option_values(settings: Optional[Dict] = None) -> List[str]:
+    """Option values in display order (options may be dicts or plain strings)"""
+    options = settings.get("options", []) if settings else []
+    return [option.get("value") if isinstance(option, dict) else option for option in options]
+
+
+def assign_option_codes(
+    values: List[str],
+    existing_codes: Optional[Dict[str, int]] = None,
+    reuse_codes: bool = False
+) -> Dict[str, int]:
+    """
+    Assign stable codes (starting at 1) to option values.
+
+    Values that already have a code keep it, so reordering options never
+    changes stored data. New values get codes above the highest code in
+    existing_codes, or with reuse_codes the lowest code not used by one of
+    the values.
+
+    Example:
+        >>> assign_option_codes(["draft", "review", "published"], {"draft": 1, "published": 2})
+        {'draft': 1, 'review': 3, 'published': 2}
+    """
+    existing_codes = existing_codes or {}
+    if reuse_codes:
+        taken = {existing_codes[value] for value in values if value in existing_codes}
+    else:
+        taken = set(existing_codes.values())
+    next_code = 1 if reuse_codes else max(taken, default=0) + 1
+
+    codes = {}
+    for value in values:
+        if value in existing_codes:
+            codes[value] = existing_codes[value]
+            continue
+        while next_code in taken:
+            next_code += 1
+        codes[value] = next_code
+        taken.add(next_code)
+    return codes
+
+
+def get_option_codes(settings: Optional[Dict] = None) -> Dict[str, int]:
+    """
+    Codes of the current options, from the optionCodes setting.
+
+    Codes are never derived from the option order, so every option needs a
+    stored code (SelectField/MultiSelectField.with_option_codes fill them
+    in when options are edited).
+
+    Raises:
+        ValueError: If an option has no code in optionCodes
+    """
+    stored = settings.get("optionCodes") or {} if settings else {}
+    values = get_option_values(settings)
+    missing = [value for value in values if value not in stored]
+    if missing:
+        raise ValueError(
+            f"Options without a code in optionCodes: {', '.join(map(str, missing))} "
+            "(update the settings with with_option_codes)"
+        )
+    return {value: stored[value] for value in values}
+
+
+def update_option_codes(
+    settings: Dict,
+    previous_settings: Optional[Dict] = None,
+    reuse_codes: bool = False
+) -> Dict[str, int]:
+    """
+    optionCodes for edited settings.
+
+    Values keep the code they had in previous_settings (or in the settings
+    themselves). Codes of removed values stay recorded so they are never
+    handed out again, unless reuse_codes is set: then removed codes are
+    dropped and new values take the lowest free code. Only reuse codes
+    once stored data no longer holds them (see get_options_migration_sql).
+    """
+    source = previous_settings if previous_settings is not None else settings
+    existing = dict(source.get("optionCodes") or {}) if source else {}
+    if source:
+        # Options that never had a code get one now, before new values
+        existing = {**existing, **assign_option_codes(get_option_values(source), existing, reuse_codes)}
+
+    values = get_option_values(settings)
+    codes = assign_option_codes(values, existing, reuse_codes)
+    if not reuse_codes:
+        codes.update({value: code for value, code in existing.items() if value not in codes})
+    return codes
+
+
+@lru_cache(maxsize=1024)
+def _codec(items: Tuple[Tuple[str, int], ...]) -> Tuple[Dict[str, int], Dict[int, str]]:
+    value_to_code = dict(items)
+    return (value_to_code, {code: value for value, code in items})
+
+
+def get_option_codec(settings: Optional[Dict] = None) -> Tuple[Dict[str, int], Dict[int, str]]:
+    """
+    Cached (value -> code, code -> value) lookups for the field settings.
+
+    One pair of dicts is shared by every field with the same options, so
+    translating a column costs one dict lookup per value.
+    """
+    return _codec(tuple(get_option_codes(settings).items()))
+
+
+@lru_cache(maxsize=1024)
+def _bitmask_codec(items: Tuple[Tuple[str, int], ...]) -> Tuple[Dict[str, int], Tuple[Tuple[int, str], ...]]:
+    for value, code in items:
+        if not 1 <= code <= MAX_BITMASK_OPTIONS:
+            raise ValueError(
+                f"Option '{value}' has code {code}; bitmask storage supports codes 1 to {MAX_BITMASK_OPTIONS}"
+            )
+    bits = {value: to_signed64(1 << (code - 1)) for value, code in items}
+    return (bits, tuple((bit, value) for value, bit in bits.items()))
+
+
+def get_option_bitmask_codec(
+    settings: Optional[Dict] = None
+) -> Tuple[Dict[str, int], Tuple[Tuple[int, str], ...]]:
+    """
+    Cached (value -> bit, ((bit, value), ...) in option order) for bitmask storage.
+
+    An option's bit is 1 << (code - 1), so bits survive reordering like
+    codes do. Bits are signed 64-bit integers (code 64 is the sign bit) to
+    match PostgreSQL BIGINT.
+
+    Raises:
+        ValueError: If an option code is above 64
+    """
+    return _bitmask_codec(tuple(get_option_codes(settings).items()))
+
+
+def to_signed64(mask: int) -> int:
+    """Reinterpret an unsigned 64-bit mask as a signed BIGINT value"""
+    return mask - (1 << 64) if mask >= 1 << 63 else mask
+
+
+def pack_options(values: Iterable[str], settings: Optional[Dict] = None) -> int:
+    """
+    OR the bits of the selected values into one BIGINT mask.
+
+    Raises:
+        ValueError: If values is not a list (or tuple/set) or a value is not an option
+    """
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        raise ValueError("Selections must be a list of option values")
+    bits = get_option_bitmask_codec(settings)[0]
+    mask = 0
+    for value in values:
+        if value not in bits:
+            raise ValueError(f"Unknown option '{value}'")
+        mask |= bits[value]
+    return mask
+
+
+def unpack_options(mask: int, settings: Optional[Dict] = None) -> List[str]:
+    """Selected values of a mask, in option order (bits of removed options are ignored)"""
+    return [value for bit, value in get_option_bitmask_codec(settings)[1] if mask & bit]
@@ -2,6 +2,19 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.aggregates import VALUE_BUCKETS
+from polysynergy_section_field.section_field_runner.sql.helpers import quote_identifier, quote_literal
+
+from .option_codes import get_option_codec, get_option_codes, get_option_values, update_option_codes
+
+STORAGE_MODES = ("text", "smallint", "enum")
+
+
+def _storage_mode(settings):
+    mode = settings.get("storageMode", "text") if settings else "text"
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"Unknown storageMode '{mode}'")
+    return mode
 
 
 @field_type(category="selection", icon="list-dropdown.svg")
@@ -43,6 +56,19 @@ class SelectField(FieldType):
                     "title": "Allow Empty Selection",
                     "description": "Allow user to clear selection"
                 },
+                "storageMode": {
+                    "type": "string",
+                    "enum": ["text", "smallint", "enum"],
+                    "default": "text",
+                    "title": "Storage Mode",
+                    "description": "Store option values as text, as SMALLINT codes or as a PostgreSQL ENUM"
+                },
+                "optionCodes": {
+                    "type": "object",
+                    "additionalProperties": {"type": "integer", "minimum": 1, "maximum": 32767},
+                    "title": "Option Codes",
+                    "description": "Stable SMALLINT code per option value (maintained by with_option_codes)"
+                },
                 "searchable": {
                     "type": "boolean",
                     "default": False,
@@ -53,6 +79,196 @@ class SelectField(FieldType):
             "required": ["options"]
         }
 
+    def serialize(self, value, settings=None):
+        """
+        Translate option values to their code in smallint storage mode.
+
+        Codes that are already translated pass through if they belong to
+        an option; None stays None.
+        """
+        if value is None or _storage_mode(settings) != "smallint":
+            return value
+        value_to_code, code_to_value = get_option_codec(settings)
+        if isinstance(value, int) and not isinstance(value, bool) and value in code_to_value:
+            return value
+        if isinstance(value, bool) or value not in value_to_code:
+            raise ValueError(f"Unknown option '{value}'")
+        return value_to_code[value]
+
+    def deserialize(self, value, settings=None):
+        """Translate codes back to option values (codes of removed options become None)"""
+        if _storage_mode(settings) != "smallint" or not isinstance(value, int):
+            return value
+        return get_option_codec(settings)[1].get(value)
+
+    def serialize_many(self, values, settings=None):
+        """Translate a column of option values with one codec lookup"""
+        if _storage_mode(settings) != "smallint":
+            return list(values)
+        value_to_code = get_option_codec(settings)[0]
+        try:
+            return [None if value is None else value_to_code[value] for value in values]
+        except KeyError as e:
+            raise ValueError(f"Unknown option '{e.args[0]}'") from None
+
+    def deserialize_many(self, values, settings=None):
+        """Translate a column of codes with one codec lookup"""
+        if _storage_mode(settings) != "smallint":
+            return list(values)
+        code_to_value = get_option_codec(settings)[1]
+        return [None if value is None else code_to_value.get(value) for value in values]
+
+    def with_option_codes(self, settings, previous_settings=None):
+        """
+        Settings with optionCodes filled in for the current options.
+
+        Call when options are edited: existing values keep their code
+        (from previous_settings, or the settings themselves), new values
+        get fresh codes, and codes of removed values stay recorded so they
+        are never handed out again. Smallint storage requires a code for
+        every option.
+        """
+        return {**settings, "optionCodes": update_option_codes(settings, previous_settings)}
+
+    def get_enum_type_name(self, table_name, field_name):
+        """Name of the PostgreSQL ENUM type used in enum storage mode"""
+        return f"{table_name}_{field_name}_enum"
+
+    def get_enum_type_sql(self, table_name, field_name, settings=None):
+        """CREATE TYPE statement for enum storage mode (run before the column is created)"""
+        labels = ", ".join(quote_literal(value) for value in get_option_values(settings))
+        return f"CREATE TYPE {quote_identifier(self.get_enum_type_name(table_name, field_name))} AS ENUM ({labels});"
+
+    def get_migration_sql(self, field_name, settings=None, is_required=False, table_name=None):
+        """
+        Column definition for the storage mode.
+
+        Enum storage needs table_name to reference the ENUM type created
+        by get_enum_type_sql.
+        """
+        mode = _storage_mode(settings)
+        if mode == "smallint":
+            # Fail early if an option has no stored code
+            get_option_codes(settings)
+            column_type = "SMALLINT"
+        elif mode == "enum":
+            if not table_name:
+                raise ValueError("Enum storage requires the table name")
+            column_type = quote_identifier(self.get_enum_type_name(table_name, field_name))
+        else:
+            column_type = self.postgres_type
+
+        sql = f'"{field_name}" {column_type}'
+
+        if is_required:
+            sql += ' NOT NULL'
+
+        return sql
+
+    def get_options_migration_sql(self, table_name, field_name, old_settings, new_settings):
+        """
+        Statements that move stored data from old to new settings.
+
+        Handles added and removed options and switching storage mode.
+        Rows holding a removed option are set to NULL in smallint and enum
+        mode (text mode keeps stale values, as before). new_settings should
+        come from with_option_codes so codes stay stable.
+
+        Returns:
+            List of SQL statements, in order
+        """
+        old_mode, new_mode = _storage_mode(old_settings), _storage_mode(new_settings)
+        column = quote_identifier(field_name)
+        enum_type = quote_identifier(self.get_enum_type_name(table_name, field_name))
+        new_values = get_option_values(new_settings)
+        statements = []
+
+        if old_mode == new_mode == "smallint":
+            new_codes = get_option_codes(new_settings)
+            old_codes = get_option_codes(old_settings)
+            removed = sorted(code for value, code in old_codes.items() if new_codes.get(value) != code)
+            if removed:
+                statements.append(
+                    f"UPDATE {table_name} SET {column} = NULL "
+                    f"WHERE {column} IN ({', '.join(str(code) for code in removed)});"
+                )
+            return statements
+
+        if old_mode == new_mode == "enum":
+            old_values = get_option_values(old_settings)
+            if not set(old_values) - set(new_values):
+                # Adding labels is cheap and needs no rewrite
+                statements.extend(
+                    f"ALTER TYPE {enum_type} ADD VALUE IF NOT EXISTS {quote_literal(value)};"
+                    for value in new_values if value not in old_values
+                )
+                return statements
+            # PostgreSQL cannot drop enum labels; replace the type
+            old_type = quote_identifier(self.get_enum_type_name(table_name, field_name) + "_old")
+            statements.append(f"ALTER TYPE {enum_type} RENAME TO {old_type};")
+            statements.append(self.get_enum_type_sql(table_name, field_name, new_settings))
+            statements.append(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE {enum_type} USING "
+                f"CASE WHEN {column}::text IN ({', '.join(quote_literal(value) for value in new_values)}) "
+                f"THEN {column}::text::{enum_type} END;"
+            )
+            statements.append(f"DROP TYPE {old_type};")
+            return statements
+
+        if old_mode == new_mode:
+            return statements
+
+        # Switching storage mode: express the old column as option text first
+        if old_mode == "smallint":
+            old_codes = get_option_codes(old_settings)
+            cases = " ".join(f"WHEN {code} THEN {quote_literal(value)}" for value, code in old_codes.items())
+            as_text = f"CASE {column} {cases} END"
+        else:
+            as_text = f"{column}::text"
+
+        if new_mode == "smallint":
+            new_codes = get_option_codes(new_settings)
+            cases = " ".join(f"WHEN {quote_literal(value)} THEN {code}" for value, code in new_codes.items())
+            statements.append(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE SMALLINT USING CASE {as_text} {cases} END;"
+            )
+        elif new_mode == "enum":
+            statements.append(self.get_enum_type_sql(table_name, field_name, new_settings))
+            statements.append(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE {enum_type} USING "
+                f"CASE WHEN {as_text} IN ({', '.join(quote_literal(value) for value in new_values)}) "
+                f"THEN ({as_text})::{enum_type} END;"
+            )
+        else:
+            statements.append(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column} TYPE {self.postgres_type} USING {as_text};"
+            )
+
+        if old_mode == "enum":
+            statements.append(f"DROP TYPE {enum_type};")
+
+        return statements
+
+    def get_index_sql(self, table_name, field_name, settings=None):
+        """Coded storage keeps the index small; index it for filters and grouping"""
+        if _storage_mode(settings) == "text":
+            return None
+        return f'CREATE INDEX idx_{table_name}_{field_name} ON {table_name}("{field_name}");'
+
+    def get_group_buckets(self, settings=None):
+        """Selected options group by value"""
+        return VALUE_BUCKETS
+
+    def compile_group_by(self, field_name, bucket, params, settings=None, options=None):
+        """In smallint mode, map codes back to option values so groups read like text mode"""
+        expression = super().compile_group_by(field_name, bucket, params, settings, options)
+        if _storage_mode(settings) != "smallint":
+            return expression
+        cases = " ".join(
+            f"WHEN {code} THEN {quote_literal(value)}" for value, code in get_option_codes(settings).items()
+        )
+        return f"CASE {expression} {cases} END"
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         # Find label for the value
@@ -77,6 +293,24 @@ class SelectField(FieldType):
             }
         }
 
+    def get_table_cell_template(self, settings, field_config):
+        """Text cell with the option labels, so clients can label each row's value"""
+        options = settings.get("options", []) if settings else []
+        labels = {}
+        for option in options:
+            if isinstance(option, dict):
+                labels[option.get("value")] = option.get("label", option.get("value"))
+            elif isinstance(option, str):
+                labels[option] = option
+
+        return {
+            "component": "TextCell",
+            "props": {
+                "value": None,
+                "labels": labels
+            }
+        }
+
     def get_form_input_config(self, settings, field_config):
         """How to render in form"""
         return {
@@ -2,6 +2,33 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import RANGE_OPERATORS
+from polysynergy_section_field.section_field_runner.sql.helpers import quote_identifier
+
+from .color_codec import (
+    format_color,
+    pack_color,
+    pack_colors,
+    parse_color,
+    unpack_color,
+    unpack_colors
+)
+
+
+def _color_settings(settings):
+    """(format, allowAlpha, integer storage) from settings"""
+    if not settings:
+        return ("hex", False, False)
+    return (
+        settings.get("format", "hex"),
+        settings.get("allowAlpha", False),
+        settings.get("storageMode", "text") == "integer",
+    )
+
+
+def _text_width(column_type):
+    """Length of a VARCHAR(n) type"""
+    return int(column_type[column_type.index("(") + 1:-1])
 
 
 @field_type(category="special", icon="palette.svg")
@@ -30,6 +57,13 @@ class ColorField(FieldType):
                     "title": "Allow Transparency",
                     "description": "Allow alpha channel (transparency)"
                 },
+                "storageMode": {
+                    "type": "string",
+                    "enum": ["text", "integer"],
+                    "default": "text",
+                    "title": "Storage Mode",
+                    "description": "Store the color as text, or packed into a 32-bit integer"
+                },
                 "presetColors": {
                     "type": "array",
                     "items": {
@@ -42,6 +76,108 @@ class ColorField(FieldType):
             }
         }
 
+    def validate(self, value, settings=None):
+        """Validate color syntax and alpha usage"""
+        if value is None:
+            return (True, None)
+
+        if not isinstance(value, str):
+            return (False, "Value must be a string")
+
+        try:
+            alpha = parse_color(value)[3]
+        except ValueError:
+            return (False, "Invalid color")
+
+        if alpha != 255 and not _color_settings(settings)[1]:
+            return (False, "Transparency is not allowed")
+
+        return (True, None)
+
+    def serialize(self, value, settings=None):
+        """Pack to an integer in integer storage mode; text is stored as given"""
+        format, allow_alpha, integer = _color_settings(settings)
+        if not integer or isinstance(value, int):
+            return value
+        return pack_color(parse_color(value), allow_alpha)
+
+    def deserialize(self, value, settings=None):
+        """Format packed integers in the configured color format"""
+        format, allow_alpha, integer = _color_settings(settings)
+        if not integer or not isinstance(value, int):
+            return value
+        return format_color(unpack_color(value, allow_alpha), format, allow_alpha)
+
+    def serialize_many(self, values, settings=None):
+        """Pack a column of colors in integer storage mode"""
+        format, allow_alpha, integer = _color_settings(settings)
+        if not integer:
+            return list(values)
+        return pack_colors(values, allow_alpha)
+
+    def deserialize_many(self, values, settings=None):
+        """Format a column of packed colors in integer storage mode"""
+        format, allow_alpha, integer = _color_settings(settings)
+        if not integer:
+            return list(values)
+        return unpack_colors(values, format, allow_alpha)
+
+    def get_postgres_type(self, settings=None):
+        """INTEGER when packed; otherwise text wide enough for the format"""
+        format, allow_alpha, integer = _color_settings(settings)
+        if integer:
+            return "INTEGER"
+        if format != "hex":
+            return "VARCHAR(32)"
+        return "VARCHAR(9)" if allow_alpha else self.postgres_type
+
+    def get_format_migration_sql(self, table_name, field_name, old_settings, new_settings):
+        """
+        Statements that widen a text column for new format/allowAlpha settings.
+
+        Text columns are never narrowed, since stored values keep the
+        format they were written in. For the same reason a text column
+        may hold any mix of hex and rgb()/rgba() values, which SQL cannot
+        pack reliably, so switching storageMode is deliberately not done
+        in place: rewrite the values with serialize_many instead.
+
+        Args:
+            table_name: Table name as used in other migration SQL
+                        (e.g. custom.research_companies)
+            field_name: Column name of the field
+            old_settings: Settings the column was created with
+            new_settings: Settings to migrate to
+
+        Returns:
+            List of SQL statements, in order
+
+        Raises:
+            ValueError: If the storage mode changes
+        """
+        old_type, new_type = self.get_postgres_type(old_settings), self.get_postgres_type(new_settings)
+        if old_type == new_type:
+            return []
+        if "INTEGER" in (old_type, new_type):
+            raise ValueError(
+                "Changing the color storage mode is not supported in place; "
+                "rewrite the stored values with serialize_many"
+            )
+        if _text_width(new_type) < _text_width(old_type):
+            return []
+        return [f"ALTER TABLE {table_name} ALTER COLUMN {quote_identifier(field_name)} TYPE {new_type};"]
+
+    def get_index_sql(self, table_name, field_name, settings=None):
+        """Packed colors are indexed for exact and range lookups"""
+        if not _color_settings(settings)[2]:
+            return None
+        return f'CREATE INDEX idx_{table_name}_{field_name} ON {table_name}("{field_name}");'
+
+    def get_filter_operators(self, settings=None):
+        """Packed colors support ranges; text colors only (in)equality"""
+        if _color_settings(settings)[2]:
+            return RANGE_OPERATORS
+        return super().get_filter_operators(settings)
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
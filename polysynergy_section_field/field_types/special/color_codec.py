@@ -0,0 +1,104 @@
+"""Color parsing, formatting and packing into 32-bit integers"""
+
+import re
+from typing import Iterable, List, Optional, Tuple
+
+# Offset applied to RGBA values so 0xRRGGBBAA fits a signed INTEGER
+# while keeping the numeric order of the unsigned value
+RGBA_OFFSET = 2 ** 31
+
+_HEX = re.compile(r"^#(?:[0-9A-Fa-f]{3,4}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{8})$")
+_RGB = re.compile(
+    r"^rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(?:,\s*(0|1|0?\.\d+|1\.0+)\s*)?\)$",
+    re.IGNORECASE
+)
+
+Rgba = Tuple[int, int, int, int]
+
+
+def parse_color(value: str) -> Rgba:
+    """
+    Parse '#RGB', '#RGBA', '#RRGGBB', '#RRGGBBAA', 'rgb(r, g, b)' or
+    'rgba(r, g, b, a)' (a from 0 to 1) into (r, g, b, a) with 0-255 channels.
+
+    Raises:
+        ValueError: If the value is not a valid color
+
+    Example:
+        >>> parse_color("#ff8800")
+        (255, 136, 0, 255)
+    """
+    if _HEX.match(value):
+        digits = value[1:]
+        if len(digits) <= 4:
+            digits = "".join(digit * 2 for digit in digits)
+        number = int(digits, 16)
+        if len(digits) == 6:
+            return (number >> 16, (number >> 8) & 0xFF, number & 0xFF, 255)
+        return (number >> 24, (number >> 16) & 0xFF, (number >> 8) & 0xFF, number & 0xFF)
+
+    match = _RGB.match(value)
+    if match:
+        red, green, blue = (int(channel) for channel in match.group(1, 2, 3))
+        if max(red, green, blue) > 255:
+            raise ValueError("Color channels must be between 0 and 255")
+        alpha = round(float(match.group(4)) * 255) if match.group(4) is not None else 255
+        return (red, green, blue, alpha)
+
+    raise ValueError(f"Invalid color: {value!r}")
+
+
+def format_color(rgba: Rgba, format: str = "hex", allow_alpha: bool = False) -> str:
+    """
+    Format (r, g, b, a) as '#RRGGBB[AA]', 'rgb(...)' or 'rgba(...)'.
+
+    Alpha is only written when allow_alpha is set (and, for hex, when the
+    color is not fully opaque).
+    """
+    red, green, blue, alpha = rgba
+    if format == "hex":
+        if allow_alpha and alpha != 255:
+            return f"#{red:02X}{green:02X}{blue:02X}{alpha:02X}"
+        return f"#{red:02X}{green:02X}{blue:02X}"
+    if format == "rgba" or (allow_alpha and alpha != 255):
+        return f"rgba({red}, {green}, {blue}, {round(alpha / 255, 3):g})"
+    return f"rgb({red}, {green}, {blue})"
+
+
+def pack_color(rgba: Rgba, allow_alpha: bool = False) -> int:
+    """
+    Pack a color into a signed 32-bit integer.
+
+    Without alpha the value is 0xRRGGBB. With alpha it is 0xRRGGBBAA
+    minus RGBA_OFFSET, so it fits PostgreSQL INTEGER and still sorts like
+    the unsigned value (range scans stay meaningful).
+    """
+    red, green, blue, alpha = rgba
+    if not allow_alpha:
+        return (red << 16) | (green << 8) | blue
+    return ((red << 24) | (green << 16) | (blue << 8) | alpha) - RGBA_OFFSET
+
+
+def unpack_color(packed: int, allow_alpha: bool = False) -> Rgba:
+    """Inverse of pack_color"""
+    if not allow_alpha:
+        return (packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF, 255)
+    number = packed + RGBA_OFFSET
+    return (number >> 24, (number >> 16) & 0xFF, (number >> 8) & 0xFF, number & 0xFF)
+
+
+def pack_colors(values: Iterable[Optional[str]], allow_alpha: bool = False) -> List[Optional[int]]:
+    """Parse and pack a column of colors; None stays None"""
+    return [None if value is None else pack_color(parse_color(value), allow_alpha) for value in values]
+
+
+def unpack_colors(
+    values: Iterable[Optional[int]],
+    format: str = "hex",
+    allow_alpha: bool = False
+) -> List[Optional[str]]:
+    """Unpack and format a column of packed colors; None stays None"""
+    return [
+        None if value is None else format_color(unpack_color(value, allow_alpha), format, allow_alpha)
+        for value in values
+    ]
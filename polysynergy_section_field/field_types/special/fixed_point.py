@@ -0,0 +1,142 @@
+"""Fixed-point (scaled integer) representation for decimal field types"""
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Any, Iterable, List, Optional
+
+# Range of a signed 64-bit integer; minor-unit values must fit an int64
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# Powers of ten for the supported decimalPlaces (0-4)
+_SCALES = [10 ** places for places in range(5)]
+
+
+def _check_range(minor: int) -> int:
+    if minor < INT64_MIN or minor > INT64_MAX:
+        raise OverflowError("Value does not fit in 64-bit minor units")
+    return minor
+
+
+def _decimal_to_minor(value: Decimal, decimal_places: int) -> int:
+    """Round half away from zero (as PostgreSQL NUMERIC does) to minor units"""
+    scaled = value.scaleb(decimal_places).to_integral_value(rounding=ROUND_HALF_UP)
+    return _check_range(int(scaled))
+
+
+def to_minor_units(value: Any, decimal_places: int = 2) -> int:
+    """
+    Convert a major-unit amount to integer minor units.
+
+    Plain decimal strings (as returned by PostgreSQL for NUMERIC) are
+    parsed with integer arithmetic only; other values go through Decimal.
+    Floats are converted via their shortest repr, so 0.1 means 0.1.
+    Rounding is half away from zero, matching PostgreSQL NUMERIC casts.
+
+    Args:
+        value: Decimal, int, float or numeric string in major units
+        decimal_places: Scale of the minor unit (2 for cents)
+
+    Returns:
+        Amount in minor units
+
+    Example:
+        >>> to_minor_units("12.345", 2)
+        1235
+        >>> to_minor_units(Decimal("-0.005"), 2)
+        -1
+    """
+    if isinstance(value, bool):
+        raise ValueError("Cannot convert a boolean to minor units")
+
+    if isinstance(value, int):
+        return _check_range(value * _SCALES[decimal_places])
+
+    if isinstance(value, str):
+        text = value.strip()
+        sign = -1 if text[:1] == "-" else 1
+        if text[:1] in ("+", "-"):
+            text = text[1:]
+        whole, _, fraction = text.partition(".")
+        if (
+            (whole.isdigit() or (not whole and fraction))
+            and (fraction.isdigit() or not fraction)
+            and len(fraction) <= decimal_places
+        ):
+            minor = int(whole or "0") * _SCALES[decimal_places]
+            if fraction:
+                minor += int(fraction.ljust(decimal_places, "0"))
+            return _check_range(sign * minor)
+
+    try:
+        number = value if isinstance(value, Decimal) else Decimal(str(value))
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid decimal value: {value!r}") from e
+
+    if not number.is_finite():
+        raise ValueError("Value must be a finite number")
+
+    return _decimal_to_minor(number, decimal_places)
+
+
+def from_minor_units(minor: int, decimal_places: int = 2) -> Decimal:
+    """
+    Convert integer minor units to an exact Decimal in major units.
+
+    Example:
+        >>> from_minor_units(1235, 2)
+        Decimal('12.35')
+    """
+    return Decimal(minor).scaleb(-decimal_places)
+
+
+def format_minor_units(minor: int, decimal_places: int = 2) -> str:
+    """
+    Format minor units as a plain decimal string, without Decimal.
+
+    Example:
+        >>> format_minor_units(-5, 2)
+        '-0.05'
+    """
+    if decimal_places == 0:
+        return str(minor)
+    sign = "-" if minor < 0 else ""
+    whole, fraction = divmod(abs(minor), _SCALES[decimal_places])
+    return f"{sign}{whole}.{fraction:0{decimal_places}d}"
+
+
+def to_minor_units_many(values: Iterable[Any], decimal_places: int = 2) -> List[Optional[int]]:
+    """Convert a column of amounts to minor units; None stays None"""
+    return [None if value is None else to_minor_units(value, decimal_places) for value in values]
+
+
+def from_minor_units_many(values: Iterable[Optional[int]], decimal_places: int = 2) -> List[Optional[Decimal]]:
+    """Convert a column of minor units to Decimals; None stays None"""
+    return [None if value is None else from_minor_units(value, decimal_places) for value in values]
+
+
+def sum_minor_units(values: Iterable[Optional[int]]) -> int:
+    """
+    Exact total of minor-unit values (None is skipped).
+
+    Integer addition is exact, so totals over large price lists never
+    drift the way float sums do and avoid Decimal arithmetic.
+    """
+    return sum(value for value in values if value is not None)
+
+
+def get_decimal_places(settings: Optional[dict] = None, default: int = 2) -> int:
+    """
+    decimalPlaces setting, validated to the supported 0-4 range.
+
+    Raises:
+        ValueError: If decimalPlaces is outside 0-4
+    """
+    decimal_places = settings.get("decimalPlaces", default) if settings else default
+    if not isinstance(decimal_places, int) or not 0 <= decimal_places <= 4:
+        raise ValueError("decimalPlaces must be an integer between 0 and 4")
+    return decimal_places
+
+
+def is_fixed_point(settings: Optional[dict] = None) -> bool:
+    """Whether the field represents values as integer minor units"""
+    return bool(settings.get("fixedPoint", False)) if settings else False
@@ -1,7 +1,12 @@
 """JSON field type"""
 
+import json
+
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import NULL_OPERATORS, compile_comparison
+from polysynergy_section_field.section_field_runner.sql.helpers import add_param, quote_identifier
+from polysynergy_section_field.section_field_runner.sql.projection import compile_array_slice_projection
 
 
 @field_type(category="special", icon="braces.svg")
@@ -39,17 +44,51 @@ class JsonField(FieldType):
                     "default": True,
                     "title": "Pretty Print",
                     "description": "Format JSON with indentation"
+                },
+                "tablePreviewItems": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 10,
+                    "title": "Table Preview Items",
+                    "description": "Array items shown (and loaded) in table views"
                 }
             }
         }
 
+    def is_sortable(self, settings=None):
+        """JSON documents have no meaningful order"""
+        return False
+
+    def get_filter_operators(self, settings=None):
+        """JSONB containment and top-level key existence"""
+        return ("contains", "has_key") + NULL_OPERATORS
+
+    def compile_filter(self, field_name, operator, value, params, settings=None, table_name=None, schema_name=None):
+        """Compile to native JSONB operators instead of comparing text"""
+        self._check_filter_operator(operator, settings)
+        column = quote_identifier(field_name)
+
+        if operator == "contains":
+            return f"{column} @> {add_param(params, json.dumps(value))}::jsonb"
+
+        if operator == "has_key":
+            return f"{column} ? {add_param(params, str(value))}"
+
+        return compile_comparison(column, operator, value, params)
+
+    def compile_projection(self, field_name, settings=None, cell_config=None):
+        """Load only the array items the compact table cell shows"""
+        props = (cell_config or {}).get("props") or {}
+        return compile_array_slice_projection(quote_identifier(field_name), props.get("maxItems"))
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
             "component": "JsonCell",
             "props": {
                 "value": value,
-                "compact": True
+                "compact": True,
+                "maxItems": settings.get("tablePreviewItems", 10) if settings else 10
             }
         }
 
@@ -2,6 +2,20 @@
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.aggregates import HISTOGRAM_BUCKETS, NUMERIC_AGGREGATES
+from polysynergy_section_field.section_field_runner.sql.filters import RANGE_OPERATORS
+
+from .fixed_point import (
+    from_minor_units,
+    from_minor_units_many,
+    get_decimal_places,
+    is_fixed_point,
+    to_minor_units,
+    to_minor_units_many
+)
+
+# Digits before the decimal point; total precision follows decimalPlaces
+INTEGER_DIGITS = 3
 
 
 @field_type(category="special", icon="percent.svg")
@@ -24,6 +38,12 @@ class PercentageField(FieldType):
                     "default": 2,
                     "title": "Decimal Places"
                 },
+                "fixedPoint": {
+                    "type": "boolean",
+                    "default": False,
+                    "title": "Fixed-Point Values",
+                    "description": "Represent values as integers scaled by decimalPlaces (e.g. hundredths of a percent)"
+                },
                 "minValue": {
                     "type": "number",
                     "minimum": 0,
@@ -53,6 +73,49 @@ class PercentageField(FieldType):
             }
         }
 
+    def get_postgres_type(self, settings=None):
+        """NUMERIC with a scale that follows decimalPlaces (postgres_type is the default)"""
+        decimal_places = get_decimal_places(settings)
+        return f"NUMERIC({INTEGER_DIGITS + decimal_places},{decimal_places})"
+
+    def serialize(self, value, settings=None):
+        """In fixed-point mode, convert integer minor units to an exact Decimal"""
+        if not is_fixed_point(settings):
+            return value
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError("Fixed-point values must be integer minor units")
+        return from_minor_units(value, get_decimal_places(settings))
+
+    def deserialize(self, value, settings=None):
+        """In fixed-point mode, convert the NUMERIC value to integer minor units"""
+        if not is_fixed_point(settings):
+            return value
+        return to_minor_units(value, get_decimal_places(settings))
+
+    def serialize_many(self, values, settings=None):
+        """Serialize a column of percentages"""
+        if not is_fixed_point(settings):
+            return list(values)
+        return from_minor_units_many(values, get_decimal_places(settings))
+
+    def deserialize_many(self, values, settings=None):
+        """Deserialize a column of percentages"""
+        if not is_fixed_point(settings):
+            return list(values)
+        return to_minor_units_many(values, get_decimal_places(settings))
+
+    def get_filter_operators(self, settings=None):
+        """Percentages support comparisons and ranges"""
+        return RANGE_OPERATORS
+
+    def get_aggregate_functions(self, settings=None):
+        """Percentages support sums, averages, extremes and percentiles"""
+        return NUMERIC_AGGREGATES
+
+    def get_group_buckets(self, settings=None):
+        """Percentages can be grouped into histogram buckets"""
+        return HISTOGRAM_BUCKETS
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
@@ -0,0 +1,163 @@
+"""Full-text search support for text field types"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from polysynergy_section_field.section_field_runner.sql.helpers import add_param, qualified_table_name, quote_identifier
+
+# Text search configurations that may be used for generated tsvector columns.
+# The language ends up as a literal in DDL, so only known values are accepted.
+SEARCH_LANGUAGES = [
+    "simple",
+    "english",
+    "dutch",
+    "german",
+    "french",
+    "spanish",
+    "italian",
+    "portuguese",
+]
+
+
+def get_search_settings_properties() -> Dict:
+    """Settings schema properties shared by searchable text field types"""
+    return {
+        "fullTextSearch": {
+            "type": "boolean",
+            "default": False,
+            "title": "Full-Text Search",
+            "description": "Maintain a generated tsvector column with a GIN index for fast search"
+        },
+        "searchLanguage": {
+            "type": "string",
+            "enum": SEARCH_LANGUAGES,
+            "default": "simple",
+            "title": "Search Language",
+            "description": "Text search configuration used for stemming and stop words"
+        }
+    }
+
+
+def is_search_enabled(settings: Optional[Dict] = None) -> bool:
+    """Whether full-text search is enabled for the field"""
+    return bool(settings.get("fullTextSearch", False)) if settings else False
+
+
+def get_search_language(settings: Optional[Dict] = None) -> str:
+    """
+    Text search configuration for the field.
+
+    Raises:
+        ValueError: If the configured language is not in SEARCH_LANGUAGES
+    """
+    language = settings.get("searchLanguage", "simple") if settings else "simple"
+    if language not in SEARCH_LANGUAGES:
+        raise ValueError(f"Unsupported search language '{language}'")
+    return language
+
+
+def get_search_column_name(field_name: str) -> str:
+    """Name of the generated tsvector column for a field"""
+    return f"{field_name}_tsv"
+
+
+def get_search_column_sql(field_name: str, settings: Optional[Dict] = None) -> str:
+    """
+    Column definition for the generated tsvector column.
+
+    Example:
+        >>> get_search_column_sql("body", {"fullTextSearch": True, "searchLanguage": "english"})
+        '"body_tsv" TSVECTOR GENERATED ALWAYS AS (to_tsvector(\\'english\\'::regconfig, coalesce("body", \\'\\'))) STORED'
+    """
+    language = get_search_language(settings)
+    return (
+        f'"{get_search_column_name(field_name)}" TSVECTOR GENERATED ALWAYS AS '
+        f"(to_tsvector('{language}'::regconfig, coalesce(\"{field_name}\", ''))) STORED"
+    )
+
+
+def get_search_index_sql(table_name: str, field_name: str) -> str:
+    """GIN index on the generated tsvector column"""
+    column = get_search_column_name(field_name)
+    return f'CREATE INDEX idx_{table_name}_{column} ON {table_name} USING GIN ("{column}");'
+
+
+def compile_search(
+    field_name: str,
+    query: str,
+    params: List[Any],
+    settings: Optional[Dict] = None
+) -> Tuple[str, str]:
+    """
+    Compile a search on a field's tsvector column.
+
+    The query is parsed with websearch_to_tsquery, so editors can use
+    quotes, OR and -exclusions. The predicate is served by the GIN index.
+
+    Args:
+        field_name: Column name of the text field
+        query: User search input
+        params: Positional parameter list, extended in place
+        settings: Field-specific settings
+
+    Returns:
+        Tuple of (predicate, rank_expression)
+
+    Example:
+        >>> params = []
+        >>> compile_search("body", "postgres index", params, {"searchLanguage": "english"})
+        ('"body_tsv" @@ websearch_to_tsquery(\\'english\\'::regconfig, $1)',
+         'ts_rank_cd("body_tsv", websearch_to_tsquery(\\'english\\'::regconfig, $1))')
+    """
+    language = get_search_language(settings)
+    column = quote_identifier(get_search_column_name(field_name))
+    tsquery = f"websearch_to_tsquery('{language}'::regconfig, {add_param(params, query)})"
+
+    return (f"{column} @@ {tsquery}", f"ts_rank_cd({column}, {tsquery})")
+
+
+def build_search_sql(
+    schema: Any,
+    field_handle: str,
+    query: str,
+    limit: int = 50,
+    params: Optional[List[Any]] = None
+) -> Tuple[str, List[Any]]:
+    """
+    Build a ranked search statement over one field of a section.
+
+    Args:
+        schema: SectionSchema of the section to search
+        field_handle: Handle of a text field with fullTextSearch enabled
+        query: User search input
+        limit: Maximum number of results
+        params: Existing parameter list to continue numbering from
+
+    Returns:
+        Tuple of (sql, params); rows are ("id", "rank") ordered by rank
+
+    Raises:
+        ValueError: If search is not enabled for the field
+    """
+    if params is None:
+        params = []
+
+    field = schema.get_field(field_handle)
+    if not is_search_enabled(field.settings):
+        raise ValueError(f"Full-text search is not enabled for field '{field_handle}'")
+
+    predicate, rank = compile_search(field.handle, query, params, field.settings)
+    if not field.field_type.has_column(field.settings):
+        # Text kept in a side table (TextAreaField separateTable)
+        body_table = field.field_type.get_body_table_name(field.handle, field.settings, schema.table_name)
+        sql = (
+            f'SELECT "entry_id" AS "id", {rank} AS "rank" '
+            f'FROM {qualified_table_name(body_table, schema.schema_name)} '
+            f'WHERE {predicate} ORDER BY "rank" DESC LIMIT {add_param(params, limit)}'
+        )
+        return (sql, params)
+
+    sql = (
+        f'SELECT "id", {rank} AS "rank" FROM {schema.qualified_table_name} '
+        f'WHERE {predicate} ORDER BY "rank" DESC LIMIT {add_param(params, limit)}'
+    )
+    return (sql, params)
@@ -1,14 +1,29 @@
 """Plain text field type"""
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import EQUALITY_OPERATORS
+from polysynergy_section_field.section_field_runner.sql.helpers import quote_identifier
+from polysynergy_section_field.section_field_runner.sql.projection import compile_truncated_projection
 from polysynergy_section_field.section_field_runner.validation.validators import (
     validate_string_length,
     validate_regex_pattern
 )
 
+from .search import (
+    compile_search,
+    get_search_column_sql,
+    get_search_index_sql,
+    get_search_settings_properties,
+    is_search_enabled
+)
+
+
+def _prefix_search(settings: Optional[Dict]) -> bool:
+    return bool(settings.get("prefixSearch", False)) if settings else False
+
 
 @field_type(category="basic", icon="text.svg")
 class TextField(FieldType):
@@ -19,6 +34,9 @@ class TextField(FieldType):
     - maxLength: Maximum number of characters
     - minLength: Minimum number of characters
     - pattern: Regex pattern for validation
+    - prefixSearch: Offer the 'starts_with' filter, backed by a *_pattern_ops index
+    - fullTextSearch: Maintain a generated tsvector column (GIN indexed)
+    - searchLanguage: Text search configuration for the tsvector column
 
     PostgreSQL: VARCHAR(n) or TEXT
     UI Component: text-input
@@ -55,7 +73,14 @@ class TextField(FieldType):
                     "type": "string",
                     "title": "Placeholder",
                     "description": "Placeholder text shown when field is empty"
-                }
+                },
+                "prefixSearch": {
+                    "type": "boolean",
+                    "default": False,
+                    "title": "Prefix Search",
+                    "description": "Allow 'starts with' filters, backed by a pattern index"
+                },
+                **get_search_settings_properties()
             }
         }
 
@@ -104,6 +129,77 @@ class TextField(FieldType):
 
         return sql
 
+    def get_tsvector_column_sql(self, field_name: str, settings: Optional[Dict] = None) -> Optional[str]:
+        """
+        Definition of the generated tsvector column for fullTextSearch, or None.
+
+        Kept apart from get_migration_sql so both work as a single
+        column in CREATE TABLE as well as ALTER TABLE ... ADD COLUMN.
+        """
+        if not is_search_enabled(settings):
+            return None
+        return get_search_column_sql(field_name, settings)
+
+    def get_index_sql(
+        self,
+        table_name: str,
+        field_name: str,
+        settings: Optional[Dict] = None
+    ) -> Optional[str]:
+        """
+        Pattern index for prefixSearch and GIN index on the tsvector column
+        for fullTextSearch (one statement per line when both are enabled).
+
+        LIKE 'prefix%' can only use a btree index built with
+        varchar_pattern_ops/text_pattern_ops (unless the database uses
+        the C collation), so the plain column is never indexed for it.
+        """
+        statements = []
+        if _prefix_search(settings):
+            ops = "varchar_pattern_ops" if settings.get("maxLength") else "text_pattern_ops"
+            statements.append(
+                f'CREATE INDEX idx_{table_name}_{field_name}_prefix ON {table_name}("{field_name}" {ops});'
+            )
+        if is_search_enabled(settings):
+            statements.append(get_search_index_sql(table_name, field_name))
+        return "\n".join(statements) or None
+
+    def get_filter_operators(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Text supports prefix matching with prefixSearch, and full-text search when enabled"""
+        operators = EQUALITY_OPERATORS
+        if _prefix_search(settings):
+            operators += ("starts_with",)
+        if is_search_enabled(settings):
+            operators += ("search",)
+        return operators
+
+    def compile_filter(
+        self,
+        field_name: str,
+        operator: str,
+        value: Any,
+        params: List[Any],
+        settings: Optional[Dict] = None,
+        table_name: Optional[str] = None,
+        schema_name: Optional[str] = None
+    ) -> str:
+        """Compile text filters; 'search' matches the tsvector column"""
+        if operator == "search":
+            self._check_filter_operator(operator, settings)
+            predicate, _ = compile_search(field_name, value, params, settings)
+            return predicate
+        return super().compile_filter(field_name, operator, value, params, settings, table_name, schema_name)
+
+    def compile_projection(
+        self,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        cell_config: Optional[Dict] = None
+    ) -> str:
+        """Select only the prefix the table cell shows"""
+        stored_max_length = settings.get("maxLength") if settings else None
+        return compile_truncated_projection(quote_identifier(field_name), cell_config, stored_max_length)
+
     def get_table_cell_config(
         self,
         value: Any,
@@ -1,11 +1,41 @@
 """Text area field type for multi-line text"""
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import NULL_OPERATORS
+from polysynergy_section_field.section_field_runner.sql.helpers import qualified_table_name, quote_identifier
+from polysynergy_section_field.section_field_runner.sql.projection import compile_truncated_projection
 from polysynergy_section_field.section_field_runner.validation.validators import validate_string_length
 
+from .search import (
+    compile_search,
+    get_search_column_sql,
+    get_search_index_sql,
+    get_search_settings_properties,
+    is_search_enabled
+)
+
+# PostgreSQL TOAST strategies and compression methods for the TEXT column
+COLUMN_STORAGES = ("plain", "main", "external", "extended")
+COLUMN_COMPRESSIONS = ("pglz", "lz4")
+
+
+def _column_options(settings: Optional[Dict]) -> Tuple[Optional[str], Optional[str]]:
+    """(storage, compression) settings, validated because they end up in DDL"""
+    storage = settings.get("columnStorage") if settings else None
+    compression = settings.get("columnCompression") if settings else None
+    if storage is not None and storage not in COLUMN_STORAGES:
+        raise ValueError(f"Unknown columnStorage '{storage}'")
+    if compression is not None and compression not in COLUMN_COMPRESSIONS:
+        raise ValueError(f"Unknown columnCompression '{compression}'")
+    return (storage, compression)
+
+
+def _is_split(settings: Optional[Dict]) -> bool:
+    return bool(settings.get("separateTable", False)) if settings else False
+
 
 @field_type(category="basic", icon="text_area.svg")
 class TextAreaField(FieldType):
@@ -16,8 +46,13 @@ class TextAreaField(FieldType):
     - maxLength: Maximum number of characters
     - minLength: Minimum number of characters
     - rows: Number of rows to display in UI
+    - fullTextSearch: Maintain a generated tsvector column (GIN indexed)
+    - searchLanguage: Text search configuration for the tsvector column
+    - columnStorage: TOAST strategy of the column (plain/main/external/extended)
+    - columnCompression: TOAST compression method (pglz/lz4)
+    - separateTable: Keep the text in a side table, loaded on demand
 
-    PostgreSQL: TEXT
+    PostgreSQL: TEXT (or a "{section}_{field}_bodies" side table)
     UI Component: textarea
     """
 
@@ -56,10 +91,33 @@ class TextAreaField(FieldType):
                     "default": "plain",
                     "title": "Editor Type",
                     "description": "Type of editor to use (plain text, rich text, or markdown)"
-                }
+                },
+                "columnStorage": {
+                    "type": "string",
+                    "enum": list(COLUMN_STORAGES),
+                    "title": "Column Storage",
+                    "description": "TOAST strategy; 'external' skips compression for fast substring reads (STORAGE clause needs PostgreSQL 16+)"
+                },
+                "columnCompression": {
+                    "type": "string",
+                    "enum": list(COLUMN_COMPRESSIONS),
+                    "title": "Column Compression",
+                    "description": "TOAST compression method; lz4 (PostgreSQL 14+) is much faster than pglz"
+                },
+                "separateTable": {
+                    "type": "boolean",
+                    "default": False,
+                    "title": "Separate Table",
+                    "description": "Store the text in a side table so list queries never read it"
+                },
+                **get_search_settings_properties()
             }
         }
 
+    def has_column(self, settings: Optional[Dict] = None) -> bool:
+        """No column in the section table when the text lives in a side table"""
+        return not _is_split(settings)
+
     def validate(self, value: Any, settings: Optional[Dict] = None) -> Tuple[bool, Optional[str]]:
         """Validate textarea value"""
         if value is None:
@@ -78,6 +136,228 @@ class TextAreaField(FieldType):
 
         return (True, None)
 
+    def get_migration_sql(
+        self,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        is_required: bool = False
+    ) -> Optional[str]:
+        """
+        Generate SQL for textarea field.
+
+        None with separateTable: the section table has no column, the
+        text lives in the table from get_side_table_sql.
+        """
+        if _is_split(settings):
+            return None
+        return self._column_sql(field_name, settings, is_required)
+
+    def get_tsvector_column_sql(self, field_name: str, settings: Optional[Dict] = None) -> Optional[str]:
+        """
+        Definition of the generated tsvector column for fullTextSearch, or None.
+
+        Kept apart from get_migration_sql so both work as a single column
+        in ALTER TABLE ... ADD COLUMN. None with separateTable, where the
+        side table from get_side_table_sql already includes it.
+        """
+        if not is_search_enabled(settings) or _is_split(settings):
+            return None
+        return get_search_column_sql(field_name, settings)
+
+    def _column_sql(self, field_name: str, settings: Optional[Dict], is_required: bool) -> str:
+        storage, compression = _column_options(settings)
+        sql = f'"{field_name}" TEXT'
+
+        if storage:
+            sql += f' STORAGE {storage.upper()}'
+
+        if compression:
+            sql += f' COMPRESSION {compression}'
+
+        if is_required:
+            sql += ' NOT NULL'
+
+        return sql
+
+    def get_side_table_sql(
+        self,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        is_required: bool = False,
+        table_name: Optional[str] = None,
+        schema_name: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        CREATE TABLE of the side table used with separateTable, or None.
+
+        Without table_name the '{section}' placeholder is kept, to be
+        replaced by the migration generator (as for junction tables).
+        """
+        if not _is_split(settings):
+            return None
+
+        section_table = table_name or "{section}"
+        body_table = qualified_table_name(self.get_body_table_name(field_name, settings, section_table), schema_name)
+        columns = self._column_sql(field_name, settings, is_required)
+        if is_search_enabled(settings):
+            columns += ',\n    ' + get_search_column_sql(field_name, settings)
+        sql = f'''
+-- Side table for {field_name}, loaded on demand
+CREATE TABLE IF NOT EXISTS {body_table} (
+    "entry_id" UUID PRIMARY KEY,
+    {columns},
+    FOREIGN KEY ("entry_id") REFERENCES {qualified_table_name(section_table, schema_name)}("id") ON DELETE CASCADE
+);
+'''
+        return sql.strip()
+
+    def get_column_options_sql(
+        self,
+        table_name: str,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        schema_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        ALTER statements applying columnStorage/columnCompression to an
+        existing column (and for servers without inline STORAGE).
+
+        Only newly written values are stored with the new options;
+        existing values keep theirs until they are rewritten.
+        """
+        storage, compression = _column_options(settings)
+        if _is_split(settings):
+            table_name = self.get_body_table_name(field_name, settings, table_name)
+        table = qualified_table_name(table_name, schema_name)
+        column = quote_identifier(field_name)
+
+        statements = []
+        if storage:
+            statements.append(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE {storage.upper()};")
+        if compression:
+            statements.append(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {compression};")
+        return statements
+
+    def get_body_table_name(
+        self,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        table_name: Optional[str] = None
+    ) -> str:
+        """
+        Name of the side table used with separateTable.
+
+        Without table_name the '{section}' placeholder is kept, to be
+        replaced by the migration generator.
+        """
+        body_table = f"{{section}}_{field_name}_bodies"
+        if table_name:
+            body_table = body_table.replace("{section}", table_name)
+        return body_table
+
+    def get_body_select_sql(
+        self,
+        table_name: str,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        schema_name: Optional[str] = None
+    ) -> str:
+        """
+        Load the text of entries on demand; $1 is a uuid[] of entry ids.
+
+        Rows are ("entry_id", <field_name>); entries without text have no row.
+        """
+        body_table = qualified_table_name(self.get_body_table_name(field_name, settings, table_name), schema_name)
+        return (
+            f'SELECT "entry_id", {quote_identifier(field_name)} FROM {body_table} '
+            f'WHERE "entry_id" = ANY($1::uuid[])'
+        )
+
+    def get_body_upsert_sql(
+        self,
+        table_name: str,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        schema_name: Optional[str] = None
+    ) -> str:
+        """Store the text of one entry; $1 is the entry id, $2 the text"""
+        body_table = qualified_table_name(self.get_body_table_name(field_name, settings, table_name), schema_name)
+        column = quote_identifier(field_name)
+        return (
+            f'INSERT INTO {body_table} ("entry_id", {column}) VALUES ($1, $2) '
+            f'ON CONFLICT ("entry_id") DO UPDATE SET {column} = EXCLUDED.{column}'
+        )
+
+    def get_index_sql(
+        self,
+        table_name: str,
+        field_name: str,
+        settings: Optional[Dict] = None
+    ) -> Optional[str]:
+        """GIN index on the tsvector column when full-text search is enabled"""
+        if not is_search_enabled(settings):
+            return None
+        if _is_split(settings):
+            table_name = self.get_body_table_name(field_name, settings, table_name)
+        return get_search_index_sql(table_name, field_name)
+
+    def is_sortable(self, settings: Optional[Dict] = None) -> bool:
+        """Long text is neither ordered nor indexed"""
+        return False
+
+    def get_filter_operators(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Long text is only filtered on presence, or searched when enabled"""
+        if is_search_enabled(settings):
+            return NULL_OPERATORS + ("search",)
+        return NULL_OPERATORS
+
+    def compile_filter(
+        self,
+        field_name: str,
+        operator: str,
+        value: Any,
+        params: List[Any],
+        settings: Optional[Dict] = None,
+        table_name: Optional[str] = None,
+        schema_name: Optional[str] = None
+    ) -> str:
+        """
+        Compile textarea filters; 'search' matches the tsvector column.
+
+        With separateTable the filters run as EXISTS subqueries on the
+        side table.
+        """
+        if _is_split(settings):
+            self._check_filter_operator(operator, settings)
+            if not table_name:
+                raise ValueError("Filtering a separately stored text field requires the section table name")
+            body_table = qualified_table_name(self.get_body_table_name(field_name, settings, table_name), schema_name)
+            column = quote_identifier(field_name)
+            correlation = f'{body_table}."entry_id" = {qualified_table_name(table_name, schema_name)}."id"'
+            if operator == "search":
+                # The tsvector column only exists in the side table
+                condition, _ = compile_search(field_name, value, params, settings)
+            else:
+                condition = f"{body_table}.{column} IS NOT NULL"
+            exists = f"EXISTS (SELECT 1 FROM {body_table} WHERE {correlation} AND {condition})"
+            return f"NOT {exists}" if operator == "is_null" else exists
+
+        if operator == "search":
+            self._check_filter_operator(operator, settings)
+            predicate, _ = compile_search(field_name, value, params, settings)
+            return predicate
+        return super().compile_filter(field_name, operator, value, params, settings, table_name, schema_name)
+
+    def compile_projection(
+        self,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        cell_config: Optional[Dict] = None
+    ) -> str:
+        """Select only the prefix the table cell shows"""
+        stored_max_length = settings.get("maxLength") if settings else None
+        return compile_truncated_projection(quote_identifier(field_name), cell_config, stored_max_length)
+
     def get_table_cell_config(
         self,
         value: Any,
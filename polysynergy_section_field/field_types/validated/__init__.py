@@ -4,5 +4,16 @@ from .email import EmailField
 from .url import UrlField
 from .phone import PhoneField
 from .slug import SlugField
+from .phone_numbers import normalize_phone, normalize_phones
+from .slug_checker import SlugUniquenessChecker, build_slug_exists_sql
 
-__all__ = ['EmailField', 'UrlField', 'PhoneField', 'SlugField']
+__all__ = [
+    'EmailField',
+    'UrlField',
+    'PhoneField',
+    'SlugField',
+    'normalize_phone',
+    'normalize_phones',
+    'SlugUniquenessChecker',
+    'build_slug_exists_sql',
+]
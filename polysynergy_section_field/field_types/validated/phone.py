@@ -3,6 +3,15 @@
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
 
+from .phone_numbers import normalize_phone, normalize_phones
+
+
+def _normalizes(settings):
+    """Whether numbers are stored normalized to E.164 (opt-in; on by default for the E.164 format)"""
+    if not settings:
+        return False
+    return settings.get("normalize", settings.get("format") == "E.164")
+
 
 @field_type(category="validated", icon="phone.svg")
 class PhoneField(FieldType):
@@ -30,6 +39,11 @@ class PhoneField(FieldType):
                     "description": "Default country for phone numbers (e.g., 'US', 'NL', 'GB')",
                     "pattern": "^[A-Z]{2}$"
                 },
+                "normalize": {
+                    "type": "boolean",
+                    "title": "Store as E.164",
+                    "description": "Normalize numbers to E.164 (e.g. '+31612345678') when saving; defaults to on for the E.164 format"
+                },
                 "showCountrySelector": {
                     "type": "boolean",
                     "default": True,
@@ -39,6 +53,51 @@ class PhoneField(FieldType):
             }
         }
 
+    def validate(self, value, settings=None):
+        """Validate phone number; with normalize enabled it must resolve to E.164"""
+        if value is None:
+            return (True, None)
+
+        if not isinstance(value, str):
+            return (False, "Value must be a string")
+
+        if len(value) > 50:
+            return (False, "Phone number too long (maximum 50 characters)")
+
+        if _normalizes(settings):
+            try:
+                normalize_phone(value, settings.get("defaultCountry") if settings else None)
+            except ValueError as e:
+                return (False, str(e))
+
+        return (True, None)
+
+    def serialize(self, value, settings=None):
+        """
+        Store the canonical E.164 form, so equal numbers compare equal in SQL.
+
+        Values that cannot be normalized (e.g. rows stored before
+        normalize was enabled) are stored unchanged.
+        """
+        if not _normalizes(settings) or not isinstance(value, str):
+            return value
+        try:
+            return normalize_phone(value, settings.get("defaultCountry"))
+        except ValueError:
+            return value
+
+    def serialize_many(self, values, settings=None):
+        """Normalize a column of numbers (e.g. an import); repeated inputs are parsed once"""
+        if not _normalizes(settings):
+            return list(values)
+        return normalize_phones(values, settings.get("defaultCountry"), strict=False, keep_invalid=True)
+
+    def get_index_sql(self, table_name, field_name, settings=None):
+        """Index canonical numbers for equality lookups"""
+        if not _normalizes(settings):
+            return None
+        return f'CREATE INDEX idx_{table_name}_{field_name} ON {table_name}("{field_name}");'
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
@@ -0,0 +1,219 @@
+"""E.164 phone number normalization with a calling-code trie"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Country calling codes (ITU-T E.164) by ISO 3166-1 alpha-2 region
+COUNTRY_CALLING_CODES = {
+    # North American Numbering Plan
+    "US": "1", "CA": "1", "AG": "1", "AI": "1", "AS": "1", "BB": "1", "BM": "1", "BS": "1",
+    "DM": "1", "DO": "1", "GD": "1", "GU": "1", "JM": "1", "KN": "1", "KY": "1", "LC": "1",
+    "MP": "1", "MS": "1", "PR": "1", "SX": "1", "TC": "1", "TT": "1", "VC": "1", "VG": "1",
+    "VI": "1",
+    # Europe
+    "RU": "7", "KZ": "7", "GR": "30", "NL": "31", "BE": "32", "FR": "33", "ES": "34",
+    "GI": "350", "PT": "351", "LU": "352", "IE": "353", "IS": "354", "AL": "355", "MT": "356",
+    "CY": "357", "FI": "358", "AX": "358", "BG": "359", "HU": "36", "LT": "370", "LV": "371",
+    "EE": "372", "MD": "373", "AM": "374", "BY": "375", "AD": "376", "MC": "377", "SM": "378",
+    "VA": "379", "UA": "380", "RS": "381", "ME": "382", "XK": "383", "HR": "385", "SI": "386",
+    "BA": "387", "MK": "389", "IT": "39", "RO": "40", "CH": "41", "CZ": "420", "SK": "421",
+    "LI": "423", "AT": "43", "GB": "44", "GG": "44", "IM": "44", "JE": "44", "DK": "45",
+    "SE": "46", "NO": "47", "SJ": "47", "PL": "48", "DE": "49", "FO": "298", "GL": "299",
+    "GE": "995", "AZ": "994", "TR": "90",
+    # Africa
+    "EG": "20", "SS": "211", "MA": "212", "EH": "212", "DZ": "213", "TN": "216", "LY": "218",
+    "GM": "220", "SN": "221", "MR": "222", "ML": "223", "GN": "224", "CI": "225", "BF": "226",
+    "NE": "227", "TG": "228", "BJ": "229", "MU": "230", "LR": "231", "SL": "232", "GH": "233",
+    "NG": "234", "TD": "235", "CF": "236", "CM": "237", "CV": "238", "ST": "239", "GQ": "240",
+    "GA": "241", "CG": "242", "CD": "243", "AO": "244", "GW": "245", "IO": "246", "SC": "248",
+    "SD": "249", "RW": "250", "ET": "251", "SO": "252", "DJ": "253", "KE": "254", "TZ": "255",
+    "UG": "256", "BI": "257", "MZ": "258", "ZM": "260", "MG": "261", "RE": "262", "YT": "262",
+    "ZW": "263", "NA": "264", "MW": "265", "LS": "266", "BW": "267", "SZ": "268", "KM": "269",
+    "ZA": "27", "SH": "290", "ER": "291", "AW": "297",
+    # Americas
+    "FK": "500", "BZ": "501", "GT": "502", "SV": "503", "HN": "504", "NI": "505", "CR": "506",
+    "PA": "507", "PM": "508", "HT": "509", "PE": "51", "MX": "52", "CU": "53", "AR": "54",
+    "BR": "55", "CL": "56", "CO": "57", "VE": "58", "GP": "590", "BL": "590", "MF": "590",
+    "BO": "591", "GY": "592", "EC": "593", "GF": "594", "PY": "595", "MQ": "596", "SR": "597",
+    "UY": "598", "CW": "599", "BQ": "599",
+    # Asia and Oceania
+    "MY": "60", "AU": "61", "CX": "61", "CC": "61", "ID": "62", "PH": "63", "NZ": "64",
+    "SG": "65", "TH": "66", "TL": "670", "NF": "672", "BN": "673", "NR": "674", "PG": "675",
+    "TO": "676", "SB": "677", "VU": "678", "FJ": "679", "PW": "680", "WF": "681", "CK": "682",
+    "NU": "683", "WS": "685", "KI": "686", "NC": "687", "TV": "688", "PF": "689", "TK": "690",
+    "FM": "691", "MH": "692", "JP": "81", "KR": "82", "VN": "84", "KP": "850", "HK": "852",
+    "MO": "853", "KH": "855", "LA": "856", "CN": "86", "BD": "880", "TW": "886", "IN": "91",
+    "PK": "92", "AF": "93", "LK": "94", "MM": "95", "MV": "960", "LB": "961", "JO": "962",
+    "SY": "963", "IQ": "964", "KW": "965", "SA": "966", "YE": "967", "OM": "968", "PS": "970",
+    "AE": "971", "IL": "972", "BH": "973", "QA": "974", "BT": "975", "MN": "976", "NP": "977",
+    "IR": "98", "TJ": "992", "TM": "993", "KG": "996", "UZ": "998",
+}
+
+# National (trunk) prefixes dialled before domestic numbers; "0" unless listed.
+# Regions with an empty prefix keep their leading zero in E.164 (e.g. Italy).
+TRUNK_PREFIXES = {region: "1" for region, code in COUNTRY_CALLING_CODES.items() if code == "1"}
+TRUNK_PREFIXES.update({
+    "RU": "8", "KZ": "8", "BY": "8", "LT": "8", "HU": "06", "MX": "01", "MN": "01",
+    "IT": "", "VA": "", "SM": "", "GR": "", "ES": "", "PT": "", "DK": "", "NO": "", "SJ": "",
+    "IS": "", "EE": "", "LV": "", "LU": "", "MC": "", "AD": "", "MT": "", "CY": "", "CZ": "",
+    "PL": "", "SG": "", "HK": "", "MO": "", "QA": "", "BH": "", "KW": "", "OM": "", "CR": "",
+    "GT": "", "SV": "", "HN": "", "NI": "", "PA": "", "UY": "", "BZ": "", "FO": "", "GL": "",
+    "SC": "", "MU": "", "CV": "", "ST": "", "GW": "", "SN": "", "ML": "", "CI": "", "BF": "",
+    "NE": "", "TG": "", "BJ": "", "GQ": "", "GA": "", "CG": "", "CM": "", "TD": "", "CF": "",
+    "NA": "", "FJ": "", "TO": "", "WS": "", "PW": "", "FM": "", "MH": "", "KI": "", "TV": "",
+    "NR": "", "SB": "", "VU": "", "NC": "", "PF": "", "WF": "", "CK": "", "NU": "", "TK": "",
+    "TL": "", "BN": "", "MV": "", "BT": "",
+})
+
+# E.164 numbers have at most 15 digits after the '+'
+MAX_DIGITS = 15
+MIN_NATIONAL_DIGITS = 4
+
+# Separators users type inside phone numbers
+_SEPARATORS = re.compile(r"[\s\-.()/]")
+
+_UNSET = object()
+
+
+def _build_trie() -> Dict:
+    """Digit trie of calling codes; a node's "regions" marks a complete code"""
+    root: Dict = {}
+    for region, code in COUNTRY_CALLING_CODES.items():
+        node = root
+        for digit in code:
+            node = node.setdefault(digit, {})
+        node.setdefault("regions", []).append(region)
+    return root
+
+
+_CALLING_CODE_TRIE = _build_trie()
+
+
+def resolve_calling_code(digits: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    """
+    Find the calling code at the start of an international number.
+
+    Calling codes are prefix-free, so the walk stops at the first complete
+    code; it costs at most three steps regardless of the number of regions.
+
+    Returns:
+        Tuple of (calling_code, regions), or None if no code matches
+
+    Example:
+        >>> resolve_calling_code("31612345678")
+        ('31', ('NL',))
+    """
+    node = _CALLING_CODE_TRIE
+    for index, digit in enumerate(digits[:3]):
+        node = node.get(digit)
+        if node is None:
+            return None
+        if "regions" in node:
+            return (digits[:index + 1], tuple(node["regions"]))
+    return None
+
+
+@lru_cache(maxsize=256)
+def get_country_prefix(region: str) -> Tuple[str, str]:
+    """
+    Calling code and trunk prefix of a region.
+
+    Raises:
+        ValueError: If the region is unknown
+    """
+    code = COUNTRY_CALLING_CODES.get(region.upper())
+    if code is None:
+        raise ValueError(f"Unknown country '{region}'")
+    return (code, TRUNK_PREFIXES.get(region.upper(), "0"))
+
+
+def normalize_phone(value: str, default_country: Optional[str] = None) -> str:
+    """
+    Normalize a phone number to E.164 ('+<calling code><number>').
+
+    International numbers may start with '+' or '00' (or '011' for NANP
+    default countries). National numbers need default_country; its trunk
+    prefix (e.g. the leading 0 in '06 12345678') is removed.
+
+    Raises:
+        ValueError: If the value cannot be a valid E.164 number
+
+    Example:
+        >>> normalize_phone("06-1234 5678", "NL")
+        '+31612345678'
+        >>> normalize_phone("+1 (415) 555-2671")
+        '+14155552671'
+    """
+    text = _SEPARATORS.sub("", value.strip())
+
+    if text.startswith("+"):
+        digits = text[1:]
+    elif text.startswith("00"):
+        digits = text[2:]
+    elif text.startswith("011") and default_country and get_country_prefix(default_country)[0] == "1":
+        digits = text[3:]
+    else:
+        digits = None
+
+    if digits is not None:
+        if not digits.isdigit():
+            raise ValueError("Phone number may only contain digits")
+        resolved = resolve_calling_code(digits)
+        if resolved is None:
+            raise ValueError("Unknown country calling code")
+        national = digits[len(resolved[0]):]
+    else:
+        if not text.isdigit():
+            raise ValueError("Phone number may only contain digits")
+        if not default_country:
+            raise ValueError("National phone number requires a default country")
+        code, trunk = get_country_prefix(default_country)
+        national = text[len(trunk):] if trunk and text.startswith(trunk) else text
+        digits = code + national
+
+    if len(national) < MIN_NATIONAL_DIGITS or len(digits) > MAX_DIGITS:
+        raise ValueError("Phone number has an invalid length")
+
+    return "+" + digits
+
+
+def normalize_phones(
+    values: Iterable[Optional[str]],
+    default_country: Optional[str] = None,
+    strict: bool = True,
+    keep_invalid: bool = False
+) -> List[Optional[str]]:
+    """
+    Normalize a column of phone numbers, e.g. for imports.
+
+    Repeated inputs are normalized once. None stays None.
+
+    Args:
+        values: Phone numbers as typed
+        default_country: Region for national numbers
+        strict: Raise on invalid numbers; if False they become None
+        keep_invalid: With strict False, keep invalid numbers unchanged instead
+
+    Raises:
+        ValueError: On the first invalid number when strict
+    """
+    seen: Dict[str, Optional[str]] = {}
+    result = []
+    append = result.append
+    for value in values:
+        if value is None:
+            append(None)
+            continue
+
+        normalized = seen.get(value, _UNSET)
+        if normalized is _UNSET:
+            try:
+                normalized = normalize_phone(value, default_country)
+            except ValueError:
+                if strict:
+                    raise
+                normalized = value if keep_invalid else None
+            seen[value] = normalized
+        append(normalized)
+    return result
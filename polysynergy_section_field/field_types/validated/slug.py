@@ -1,7 +1,14 @@
 """Slug field type - URL-friendly identifier"""
 
+import re
+
 from polysynergy_section_field.section_field_runner.base_field_type import FieldType
 from polysynergy_section_field.section_field_runner.field_type_decorator import field_type
+from polysynergy_section_field.section_field_runner.sql.filters import EQUALITY_OPERATORS
+
+from .slug_generator import SlugGenerator
+
+SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 
 
 @field_type(category="validated", icon="hash.svg")
@@ -43,6 +50,39 @@ class SlugField(FieldType):
             }
         }
 
+    def validate(self, value, settings=None):
+        """Validate slug format"""
+        if value is None:
+            return (True, None)
+
+        if not isinstance(value, str):
+            return (False, "Value must be a string")
+
+        if len(value) > 255:
+            return (False, "Slug too long (maximum 255 characters)")
+
+        if not SLUG_PATTERN.match(value):
+            return (False, "Only lowercase letters, numbers, and hyphens allowed")
+
+        return (True, None)
+
+    def generate_slug(self, source, settings=None):
+        """
+        Base slug for a source value (e.g. a title), including the prefix.
+
+        Does not check uniqueness; use SlugGenerator to allocate unique
+        slugs for a batch of entries.
+        """
+        return SlugGenerator(settings).base_slug(source)
+
+    def get_filter_operators(self, settings=None):
+        """Slugs support prefix matching, backed by the pattern index"""
+        return EQUALITY_OPERATORS + ("starts_with",)
+
+    def get_index_sql(self, table_name, field_name, settings=None):
+        """Index with varchar_pattern_ops so both equality and prefix LIKE use it"""
+        return f'CREATE INDEX idx_{table_name}_{field_name} ON {table_name}("{field_name}" varchar_pattern_ops);'
+
     def get_table_cell_config(self, value, settings, field_config):
         """How to display in table view"""
         return {
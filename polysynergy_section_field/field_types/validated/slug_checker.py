@@ -0,0 +1,69 @@
+"""Async uniqueness check for slug fields"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from polysynergy_section_field.section_field_runner.sql.helpers import qualified_table_name, quote_identifier
+from polysynergy_section_field.section_field_runner.validation.async_validation import AsyncChecker
+
+
+class SlugUniquenessChecker(AsyncChecker):
+    """
+    Rejects slugs that are already used in the section table.
+
+    The lookup is pluggable: `exists(context, slug)` is awaited and must
+    return True when the slug is taken by another entry. The context holds
+    table_name, schema_name, field_name and entry_id (the entry being
+    saved, None for new entries), which the lookup must exclude so an
+    entry can be saved with its own slug; see build_slug_exists_sql.
+
+    Two entries of one batch with the same slug cannot both pass: the
+    later one fails before its lookup runs.
+
+    Example:
+        >>> async def slug_exists(context, slug):
+        ...     sql = build_slug_exists_sql(context)
+        ...     return await connection.fetchval(sql, slug, context["entry_id"]) is not None
+        >>> pipeline.register("slug", SlugUniquenessChecker(slug_exists))
+    """
+
+    def __init__(self, exists: Callable[[Dict[str, Any], str], Awaitable[bool]]):
+        self.exists = exists
+
+    async def check(
+        self,
+        value: Any,
+        settings: Optional[Dict],
+        context: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str]]:
+        if await self.exists(context, value):
+            return (False, f"Slug '{value}' is already in use")
+        return (True, None)
+
+    def cache_key(self, value: Any, settings: Optional[Dict], context: Dict[str, Any]):
+        # Uniqueness depends on where the slug is stored and which entry is excluded, not on settings
+        return (
+            context.get("schema_name"),
+            context.get("table_name"),
+            context.get("field_name"),
+            value,
+            context.get("entry_id")
+        )
+
+    def batch_unique_key(self, value: Any, settings: Optional[Dict], context: Dict[str, Any]):
+        return (context.get("schema_name"), context.get("table_name"), context.get("field_name"), value)
+
+    def batch_duplicate_error(self, value: Any) -> str:
+        return f"Slug '{value}' is used by another entry in this batch"
+
+
+def build_slug_exists_sql(context: Dict[str, Any]) -> str:
+    """
+    Lookup for SlugUniquenessChecker: $1 is the slug, $2 the entry id to exclude (may be NULL).
+
+    Example:
+        >>> build_slug_exists_sql({"schema_name": "custom", "table_name": "posts", "field_name": "slug"})
+        'SELECT 1 FROM "custom"."posts" WHERE "slug" = $1 AND "id" IS DISTINCT FROM $2 LIMIT 1'
+    """
+    table = qualified_table_name(context["table_name"], context.get("schema_name"))
+    column = quote_identifier(context["field_name"])
+    return f'SELECT 1 FROM {table} WHERE {column} = $1 AND "id" IS DISTINCT FROM $2 LIMIT 1'
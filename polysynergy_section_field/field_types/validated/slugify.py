@@ -0,0 +1,102 @@
+"""Fast Unicode to ASCII slugification"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional
+
+# Characters that do not decompose to ASCII under NFKD
+_SPECIAL_TRANSLITERATIONS = {
+    "ß": "ss",
+    "æ": "ae",
+    "Æ": "AE",
+    "œ": "oe",
+    "Œ": "OE",
+    "ø": "o",
+    "Ø": "O",
+    "đ": "d",
+    "Đ": "D",
+    "ð": "d",
+    "Ð": "D",
+    "ł": "l",
+    "Ł": "L",
+    "þ": "th",
+    "Þ": "Th",
+    "ı": "i",
+    "&": " and ",
+}
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=8192)
+def _transliterate_char(char: str) -> str:
+    """ASCII replacement for a single character (empty if there is none)"""
+    special = _SPECIAL_TRANSLITERATIONS.get(char)
+    if special is not None:
+        return special
+    decomposed = unicodedata.normalize("NFKD", char)
+    return decomposed.encode("ascii", "ignore").decode("ascii")
+
+
+@lru_cache(maxsize=1)
+def get_transliteration_table() -> Dict[int, str]:
+    """
+    str.translate table for Latin-1 and Latin Extended-A (U+0080 - U+017F).
+
+    Built once; covers nearly all characters in Western and Central
+    European titles, so most text is transliterated in a single
+    str.translate call.
+    """
+    table = {ord(char): replacement for char, replacement in _SPECIAL_TRANSLITERATIONS.items()}
+    for codepoint in range(0x80, 0x180):
+        table.setdefault(codepoint, _transliterate_char(chr(codepoint)))
+    return table
+
+
+def transliterate(text: str) -> str:
+    """
+    Convert text to ASCII, dropping characters without an ASCII equivalent.
+
+    Example:
+        >>> transliterate("Crème brûlée für Straße")
+        'Creme brulee fur Strasse'
+    """
+    if text.isascii():
+        return text.replace("&", " and ")
+
+    text = text.translate(get_transliteration_table())
+    if text.isascii():
+        return text
+
+    return "".join(char if char.isascii() else _transliterate_char(char) for char in text)
+
+
+def slugify(text: Optional[str], max_length: Optional[int] = None) -> str:
+    """
+    Create a URL-friendly slug (lowercase ASCII letters, digits and hyphens).
+
+    Args:
+        text: Source text, e.g. an entry title
+        max_length: Maximum slug length; cut at a hyphen where possible
+
+    Returns:
+        Slug, or an empty string if nothing slug-worthy remains
+
+    Example:
+        >>> slugify("Ça va? Déjà-vu & more!")
+        'ca-va-deja-vu-and-more'
+    """
+    if not text:
+        return ""
+
+    slug = _NON_ALPHANUMERIC.sub("-", transliterate(text).lower()).strip("-")
+
+    if max_length is not None and len(slug) > max_length:
+        slug = slug[:max_length]
+        cut = slug.rfind("-")
+        if cut > max_length // 2:
+            slug = slug[:cut]
+        slug = slug.strip("-")
+
+    return slug
@@ -1,6 +1,26 @@
 """Section Field Runner - Base classes for field types"""
 
 from .base_field_type import FieldType
-from .field_type_decorator import field_type
+from .field_type_decorator import field_type, get_registered_field_types, get_field_type_class
+from .section_schema import SectionField, SectionSchema
+from .fingerprint_cache import FingerprintCache
+from .records import LazyRecord, Record, get_record_class
+from .manifest import FieldTypeManifest, get_field_type_manifest
+from .ui_bundle import SectionUIBundle, get_section_ui_bundle
 
-__all__ = ["FieldType", "field_type"]
+__all__ = [
+    "FieldType",
+    "field_type",
+    "get_registered_field_types",
+    "get_field_type_class",
+    "SectionField",
+    "SectionSchema",
+    "FingerprintCache",
+    "Record",
+    "get_record_class",
+    "LazyRecord",
+    "FieldTypeManifest",
+    "get_field_type_manifest",
+    "SectionUIBundle",
+    "get_section_ui_bundle"
+]
@@ -1,7 +1,13 @@
 """Base class for all field types"""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .sql.aggregates import COUNT_AGGREGATES, compile_aggregate_function, compile_bucket
+from .sql.filters import EQUALITY_OPERATORS, compile_comparison
+from .sql.helpers import quote_identifier
+from .validation.async_validation import AsyncChecker
 
 
 class FieldType(ABC):
@@ -116,32 +122,75 @@ class FieldType(ABC):
         """
         return (True, None)
 
-    def serialize(self, value: Any) -> Any:
+    async def avalidate(
+        self,
+        value: Any,
+        settings: Optional[Dict] = None,
+        checkers: Optional[Sequence[AsyncChecker]] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Validate a value, including I/O-bound checks.
+
+        Runs validate() first. Only valid, non-null values are passed on to
+        the async checkers, which run concurrently. Use
+        AsyncValidationPipeline to validate whole entries with a
+        concurrency limit and de-duplicated checks.
+
+        Args:
+            value: The value to validate
+            settings: Field-specific settings from settings_schema
+            checkers: Async checkers to run (e.g. uniqueness or existence lookups)
+            context: Where the value lives (table_name, schema_name, field_name)
+
+        Returns:
+            Tuple of (is_valid, error_message), like validate()
+
+        Example:
+            >>> field = SlugField()
+            >>> await field.avalidate("hello", {}, [SlugUniquenessChecker(slug_exists)], context)
+            (False, "Slug 'hello' is already in use")
+        """
+        is_valid, error = self.validate(value, settings)
+        if not is_valid or not checkers or value is None:
+            return (is_valid, error)
+
+        results = await asyncio.gather(*(
+            checker.check(value, settings, context or {}) for checker in checkers
+        ))
+        for is_valid, error in results:
+            if not is_valid:
+                return (is_valid, error)
+
+        return (True, None)
+
+    def serialize(self, value: Any, settings: Optional[Dict] = None) -> Any:
         """
         Convert Python value to database-storable format.
         Called before INSERT/UPDATE operations.
 
         Args:
             value: Python value to serialize
+            settings: Field-specific settings (e.g. storage mode, scale)
 
         Returns:
             Database-storable value
 
         Example:
-            >>> from datetime import datetime
             >>> field = DateTimeField()
-            >>> field.serialize(datetime.now())
-            '2025-10-31T10:30:00Z'
+            >>> field.serialize("2025-10-31T11:30:00+01:00")
+            datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc)
         """
         return value
 
-    def deserialize(self, value: Any) -> Any:
+    def deserialize(self, value: Any, settings: Optional[Dict] = None) -> Any:
         """
         Convert database value to Python format.
         Called after SELECT operations.
 
         Args:
             value: Database value to deserialize
+            settings: Field-specific settings (e.g. storage mode, scale)
 
         Returns:
             Python value
@@ -153,6 +202,40 @@ class FieldType(ABC):
         """
         return value
 
+    def serialize_many(self, values: Sequence[Any], settings: Optional[Dict] = None) -> List[Any]:
+        """
+        Serialize a whole column of values (e.g. for bulk inserts).
+
+        None values stay None. Override when a type can convert a batch
+        faster than value by value.
+
+        Args:
+            values: Python values to serialize
+            settings: Field-specific settings
+
+        Returns:
+            List of database-storable values, in the same order
+        """
+        serialize = self.serialize
+        return [None if value is None else serialize(value, settings) for value in values]
+
+    def deserialize_many(self, values: Sequence[Any], settings: Optional[Dict] = None) -> List[Any]:
+        """
+        Deserialize a whole column of database values (e.g. for exports).
+
+        None values stay None. Override when a type can convert a batch
+        faster than value by value.
+
+        Args:
+            values: Database values to deserialize
+            settings: Field-specific settings
+
+        Returns:
+            List of Python values, in the same order
+        """
+        deserialize = self.deserialize
+        return [None if value is None else deserialize(value, settings) for value in values]
+
     def get_migration_sql(
         self,
         field_name: str,
@@ -175,7 +258,7 @@ class FieldType(ABC):
             >>> field.get_migration_sql("company_name", {"maxLength": 200}, True)
             '"company_name" VARCHAR(200) NOT NULL'
         """
-        sql = f'"{field_name}" {self.postgres_type}'
+        sql = f'"{field_name}" {self.get_postgres_type(settings)}'
 
         if is_required:
             sql += ' NOT NULL'
@@ -208,6 +291,230 @@ class FieldType(ABC):
         """
         return None
 
+    def has_column(self, settings: Optional[Dict] = None) -> bool:
+        """
+        Whether this field stores its value in a column of the section table.
+
+        Virtual fields (postgres_type 'VIRTUAL') and junction-backed fields
+        (postgres_type 'JUNCTION_TABLE') have no column and are skipped by
+        the CRUD statement builder.
+
+        Args:
+            settings: Field-specific settings
+
+        Returns:
+            True if the field has a column in the section table
+        """
+        return self.postgres_type not in ("VIRTUAL", "JUNCTION_TABLE")
+
+    def get_postgres_type(self, settings: Optional[Dict] = None) -> str:
+        """
+        PostgreSQL column type for these settings.
+
+        postgres_type is the type with default settings; override when a
+        setting changes the column type (precision, storage mode).
+
+        Args:
+            settings: Field-specific settings
+
+        Returns:
+            Column type used by get_migration_sql
+        """
+        return self.postgres_type
+
+    def is_sortable(self, settings: Optional[Dict] = None) -> bool:
+        """
+        Whether entries can be ordered (and keyset-paginated) by this field.
+
+        Override to return False for columns without a meaningful order or
+        that are too large to index, such as JSONB and long text.
+
+        Args:
+            settings: Field-specific settings
+
+        Returns:
+            True if the column can be used in ORDER BY and a btree index
+        """
+        return self.has_column(settings)
+
+    def get_filter_operators(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """
+        Filter operators this field type can compile to SQL.
+
+        Override to add operators that match the column type and the indexes
+        created by get_index_sql. Return an empty tuple for fields that
+        cannot be filtered.
+
+        Args:
+            settings: Field-specific settings
+
+        Returns:
+            Tuple of operator names (e.g. 'eq', 'in', 'between', 'contains_any')
+        """
+        return EQUALITY_OPERATORS
+
+    def compile_filter(
+        self,
+        field_name: str,
+        operator: str,
+        value: Any,
+        params: List[Any],
+        settings: Optional[Dict] = None,
+        table_name: Optional[str] = None,
+        schema_name: Optional[str] = None
+    ) -> str:
+        """
+        Compile a filter on this field to a parameterized SQL predicate.
+
+        Values are serialized and bound as positional parameters; the
+        column is compared in its native type, never cast to text, so
+        indexes on the column can be used.
+
+        Args:
+            field_name: Column name for the field
+            operator: Operator from get_filter_operators()
+            value: Filter value (list for 'in'/'not_in', pair for 'between')
+            params: Positional parameter list, extended in place
+            settings: Field-specific settings
+            table_name: Name of the section table (needed by junction-backed fields)
+            schema_name: PostgreSQL schema of the section table
+
+        Returns:
+            SQL predicate
+
+        Raises:
+            ValueError: If the operator is not supported by this field type
+
+        Example:
+            >>> params = []
+            >>> field = RelationManyToOneField()
+            >>> field.compile_filter("author", "in", ["6f1c...", "9a2e..."], params)
+            '"author" = ANY($1)'
+        """
+        self._check_filter_operator(operator, settings)
+
+        if operator in ("in", "not_in", "between"):
+            value = [self.serialize(item, settings) for item in value]
+        elif value is not None:
+            value = self.serialize(value, settings)
+
+        return compile_comparison(quote_identifier(field_name), operator, value, params)
+
+    def _check_filter_operator(self, operator: str, settings: Optional[Dict] = None) -> None:
+        """Raise ValueError if the operator is not supported for these settings"""
+        if operator not in self.get_filter_operators(settings):
+            raise ValueError(f"Filter operator '{operator}' is not supported by field type '{self.handle}'")
+
+    def get_aggregate_functions(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """
+        Aggregate functions this field type supports in aggregate queries.
+
+        Override for numeric types (sum, avg, percentile) or ordered types
+        (min, max). Fields without a column cannot be aggregated.
+
+        Args:
+            settings: Field-specific settings
+
+        Returns:
+            Tuple of function names (e.g. 'count', 'sum', 'percentile')
+        """
+        return COUNT_AGGREGATES if self.has_column(settings) else ()
+
+    def compile_aggregate(
+        self,
+        field_name: str,
+        function: str,
+        params: List[Any],
+        settings: Optional[Dict] = None,
+        options: Optional[Dict] = None
+    ) -> str:
+        """
+        Compile an aggregate over this field to a SQL expression.
+
+        Args:
+            field_name: Column name for the field
+            function: Function from get_aggregate_functions()
+            params: Positional parameter list, extended in place
+            settings: Field-specific settings
+            options: Function options (e.g. {"percentile": 0.95})
+
+        Returns:
+            SQL aggregate expression
+
+        Raises:
+            ValueError: If the function is not supported by this field type
+        """
+        if function not in self.get_aggregate_functions(settings):
+            raise ValueError(f"Aggregate '{function}' is not supported by field type '{self.handle}'")
+        return compile_aggregate_function(quote_identifier(field_name), function, params, options)
+
+    def get_group_buckets(self, settings: Optional[Dict] = None) -> Tuple[str, ...]:
+        """
+        Ways this field can group aggregate results.
+
+        'value' groups by the stored value, date units ('day', 'week', ...)
+        by date_trunc and 'histogram' by width_bucket. Return an empty tuple
+        for fields that cannot be grouped by.
+
+        Args:
+            settings: Field-specific settings
+
+        Returns:
+            Tuple of bucket names
+        """
+        return ()
+
+    def compile_group_by(
+        self,
+        field_name: str,
+        bucket: str,
+        params: List[Any],
+        settings: Optional[Dict] = None,
+        options: Optional[Dict] = None
+    ) -> str:
+        """
+        Compile a group-by expression for this field.
+
+        Args:
+            field_name: Column name for the field
+            bucket: Bucket from get_group_buckets()
+            params: Positional parameter list, extended in place
+            settings: Field-specific settings
+            options: Bucket options (timezone, histogram min/max/buckets)
+
+        Returns:
+            SQL expression to group by
+
+        Raises:
+            ValueError: If the bucket is not supported by this field type
+        """
+        if bucket not in self.get_group_buckets(settings):
+            raise ValueError(f"Group-by bucket '{bucket}' is not supported by field type '{self.handle}'")
+        return compile_bucket(quote_identifier(field_name), bucket, params, options)
+
+    def compile_projection(
+        self,
+        field_name: str,
+        settings: Optional[Dict] = None,
+        cell_config: Optional[Dict] = None
+    ) -> str:
+        """
+        SQL expression selecting this field for a table view.
+
+        Override to select only what the table cell displays (e.g. a
+        truncated prefix); the result is aliased to the field name. The
+        value still goes through deserialize, so keep the column's type.
+
+        Args:
+            field_name: Column name for the field
+            settings: Field-specific settings
+            cell_config: Table cell config (see get_table_cell_config)
+
+        Returns:
+            SQL expression (the quoted column by default)
+        """
+        return quote_identifier(field_name)
+
     def get_default_value(self, settings: Optional[Dict] = None) -> Optional[Any]:
         """
         Get default value for this field type.
@@ -256,6 +563,27 @@ class FieldType(ABC):
             }
         }
 
+    def get_table_cell_template(
+        self,
+        settings: Optional[Dict] = None,
+        field_config: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Get the value-independent table cell configuration for a column.
+
+        Sent once per column (see SectionUIBundle); clients fill in the
+        value per row. The default is get_table_cell_config with value None;
+        override when the component or props depend on the value.
+
+        Args:
+            settings: Field-specific settings
+            field_config: Complete field configuration (label, help_text, etc.)
+
+        Returns:
+            Dictionary with component name and props for table cells
+        """
+        return self.get_table_cell_config(None, settings, field_config)
+
     def get_form_input_config(
         self,
         settings: Optional[Dict] = None,
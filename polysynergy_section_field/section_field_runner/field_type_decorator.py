@@ -1,6 +1,9 @@
 """Decorator for field type classes"""
 
-from typing import Optional
+from typing import Dict, Optional, Tuple, Type
+
+# Field type classes by handle, in registration order
+_registry: Dict[str, Type] = {}
 
 
 def field_type(*, category: str = "general", icon: Optional[str] = None):
@@ -36,6 +39,37 @@ def field_type(*, category: str = "general", icon: Optional[str] = None):
         if icon:
             cls.icon = property(lambda self: icon)
 
+        # Register by handle; handles are plain class attributes on field types
+        handle = cls.__dict__.get("handle")
+        if isinstance(handle, str):
+            registered = _registry.get(handle)
+            if registered is not None and registered.__qualname__ != cls.__qualname__:
+                raise ValueError(f"Field type handle '{handle}' is already registered by {registered.__name__}")
+            _registry[handle] = cls
+
         return cls
 
     return decorator
+
+
+def get_registered_field_types() -> Tuple[Type, ...]:
+    """
+    Field type classes registered with @field_type, in registration order.
+
+    Only types whose modules have been imported are registered; import
+    polysynergy_section_field.field_types to register all built-in types.
+    """
+    return tuple(_registry.values())
+
+
+def get_field_type_class(handle: str) -> Type:
+    """
+    Look up a registered field type class by handle.
+
+    Raises:
+        ValueError: If no field type with this handle is registered
+    """
+    cls = _registry.get(handle)
+    if cls is None:
+        raise ValueError(f"Unknown field type '{handle}'")
+    return cls
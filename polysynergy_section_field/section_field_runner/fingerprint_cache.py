@@ -0,0 +1,57 @@
+"""Thread-safe LRU cache for objects generated per section schema version"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class FingerprintCache(Generic[T]):
+    """
+    LRU cache of generated objects keyed by schema fingerprint.
+
+    Keys start with a section schema fingerprint (optionally followed by
+    other hashable parts, e.g. the visible columns), so a changed schema
+    never hits an entry generated for an older version. Objects are built
+    outside the lock; if two threads build the same key, the first one
+    stored wins, so there is one object per key.
+
+    Subclasses add a typed get(schema, ...) on top of get_or_create.
+
+    Example:
+        >>> cache = FingerprintCache(max_size=2)
+        >>> cache.get_or_create(schema.fingerprint, lambda: CrudStatements(schema))
+        <CrudStatements(table='articles', fingerprint='3f2a9c41d0e7')>
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._items: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Get the object for a key, creating it with factory() on first use"""
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+                return item
+
+        item = factory()
+
+        with self._lock:
+            item = self._items.setdefault(key, item)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+        return item
+
+    def clear(self) -> None:
+        """Drop all cached objects"""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
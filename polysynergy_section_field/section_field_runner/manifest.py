@@ -0,0 +1,148 @@
+"""Precomputed, immutable manifest of the registered field types"""
+
+import hashlib
+import json
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .field_type_decorator import get_registered_field_types
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Whether an If-None-Match header value matches an ETag.
+
+    Supports '*', lists of ETags and weak validators (W/"...").
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class FieldTypeManifest:
+    """
+    Catalog of field types for the builder UI, computed once.
+
+    Each entry holds handle, label, category, icon, ui_component,
+    postgres_type and settings_schema as read-only mappings. The JSON
+    encoding and its ETag are computed at construction, so serving the
+    catalog is a byte copy and conditional requests are a string compare.
+
+    postgres_type is the column type with default settings; use
+    get_postgres_type for the type of a configured field.
+
+    Example:
+        >>> manifest = get_field_type_manifest()
+        >>> manifest.get("currency")["postgres_type"]
+        'NUMERIC(10,2)'
+        >>> manifest.get_postgres_type("currency", {"decimalPlaces": 4})
+        'NUMERIC(12,4)'
+        >>> manifest.etag
+        '"3f2a9c..."'
+    """
+
+    def __init__(self, field_type_classes):
+        self._field_types = {instance.handle: instance for instance in (cls() for cls in field_type_classes)}
+        entries = [self._describe(instance) for instance in self._field_types.values()]
+
+        self.json_bytes: bytes = json.dumps(
+            entries, sort_keys=True, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        self.etag: str = f'"{hashlib.sha256(self.json_bytes).hexdigest()[:32]}"'
+
+        self.entries: Tuple[Mapping[str, Any], ...] = tuple(freeze(entry) for entry in entries)
+        self._by_handle: Dict[str, Mapping[str, Any]] = {entry["handle"]: entry for entry in self.entries}
+
+    @staticmethod
+    def _describe(instance) -> Dict[str, Any]:
+        return {
+            "handle": instance.handle,
+            "label": instance.label,
+            "category": instance.category,
+            "icon": instance.icon,
+            "ui_component": instance.ui_component,
+            "postgres_type": instance.postgres_type,
+            "settings_schema": instance.settings_schema,
+        }
+
+    def get(self, handle: str) -> Mapping[str, Any]:
+        """
+        Manifest entry for a field type.
+
+        Raises:
+            ValueError: If the manifest has no field type with this handle
+        """
+        entry = self._by_handle.get(handle)
+        if entry is None:
+            raise ValueError(f"Unknown field type '{handle}'")
+        return entry
+
+    def get_settings_schema(self, handle: str) -> Optional[Mapping[str, Any]]:
+        """Frozen settings_schema of a field type"""
+        return self.get(handle)["settings_schema"]
+
+    def get_postgres_type(self, handle: str, settings: Optional[Dict] = None) -> str:
+        """
+        Column type of a field type with these settings.
+
+        Raises:
+            ValueError: If the manifest has no field type with this handle
+        """
+        self.get(handle)
+        return self._field_types[handle].get_postgres_type(settings)
+
+    def not_modified(self, if_none_match: Optional[str]) -> bool:
+        """Whether a client holding If-None-Match already has this manifest"""
+        return etag_matches(self.etag, if_none_match)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"<FieldTypeManifest(field_types={len(self.entries)}, etag={self.etag})>"
+
+
+_manifest: Optional[FieldTypeManifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_field_type_manifest() -> FieldTypeManifest:
+    """
+    Manifest of all built-in and registered field types, built on first use.
+
+    Field types registered after the first call are not included until
+    reset_field_type_manifest() is called.
+    """
+    global _manifest
+
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                # Imported here: field_types imports this package
+                import polysynergy_section_field.field_types  # noqa: F401
+
+                _manifest = FieldTypeManifest(get_registered_field_types())
+    return _manifest
+
+
+def reset_field_type_manifest() -> None:
+    """Drop the cached manifest, e.g. after registering plugin field types"""
+    global _manifest
+    with _manifest_lock:
+        _manifest = None
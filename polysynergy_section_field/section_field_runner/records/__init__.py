@@ -0,0 +1,14 @@
+"""Compact record representations of section entries"""
+
+from .record_class import Record, RecordClassCache, build_record_class, get_record_class
+from .lazy_record import LazyRecord, lazy_records, collect_touched_fields
+
+__all__ = [
+    "Record",
+    "RecordClassCache",
+    "build_record_class",
+    "get_record_class",
+    "LazyRecord",
+    "lazy_records",
+    "collect_touched_fields"
+]
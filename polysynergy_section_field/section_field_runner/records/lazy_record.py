@@ -0,0 +1,130 @@
+"""Records that deserialize field values on first access"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence, Tuple
+
+from polysynergy_section_field.section_field_runner.sql.crud import CrudStatements, get_crud_statements
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+# Marks values that have not been deserialized yet
+_MISSING = object()
+
+
+class LazyRecord:
+    """
+    Entry backed by a raw database row.
+
+    A field is deserialized with its FieldType.deserialize only when it is
+    first read; the result is cached on the record. Which fields were read
+    is tracked, so callers can narrow the columns they select.
+
+    Example:
+        >>> record = LazyRecord(row, schema)
+        >>> record["published_at"]      # deserialized now
+        datetime.datetime(2025, 10, 31, 10, 30, tzinfo=datetime.timezone.utc)
+        >>> record.touched_fields
+        ('published_at',)
+    """
+
+    __slots__ = ("_row", "_statements", "_values")
+
+    def __init__(self, row: Sequence[Any], schema: "SectionSchema"):
+        """
+        Args:
+            row: Sequence in CRUD select order ("id" first, then the columns)
+            schema: Section schema the row belongs to
+        """
+        self._row = row
+        self._statements: CrudStatements = get_crud_statements(schema)
+        self._values: List[Any] = [_MISSING] * len(self._statements.fields)
+
+    @property
+    def id(self) -> Any:
+        """Entry id (never deserialized)"""
+        return self._row[0]
+
+    def get(self, handle: str, default: Any = None) -> Any:
+        """Value of a field, or default if the section has no such column"""
+        index = self._statements.column_indexes.get(handle)
+        if index is None:
+            return self.id if handle == "id" else default
+        return self._load(index)
+
+    def _load(self, index: int) -> Any:
+        value = self._values[index]
+        if value is _MISSING:
+            raw = self._row[index + 1]
+            if raw is None:
+                value = None
+            else:
+                field = self._statements.fields[index]
+                value = field.field_type.deserialize(raw, field.settings)
+            self._values[index] = value
+        return value
+
+    @property
+    def touched_fields(self) -> Tuple[str, ...]:
+        """Handles of the fields read so far, in column order"""
+        columns = self._statements.columns
+        return tuple(columns[index] for index, value in enumerate(self._values) if value is not _MISSING)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Deserialize every field into an entry dict (marks all fields as touched)"""
+        entry = {"id": self.id}
+        for index, column in enumerate(self._statements.columns):
+            entry[column] = self._load(index)
+        return entry
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names, so dict(record) works like to_dict()"""
+        return ("id",) + self._statements.columns
+
+    def __getitem__(self, handle: str) -> Any:
+        if handle == "id":
+            return self.id
+        index = self._statements.column_indexes.get(handle)
+        if index is None:
+            raise KeyError(handle)
+        return self._load(index)
+
+    def __getattr__(self, handle: str) -> Any:
+        # Only called for names that are not slots or methods
+        if handle.startswith("_"):
+            raise AttributeError(handle)
+        try:
+            return self[handle]
+        except KeyError:
+            raise AttributeError(f"'{self._statements.table_name}' has no field '{handle}'") from None
+
+    def __contains__(self, handle: str) -> bool:
+        return handle == "id" or handle in self._statements.column_indexes
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self._statements.columns) + 1
+
+    def __repr__(self) -> str:
+        return f"<LazyRecord(table='{self._statements.table_name}', id={self.id!r})>"
+
+
+def lazy_records(rows: Iterable[Sequence[Any]], schema: "SectionSchema") -> List[LazyRecord]:
+    """Wrap a page of rows without deserializing any values"""
+    return [LazyRecord(row, schema) for row in rows]
+
+
+def collect_touched_fields(records: Iterable[LazyRecord]) -> List[str]:
+    """
+    Union of the fields read across records, in column order.
+
+    Useful to learn which columns a view actually needs, so its query can
+    select only those.
+    """
+    touched = set()
+    columns: Tuple[str, ...] = ()
+    for record in records:
+        touched.update(record.touched_fields)
+        columns = record._statements.columns
+    return [column for column in columns if column in touched]
@@ -0,0 +1,162 @@
+"""Compact __slots__ record classes generated per section schema"""
+
+import keyword
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Sequence, Tuple, Type
+
+from ..fingerprint_cache import FingerprintCache
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+
+class Record:
+    """
+    Base class of generated record classes.
+
+    Subclasses define __slots__ for "id" plus one slot per column field,
+    so an entry costs a fixed-size object instead of a per-row dict. Use
+    get_record_class() to obtain the class for a section schema.
+    """
+
+    __slots__ = ()
+
+    # Set on generated subclasses
+    _fields: Tuple[str, ...] = ()
+    _columns: Tuple[Tuple[str, Any, Dict], ...] = ()
+    _fingerprint: str = ""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        if len(args) > len(self._fields):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self._fields)} positional arguments")
+
+        for name, value in zip(self._fields, args):
+            setattr(self, name, value)
+        for name in self._fields[len(args):]:
+            setattr(self, name, kwargs.pop(name, None))
+
+        if kwargs:
+            raise TypeError(f"Unknown fields for {type(self).__name__}: {', '.join(kwargs)}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """Build a record from an entry dict; missing fields are None, extra keys are ignored"""
+        record = cls.__new__(cls)
+        get = data.get
+        for name in cls._fields:
+            setattr(record, name, get(name))
+        return record
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Record":
+        """
+        Build a record from a database row, deserializing each value.
+
+        Args:
+            row: Sequence in CRUD select order ("id" first, then the columns)
+        """
+        record = cls.__new__(cls)
+        record.id = row[0]
+        for (name, field_type, settings), value in zip(cls._columns, row[1:]):
+            setattr(record, name, None if value is None else field_type.deserialize(value, settings))
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Entry dict with one key per field, e.g. for JSON output"""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names, so dict(record) works like to_dict()"""
+        return self._fields
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._fields:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(id={getattr(self, 'id', None)!r})>"
+
+
+# Names a field handle may not use, as they would shadow Record methods
+RESERVED_NAMES = frozenset(name for name in dir(Record) if not name.startswith("__")) | {"id"}
+
+
+def _class_name(table_name: str) -> str:
+    parts = [part for part in table_name.replace("-", "_").split("_") if part]
+    return "".join(part[:1].upper() + part[1:] for part in parts) + "Record"
+
+
+def build_record_class(schema: "SectionSchema") -> Type[Record]:
+    """
+    Generate a __slots__ record class for a section schema.
+
+    The class has a slot for "id" and for every field that stores a
+    column; virtual fields (reverse and junction relations) are skipped,
+    matching the rows produced by CrudStatements.
+
+    Raises:
+        ValueError: If a field handle is not a valid attribute name or
+                    collides with a Record method
+
+    Example:
+        >>> ArticleRecord = build_record_class(schema)
+        >>> record = ArticleRecord.from_dict({"id": "6f1c...", "title": "Hello"})
+        >>> record.title
+        'Hello'
+        >>> record.to_dict()
+        {'id': '6f1c...', 'title': 'Hello', 'tags': None}
+    """
+    fields = schema.get_column_fields()
+
+    for field in fields:
+        if not field.handle.isidentifier() or keyword.iskeyword(field.handle):
+            raise ValueError(f"Field handle '{field.handle}' cannot be used as a record attribute")
+        if field.handle in RESERVED_NAMES:
+            raise ValueError(f"Field handle '{field.handle}' is reserved on record classes")
+
+    slots = ("id",) + tuple(field.handle for field in fields)
+    namespace = {
+        "__slots__": slots,
+        "__module__": __name__,
+        "_fields": slots,
+        "_columns": tuple((field.handle, field.field_type, field.settings) for field in fields),
+        "_fingerprint": schema.fingerprint,
+    }
+    return type(_class_name(schema.table_name), (Record,), namespace)
+
+
+class RecordClassCache(FingerprintCache[Type[Record]]):
+    """
+    LRU cache of generated record classes keyed by section schema fingerprint.
+
+    Concurrent first uses keep one class per fingerprint, so isinstance
+    checks hold across threads.
+
+    Example:
+        >>> cache = RecordClassCache()
+        >>> cache.get(schema) is cache.get(schema)
+        True
+    """
+
+    def get(self, schema: "SectionSchema") -> Type[Record]:
+        """Get the record class for a schema, generating it on first use"""
+        return self.get_or_create(schema.fingerprint, lambda: build_record_class(schema))
+
+
+_default_cache = RecordClassCache()
+
+
+def get_record_class(schema: "SectionSchema") -> Type[Record]:
+    """Get the record class for a schema from the shared process-wide cache"""
+    return _default_cache.get(schema)
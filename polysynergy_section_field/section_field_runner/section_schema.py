@@ -0,0 +1,164 @@
+"""Section schema - the ordered set of fields placed on a section"""
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
+
+from .base_field_type import FieldType
+from .sql.helpers import qualified_table_name
+
+
+def _hash(definition: List) -> str:
+    encoded = json.dumps(definition, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SectionField:
+    """
+    A field as placed on a section.
+
+    Combines the field type with its per-section configuration: the handle
+    (also the column name), the field settings and the field config used
+    for UI rendering.
+
+    Example:
+        >>> SectionField("title", TextField(), {"maxLength": 200}, is_required=True, label="Title")
+        <SectionField(handle='title', type='text')>
+    """
+
+    def __init__(
+        self,
+        handle: str,
+        field_type: FieldType,
+        settings: Optional[Dict] = None,
+        is_required: bool = False,
+        label: Optional[str] = None,
+        help_text: Optional[str] = None,
+        placeholder: Optional[str] = None
+    ):
+        self.handle = handle
+        self.field_type = field_type
+        self.settings = settings or {}
+        self.is_required = is_required
+        self.label = label
+        self.help_text = help_text
+        self.placeholder = placeholder
+
+    @property
+    def field_config(self) -> Dict:
+        """Field configuration as passed to the UI config methods of field types"""
+        return {
+            "label": self.label,
+            "help_text": self.help_text,
+            "placeholder": self.placeholder,
+            "is_required": self.is_required,
+        }
+
+    def __repr__(self) -> str:
+        return f"<SectionField(handle='{self.handle}', type='{self.field_type.handle}')>"
+
+
+class SectionSchema:
+    """
+    Fields of a section, in display order, plus the table that stores them.
+
+    Entries live in one table per section; every field that stores a column
+    uses its handle as column name. The table's primary key is "id" (UUID).
+
+    Example:
+        >>> schema = SectionSchema("articles", [
+        ...     SectionField("title", TextField(), is_required=True),
+        ...     SectionField("tags", MultiSelectField(), {"options": [...]}),
+        ... ])
+        >>> schema.get_field("title").field_type.handle
+        'text'
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        fields: Iterable[SectionField],
+        schema_name: Optional[str] = "custom"
+    ):
+        self.table_name = table_name
+        self.schema_name = schema_name
+        self.fields: List[SectionField] = list(fields)
+        self._fields_by_handle: Dict[str, SectionField] = {}
+        self._fingerprint: Optional[str] = None
+        self._ui_fingerprint: Optional[str] = None
+
+        for field in self.fields:
+            if field.handle in self._fields_by_handle:
+                raise ValueError(f"Duplicate field handle '{field.handle}' in section '{table_name}'")
+            self._fields_by_handle[field.handle] = field
+
+    @property
+    def qualified_table_name(self) -> str:
+        """Quoted, schema-qualified table name for use in SQL"""
+        return qualified_table_name(self.table_name, self.schema_name)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Stable hash of the stored structure (table, fields, types and settings).
+
+        Changes whenever the schema changes in a way that affects columns,
+        generated SQL or stored values, so it can key caches of generated
+        SQL and prepared statements. Labels, help texts and placeholders
+        are left out (see ui_fingerprint), so editing them keeps prepared
+        statements. A schema is treated as immutable once created; build a
+        new one when fields change.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = _hash([
+                self.schema_name,
+                self.table_name,
+                [
+                    [field.handle, field.field_type.handle, field.settings, field.is_required]
+                    for field in self.fields
+                ],
+            ])
+        return self._fingerprint
+
+    @property
+    def ui_fingerprint(self) -> str:
+        """
+        Hash of the fingerprint plus the UI texts (label, help text, placeholder).
+
+        Keys caches of UI definitions, which change with those texts.
+        """
+        if self._ui_fingerprint is None:
+            self._ui_fingerprint = _hash([
+                self.fingerprint,
+                [[field.label, field.help_text, field.placeholder] for field in self.fields],
+            ])
+        return self._ui_fingerprint
+
+    def get_column_fields(self) -> List[SectionField]:
+        """Fields that store a column in the section table, in order"""
+        return [field for field in self.fields if field.field_type.has_column(field.settings)]
+
+    def get_field(self, handle: str) -> SectionField:
+        """
+        Look up a field by handle.
+
+        Raises:
+            ValueError: If the section has no field with this handle
+        """
+        field = self._fields_by_handle.get(handle)
+        if field is None:
+            raise ValueError(f"Unknown field '{handle}' in section '{self.table_name}'")
+        return field
+
+    def has_field(self, handle: str) -> bool:
+        """Whether the section has a field with this handle"""
+        return handle in self._fields_by_handle
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __repr__(self) -> str:
+        return f"<SectionSchema(table='{self.table_name}', fields={len(self.fields)})>"
@@ -0,0 +1,67 @@
+"""SQL building utilities for field types"""
+
+from .helpers import quote_identifier, quote_literal, qualified_table_name, add_param, escape_like
+from .filters import (
+    COMPARISON_OPERATORS,
+    NULL_OPERATORS,
+    EQUALITY_OPERATORS,
+    RANGE_OPERATORS,
+    compile_comparison,
+    compile_filters
+)
+from .crud import CrudStatements, CrudStatementCache, get_crud_statements
+from .projection import (
+    ProjectionPlan,
+    ProjectionPlanCache,
+    compile_array_slice_projection,
+    compile_truncated_projection,
+    get_projection_plan
+)
+from .pagination import KeysetPagination, encode_cursor, decode_cursor
+from .aggregates import (
+    COUNT_AGGREGATES,
+    ORDERED_AGGREGATES,
+    NUMERIC_AGGREGATES,
+    VALUE_BUCKETS,
+    DATE_BUCKETS,
+    TIMESTAMP_BUCKETS,
+    HISTOGRAM_BUCKETS,
+    compile_aggregate_function,
+    compile_bucket,
+    compile_aggregate_query
+)
+
+__all__ = [
+    "quote_identifier",
+    "quote_literal",
+    "qualified_table_name",
+    "add_param",
+    "escape_like",
+    "COMPARISON_OPERATORS",
+    "NULL_OPERATORS",
+    "EQUALITY_OPERATORS",
+    "RANGE_OPERATORS",
+    "compile_comparison",
+    "compile_filters",
+    "CrudStatements",
+    "CrudStatementCache",
+    "get_crud_statements",
+    "ProjectionPlan",
+    "ProjectionPlanCache",
+    "compile_array_slice_projection",
+    "compile_truncated_projection",
+    "get_projection_plan",
+    "KeysetPagination",
+    "encode_cursor",
+    "decode_cursor",
+    "COUNT_AGGREGATES",
+    "ORDERED_AGGREGATES",
+    "NUMERIC_AGGREGATES",
+    "VALUE_BUCKETS",
+    "DATE_BUCKETS",
+    "TIMESTAMP_BUCKETS",
+    "HISTOGRAM_BUCKETS",
+    "compile_aggregate_function",
+    "compile_bucket",
+    "compile_aggregate_query"
+]
@@ -0,0 +1,184 @@
+"""Aggregate pushdown: compile dashboard aggregate requests to one SQL statement"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .filters import compile_filters
+from .helpers import add_param, quote_identifier
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+
+# Aggregate function sets shared by field types
+COUNT_AGGREGATES = ("count",)
+ORDERED_AGGREGATES = ("count", "min", "max")
+NUMERIC_AGGREGATES = ("count", "sum", "avg", "min", "max", "percentile")
+
+# Group-by bucket sets shared by field types
+VALUE_BUCKETS = ("value",)
+DATE_BUCKETS = ("day", "week", "month", "quarter", "year")
+TIMESTAMP_BUCKETS = ("minute", "hour") + DATE_BUCKETS
+HISTOGRAM_BUCKETS = ("histogram",)
+
+_SIMPLE_AGGREGATES = ("count", "sum", "avg", "min", "max")
+
+
+def compile_aggregate_function(
+    column: str,
+    function: str,
+    params: List[Any],
+    options: Optional[Dict] = None
+) -> str:
+    """
+    Compile an aggregate over a column.
+
+    Args:
+        column: Quoted column expression
+        function: 'count', 'sum', 'avg', 'min', 'max' or 'percentile'
+        params: Positional parameter list, extended in place
+        options: Function options; 'percentile' needs {"percentile": 0.95}
+
+    Returns:
+        SQL aggregate expression
+
+    Example:
+        >>> compile_aggregate_function('"price"', "percentile", [], {"percentile": 0.9})
+        'percentile_cont($1::float8) WITHIN GROUP (ORDER BY "price")'
+    """
+    if function in _SIMPLE_AGGREGATES:
+        return f"{function}({column})"
+
+    if function == "percentile":
+        fraction = (options or {}).get("percentile")
+        if not isinstance(fraction, (int, float)) or not 0 <= fraction <= 1:
+            raise ValueError("Percentile must be a number between 0 and 1")
+        return f"percentile_cont({add_param(params, float(fraction))}::float8) WITHIN GROUP (ORDER BY {column})"
+
+    raise ValueError(f"Unknown aggregate function '{function}'")
+
+
+def compile_bucket(
+    column: str,
+    bucket: str,
+    params: List[Any],
+    options: Optional[Dict] = None
+) -> str:
+    """
+    Compile a group-by bucket expression for a column.
+
+    Args:
+        column: Quoted column expression
+        bucket: 'value' (the raw column), a date_trunc unit from
+                TIMESTAMP_BUCKETS, or 'histogram'
+        params: Positional parameter list, extended in place
+        options: Bucket options:
+                 - date units: optional "timezone" (IANA name) to bucket in
+                 - histogram: "min", "max" and "buckets" (count)
+
+    Returns:
+        SQL expression to group by
+    """
+    options = options or {}
+
+    if bucket == "value":
+        return column
+
+    if bucket in TIMESTAMP_BUCKETS:
+        # The unit is a whitelisted literal so the expression matches an
+        # expression index on date_trunc if one exists
+        timezone = options.get("timezone")
+        if timezone:
+            return f"date_trunc('{bucket}', {column}, {add_param(params, timezone)})"
+        return f"date_trunc('{bucket}', {column})"
+
+    if bucket == "histogram":
+        try:
+            low = float(options["min"])
+            high = float(options["max"])
+            count = int(options["buckets"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError("Histogram buckets need numeric 'min', 'max' and 'buckets' options") from e
+        if high <= low or count < 1:
+            raise ValueError("Histogram needs max > min and at least one bucket")
+        return (
+            f"width_bucket({column}, {add_param(params, low)}, "
+            f"{add_param(params, high)}, {add_param(params, count)})"
+        )
+
+    raise ValueError(f"Unknown group-by bucket '{bucket}'")
+
+
+def compile_aggregate_query(schema: "SectionSchema", request: Dict) -> Tuple[str, List[Any]]:
+    """
+    Compile an aggregate request on a section into a single SQL statement.
+
+    Request format:
+        {
+            "metrics": [
+                {"function": "count"},
+                {"field": "price", "function": "sum", "alias": "revenue"},
+                {"field": "price", "function": "percentile", "percentile": 0.95}
+            ],
+            "groupBy": [
+                {"field": "status"},
+                {"field": "published_at", "bucket": "week", "timezone": "Europe/Amsterdam"},
+                {"field": "price", "bucket": "histogram", "min": 0, "max": 500, "buckets": 10}
+            ],
+            "filters": [{"field": "status", "operator": "neq", "value": "draft"}],
+            "limit": 1000
+        }
+
+    Metrics and buckets are delegated to the field types, so only
+    aggregates a field type declares (get_aggregate_functions /
+    get_group_buckets) are accepted. A metric without a field is count(*).
+
+    Args:
+        schema: Section schema to aggregate
+        request: Aggregate request (see above)
+
+    Returns:
+        Tuple of (sql, params). Group columns come first, aliased by field
+        handle (plus "_<bucket>" for buckets), followed by the metrics.
+
+    Raises:
+        ValueError: For unknown fields, unsupported functions or buckets
+    """
+    metrics = request.get("metrics") or [{"function": "count"}]
+    params: List[Any] = []
+    select_list = []
+
+    group_count = 0
+    for group in request.get("groupBy") or []:
+        field = schema.get_field(group["field"])
+        bucket = group.get("bucket", "value")
+        expression = field.field_type.compile_group_by(field.handle, bucket, params, field.settings, group)
+        alias = group.get("alias") or (field.handle if bucket == "value" else f"{field.handle}_{bucket}")
+        select_list.append(f"{expression} AS {quote_identifier(alias)}")
+        group_count += 1
+
+    for metric in metrics:
+        function = metric["function"]
+        if "field" not in metric:
+            if function != "count":
+                raise ValueError(f"Aggregate '{function}' needs a field")
+            select_list.append(f"count(*) AS {quote_identifier(metric.get('alias') or 'count')}")
+            continue
+
+        field = schema.get_field(metric["field"])
+        expression = field.field_type.compile_aggregate(field.handle, function, params, field.settings, metric)
+        alias = metric.get("alias") or f"{function}_{field.handle}"
+        select_list.append(f"{expression} AS {quote_identifier(alias)}")
+
+    where, params = compile_filters(schema, request.get("filters") or [], params)
+
+    sql = f"SELECT {', '.join(select_list)} FROM {schema.qualified_table_name} WHERE {where}"
+
+    if group_count:
+        # Group and order by position so bucket parameters are bound only once
+        positions = ", ".join(str(index) for index in range(1, group_count + 1))
+        sql += f" GROUP BY {positions} ORDER BY {positions}"
+
+    if request.get("limit"):
+        sql += f" LIMIT {add_param(params, int(request['limit']))}"
+
+    return (sql, params)
@@ -0,0 +1,157 @@
+"""CRUD statement generation, cached per section schema version"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from ..fingerprint_cache import FingerprintCache
+from .helpers import quote_identifier
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+# PostgreSQL truncates identifiers (including statement names) beyond 63 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+
+class CrudStatements:
+    """
+    INSERT/UPDATE/SELECT/DELETE SQL for one version of a section schema.
+
+    Only fields that store a column are included; virtual fields such as
+    RelationOneToManyField and junction-backed RelationManyToManyField are
+    skipped. Statement text is fixed per schema fingerprint, so drivers can
+    prepare each statement once and reuse the server-side plan.
+
+    Parameter order:
+    - insert: one parameter per column, in column order
+    - update: one parameter per column, then the entry id
+    - select / delete: the entry id
+    - select_many: a uuid[] of entry ids
+
+    Example:
+        >>> statements = CrudStatements(schema)
+        >>> statements.insert
+        'INSERT INTO "custom"."articles" ("title", "tags") VALUES ($1, $2) RETURNING "id"'
+        >>> statements.insert_args({"title": "Hello", "tags": ["news"]})
+        ['Hello', ['news']]
+    """
+
+    def __init__(self, schema: "SectionSchema"):
+        self.fingerprint = schema.fingerprint
+        self.table_name = schema.table_name
+        self.fields = schema.get_column_fields()
+        self.columns = tuple(field.handle for field in self.fields)
+        self.column_indexes = {column: index for index, column in enumerate(self.columns)}
+
+        table = schema.qualified_table_name
+        column_list = ", ".join(quote_identifier(column) for column in self.columns)
+        count = len(self.columns)
+
+        if count:
+            placeholders = ", ".join(f"${index}" for index in range(1, count + 1))
+            assignments = ", ".join(
+                f"{quote_identifier(column)} = ${index}"
+                for index, column in enumerate(self.columns, start=1)
+            )
+            self.insert = f'INSERT INTO {table} ({column_list}) VALUES ({placeholders}) RETURNING "id"'
+            self.update: Optional[str] = f'UPDATE {table} SET {assignments} WHERE "id" = ${count + 1}'
+            select_list = f'"id", {column_list}'
+        else:
+            # Sections with only virtual fields still have entries
+            self.insert = f'INSERT INTO {table} DEFAULT VALUES RETURNING "id"'
+            self.update = None
+            select_list = '"id"'
+
+        self.select = f'SELECT {select_list} FROM {table} WHERE "id" = $1'
+        self.select_many = f'SELECT {select_list} FROM {table} WHERE "id" = ANY($1::uuid[])'
+        self.delete = f'DELETE FROM {table} WHERE "id" = $1'
+
+    def statement_name(self, kind: str) -> str:
+        """
+        Name for a server-side prepared statement.
+
+        Includes the schema fingerprint, so a changed schema never reuses a
+        statement prepared for an older version. Long table names are cut
+        to keep the name within PostgreSQL's 63-byte identifier limit; the
+        fingerprint covers the table name, so cut names stay distinct.
+
+        Args:
+            kind: 'insert', 'update', 'select', 'select_many' or 'delete'
+        """
+        suffix = f"_{kind}_{self.fingerprint[:16]}"
+        budget = MAX_IDENTIFIER_LENGTH - len(suffix)
+        prefix = self.table_name.encode("utf-8")[:budget].decode("utf-8", "ignore")
+        return prefix + suffix
+
+    def insert_args(self, entry: Dict[str, Any]) -> List[Any]:
+        """
+        Serialized INSERT parameters for an entry.
+
+        Missing fields take the field type's default value.
+        """
+        args = []
+        for field in self.fields:
+            if field.handle in entry:
+                value = entry[field.handle]
+            else:
+                value = field.field_type.get_default_value(field.settings)
+            args.append(None if value is None else field.field_type.serialize(value, field.settings))
+        return args
+
+    def update_args(self, entry_id: Any, entry: Dict[str, Any]) -> List[Any]:
+        """
+        Serialized UPDATE parameters for an entry.
+
+        The UPDATE writes every column, so the entry must contain all of
+        them; a missing key would otherwise silently overwrite data.
+
+        Raises:
+            ValueError: If a column is missing from the entry
+        """
+        missing = [column for column in self.columns if column not in entry]
+        if missing:
+            raise ValueError(f"Update requires all columns, missing: {', '.join(missing)}")
+
+        args = []
+        for field in self.fields:
+            value = entry[field.handle]
+            args.append(None if value is None else field.field_type.serialize(value, field.settings))
+        args.append(entry_id)
+        return args
+
+    def row_to_entry(self, row: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Deserialize a row returned by select/select_many into an entry dict.
+
+        Args:
+            row: Sequence in select order ("id" first, then the columns)
+        """
+        entry = {"id": row[0]}
+        for field, value in zip(self.fields, row[1:]):
+            entry[field.handle] = None if value is None else field.field_type.deserialize(value, field.settings)
+        return entry
+
+    def __repr__(self) -> str:
+        return f"<CrudStatements(table='{self.table_name}', fingerprint='{self.fingerprint[:12]}')>"
+
+
+class CrudStatementCache(FingerprintCache[CrudStatements]):
+    """
+    LRU cache of CrudStatements keyed by section schema fingerprint.
+
+    Example:
+        >>> cache = CrudStatementCache()
+        >>> cache.get(schema) is cache.get(schema)
+        True
+    """
+
+    def get(self, schema: "SectionSchema") -> CrudStatements:
+        """Get statements for a schema, generating them on first use"""
+        return self.get_or_create(schema.fingerprint, lambda: CrudStatements(schema))
+
+
+_default_cache = CrudStatementCache()
+
+
+def get_crud_statements(schema: "SectionSchema") -> CrudStatements:
+    """Get CRUD statements for a schema from the shared process-wide cache"""
+    return _default_cache.get(schema)
@@ -0,0 +1,122 @@
+"""Filter operators and compilation of section filters to parameterized SQL"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .helpers import add_param, escape_like
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+
+# Operators that map 1:1 onto a SQL comparison operator
+COMPARISON_OPERATORS = {
+    "eq": "=",
+    "neq": "<>",
+    "lt": "<",
+    "lte": "<=",
+    "gt": ">",
+    "gte": ">=",
+}
+
+# Operator sets shared by field types
+NULL_OPERATORS = ("is_null", "is_not_null")
+EQUALITY_OPERATORS = ("eq", "neq", "in", "not_in") + NULL_OPERATORS
+RANGE_OPERATORS = ("eq", "neq", "lt", "lte", "gt", "gte", "between", "in", "not_in") + NULL_OPERATORS
+
+
+def compile_comparison(column: str, operator: str, value: Any, params: List[Any]) -> str:
+    """
+    Compile a generic comparison against a column.
+
+    The value is bound as-is (it should already be serialized by the field
+    type), and the column is compared in its native type so btree indexes
+    on the column stay usable.
+
+    Args:
+        column: Quoted column expression
+        operator: One of COMPARISON_OPERATORS, 'in', 'not_in', 'between',
+                  'starts_with', 'is_null' or 'is_not_null'
+        value: Serialized value (a list for 'in'/'not_in', a pair for 'between')
+        params: Positional parameter list to bind values into
+
+    Returns:
+        SQL predicate
+
+    Example:
+        >>> params = []
+        >>> compile_comparison('"status"', "in", ["draft", "live"], params)
+        '"status" = ANY($1)'
+    """
+    if operator in COMPARISON_OPERATORS:
+        return f"{column} {COMPARISON_OPERATORS[operator]} {add_param(params, value)}"
+
+    if operator == "in":
+        return f"{column} = ANY({add_param(params, list(value))})"
+
+    if operator == "not_in":
+        return f"{column} <> ALL({add_param(params, list(value))})"
+
+    if operator == "between":
+        low, high = value
+        return f"{column} BETWEEN {add_param(params, low)} AND {add_param(params, high)}"
+
+    if operator == "starts_with":
+        # Prefix LIKE can use a btree index with *_pattern_ops
+        return f"{column} LIKE {add_param(params, escape_like(value) + '%')}"
+
+    if operator == "is_null":
+        return f"{column} IS NULL"
+
+    if operator == "is_not_null":
+        return f"{column} IS NOT NULL"
+
+    raise ValueError(f"Unknown filter operator '{operator}'")
+
+
+def compile_filters(
+    schema: "SectionSchema",
+    filters: Iterable[Dict],
+    params: Optional[List[Any]] = None
+) -> Tuple[str, List[Any]]:
+    """
+    Compile filters on a section into a single WHERE clause body.
+
+    Each filter is delegated to its field type, so every predicate is
+    written against the column's native type (and its indexes) instead of
+    a text cast.
+
+    Args:
+        schema: Section schema the filters apply to
+        filters: Dicts with "field" (handle), "operator" and "value"
+        params: Existing parameter list to continue numbering from
+
+    Returns:
+        Tuple of (sql, params). Predicates are AND-ed; no filters gives 'TRUE'.
+
+    Example:
+        >>> compile_filters(schema, [
+        ...     {"field": "tags", "operator": "contains_any", "value": ["news"]},
+        ...     {"field": "published_at", "operator": "gte", "value": "2025-01-01T00:00:00Z"},
+        ... ])
+        ('("tags" ?| $1::text[]) AND ("published_at" >= $2)', [['news'], '2025-01-01T00:00:00Z'])
+    """
+    if params is None:
+        params = []
+
+    clauses = []
+    for item in filters:
+        field = schema.get_field(item["field"])
+        clauses.append(field.field_type.compile_filter(
+            field.handle,
+            item["operator"],
+            item.get("value"),
+            params,
+            field.settings,
+            table_name=schema.table_name,
+            schema_name=schema.schema_name
+        ))
+
+    if not clauses:
+        return ("TRUE", params)
+
+    return (" AND ".join(f"({clause})" for clause in clauses), params)
@@ -0,0 +1,69 @@
+"""Helpers for building parameterized PostgreSQL statements"""
+
+from typing import Any, List, Optional
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a PostgreSQL identifier (column, table or schema name).
+
+    Embedded double quotes are doubled so a handle can never break out
+    of the identifier.
+
+    Example:
+        >>> quote_identifier("company_name")
+        '"company_name"'
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    """
+    Quote a string literal for DDL, where parameters cannot be used.
+
+    Example:
+        >>> quote_literal("it's")
+        "'it''s'"
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def qualified_table_name(table_name: str, schema_name: Optional[str] = None) -> str:
+    """
+    Build a quoted, optionally schema-qualified table name.
+
+    Example:
+        >>> qualified_table_name("research_companies", "custom")
+        '"custom"."research_companies"'
+    """
+    if schema_name:
+        return f"{quote_identifier(schema_name)}.{quote_identifier(table_name)}"
+    return quote_identifier(table_name)
+
+
+def add_param(params: List[Any], value: Any) -> str:
+    """
+    Append a value to a positional parameter list and return its placeholder.
+
+    Placeholders use the PostgreSQL ``$n`` style, numbered by position in
+    ``params``, so fragments compiled against the same list compose into
+    one statement.
+
+    Example:
+        >>> params = ["draft"]
+        >>> add_param(params, 10)
+        '$2'
+    """
+    params.append(value)
+    return f"${len(params)}"
+
+
+def escape_like(value: str) -> str:
+    """
+    Escape LIKE wildcards so the value is matched literally.
+
+    Example:
+        >>> escape_like("100%_done")
+        '100\\\\%\\\\_done'
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,278 @@
+"""Keyset (cursor) pagination for section table views and relation lists"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from .filters import compile_filters
+from .helpers import add_param, quote_identifier
+from .projection import get_projection_plan
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+SORT_ORDERS = ("ASC", "DESC")
+
+# Columns every section table has besides its fields, with their types
+SYSTEM_SORT_COLUMNS = {
+    "id": "UUID",
+    "created_at": "TIMESTAMP WITH TIME ZONE",
+    "updated_at": "TIMESTAMP WITH TIME ZONE",
+}
+
+# Alias of the raw sort value appended to the SELECT list
+SORT_VALUE_ALIAS = "__sort_value"
+
+
+def _cursor_value(value: Any) -> Any:
+    """JSON-safe form of a sort value as returned by the driver"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+def _typed_cursor_value(value: Any, postgres_type: str) -> Any:
+    """
+    Convert a sort value read back from a cursor to what the driver binds
+    for a column of this type; the inverse of _cursor_value.
+
+    Raises:
+        ValueError: If the value does not parse as the column type
+    """
+    if not isinstance(value, str):
+        return value
+    column_type = postgres_type.upper()
+    if column_type.startswith("TIMESTAMP"):
+        return datetime.fromisoformat(value)
+    if column_type == "DATE":
+        return date.fromisoformat(value)
+    if column_type.startswith("TIME"):
+        return time.fromisoformat(value)
+    if column_type.startswith(("NUMERIC", "DECIMAL")):
+        try:
+            return Decimal(value)
+        except ArithmeticError:
+            raise ValueError(f"Invalid numeric value '{value}'") from None
+    return value
+
+
+def encode_cursor(sort_key: str, sort_value: Any, entry_id: Any) -> str:
+    """
+    Opaque, URL-safe cursor for the position after an entry.
+
+    The cursor records the sort it belongs to, so it cannot be replayed
+    against another sort.
+    """
+    payload = json.dumps(
+        [sort_key, _cursor_value(sort_value), _cursor_value(entry_id)],
+        separators=(",", ":")
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> Tuple[Any, Any]:
+    """
+    Decode a cursor into (sort_value, entry_id).
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another sort
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_key, sort_value, entry_id = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+
+    if cursor_key != sort_key:
+        raise ValueError("Cursor does not match the sort order")
+    return (sort_value, entry_id)
+
+
+class KeysetPagination:
+    """
+    Pages through a section ordered by one sortable field, using cursors.
+
+    Each page continues after the last row of the previous one with a
+    row comparison, "(sort_col, id) > ($1, $2)", so the composite index
+    from index_sql() serves every page at the same cost; OFFSET pages
+    get slower the deeper they go. The entry id breaks ties, so the order
+    is total. NULL sort values come last in both directions.
+
+    Example:
+        >>> pagination = KeysetPagination(schema, "published_at", "DESC", limit=20)
+        >>> sql, params = pagination.build(filters, cursor=request.args.get("cursor"))
+        >>> entries, next_cursor = pagination.page(await connection.fetch(sql, *params))
+        >>> pagination.index_sql()
+        'CREATE INDEX idx_articles_published_at_keyset ON "custom"."articles"("published_at" DESC NULLS LAST, "id" DESC);'
+    """
+
+    def __init__(
+        self,
+        schema: "SectionSchema",
+        sort_by: str = "id",
+        sort_order: str = "DESC",
+        limit: int = 50,
+        index_prefix: Sequence[str] = ()
+    ):
+        """
+        Args:
+            schema: Section schema to page through
+            sort_by: Handle of a sortable field, or 'id'/'created_at'/'updated_at'
+            sort_order: 'ASC' or 'DESC'
+            limit: Entries per page
+            index_prefix: Handles always filtered with 'eq' (e.g. the foreign
+                          key of a relation list); they lead the recommended index
+
+        Raises:
+            ValueError: If the field is not sortable or the order/limit is invalid
+        """
+        sort_order = sort_order.upper()
+        if sort_order not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order '{sort_order}'")
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+
+        if schema.has_field(sort_by):
+            field = schema.get_field(sort_by)
+            if not field.field_type.is_sortable(field.settings):
+                raise ValueError(f"Field '{sort_by}' of type '{field.field_type.handle}' is not sortable")
+            nullable = not field.is_required
+            sort_type = field.field_type.get_postgres_type(field.settings)
+        elif sort_by in SYSTEM_SORT_COLUMNS:
+            nullable = False
+            sort_type = SYSTEM_SORT_COLUMNS[sort_by]
+        else:
+            raise ValueError(f"Unknown sort field '{sort_by}'")
+
+        self.schema = schema
+        self.sort_by = sort_by
+        self.sort_order = sort_order
+        self.limit = limit
+        self.index_prefix = tuple(index_prefix)
+        self.nullable = nullable and sort_by != "id"
+        self.sort_type = sort_type
+        self.sort_key = f"{sort_by}:{sort_order}"
+
+    def _order_by(self, table: str = "") -> str:
+        """
+        ORDER BY list; the statement qualifies the columns with the table,
+        since a bare name would sort by a truncated projection of the same name.
+        """
+        prefix = f"{table}." if table else ""
+        if self.sort_by == "id":
+            return f'{prefix}"id" {self.sort_order}'
+        return (
+            f"{prefix}{quote_identifier(self.sort_by)} {self.sort_order} NULLS LAST, "
+            f'{prefix}"id" {self.sort_order}'
+        )
+
+    def _after(self, cursor: str, params: List[Any]) -> str:
+        """Predicate selecting the rows after a cursor"""
+        sort_value, entry_id = decode_cursor(cursor, self.sort_key)
+        comparison = ">" if self.sort_order == "ASC" else "<"
+
+        if self.sort_by == "id":
+            return f'"id" {comparison} {add_param(params, entry_id)}'
+
+        column = quote_identifier(self.sort_by)
+        if sort_value is None:
+            # Already in the trailing NULL group: continue by id within it
+            return f'{column} IS NULL AND "id" {comparison} {add_param(params, entry_id)}'
+
+        try:
+            sort_value = _typed_cursor_value(sort_value, self.sort_type)
+        except ValueError:
+            raise ValueError("Invalid cursor") from None
+
+        predicate = (
+            f'({column}, "id") {comparison} '
+            f"({add_param(params, sort_value)}, {add_param(params, entry_id)})"
+        )
+        if self.nullable:
+            return f"({predicate} OR {column} IS NULL)"
+        return predicate
+
+    def build(
+        self,
+        filters: Optional[Iterable[Dict]] = None,
+        cursor: Optional[str] = None,
+        columns: Optional[Iterable[str]] = None,
+        params: Optional[List[Any]] = None
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the statement for one page.
+
+        One row more than the limit is fetched, so page() can tell whether
+        another page follows.
+
+        Args:
+            filters: Filters as for compile_filters
+            cursor: Cursor from the previous page, or None for the first page
+            columns: Visible field handles (see ProjectionPlan); default all
+            params: Existing parameter list to continue numbering from
+
+        Returns:
+            Tuple of (sql, params)
+
+        Raises:
+            ValueError: If the cursor is invalid for this sort
+        """
+        plan = get_projection_plan(self.schema, columns)
+        where, params = compile_filters(self.schema, filters or [], params)
+        if cursor:
+            after = self._after(cursor, params)
+            where = after if where == "TRUE" else f"{where} AND {after}"
+
+        sql = (
+            f"SELECT {plan.select_list}, {quote_identifier(self.sort_by)} AS {quote_identifier(SORT_VALUE_ALIAS)} "
+            f"FROM {self.schema.qualified_table_name} WHERE {where} "
+            f"ORDER BY {self._order_by(self.schema.qualified_table_name)} LIMIT {add_param(params, self.limit + 1)}"
+        )
+        return (sql, params)
+
+    def page(
+        self,
+        rows: Sequence[Sequence[Any]],
+        columns: Optional[Iterable[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Deserialize the rows of build() into entries and the next cursor.
+
+        Args:
+            rows: Rows of the statement from build()
+            columns: The same columns as passed to build()
+
+        Returns:
+            Tuple of (entries, next_cursor); next_cursor is None on the last page
+        """
+        plan = get_projection_plan(self.schema, columns)
+        has_more = len(rows) > self.limit
+        rows = rows[:self.limit]
+
+        entries = [plan.row_to_entry(row[:-1]) for row in rows]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_cursor(self.sort_key, last[-1], last[0])
+        return (entries, next_cursor)
+
+    def index_sql(self) -> Optional[str]:
+        """
+        Composite index matching the ORDER BY, recommended for every paged sort.
+
+        None when sorting by id alone, which the primary key already serves.
+        """
+        if self.sort_by == "id" and not self.index_prefix:
+            return None
+        columns = [quote_identifier(handle) for handle in self.index_prefix] + [self._order_by()]
+        name = "_".join((self.schema.table_name,) + self.index_prefix + (self.sort_by, "keyset"))
+        return f"CREATE INDEX idx_{name} ON {self.schema.qualified_table_name}({', '.join(columns)});"
+
+    def __repr__(self) -> str:
+        return f"<KeysetPagination(table='{self.schema.table_name}', sort='{self.sort_key}', limit={self.limit})>"
@@ -0,0 +1,161 @@
+"""SELECT list planning for table views, cached per section schema version"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from ..fingerprint_cache import FingerprintCache
+from .helpers import quote_identifier
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+
+def compile_truncated_projection(
+    column: str,
+    cell_config: Optional[Dict] = None,
+    stored_max_length: Optional[int] = None
+) -> str:
+    """
+    left(column, n + 1) when the cell shows at most n characters of a text column.
+
+    The extra character lets the cell tell a cut value (longer than n)
+    from one that fits, so it only adds an ellipsis when text is missing.
+
+    Args:
+        column: Quoted column name
+        cell_config: Table cell config with "truncate" and "maxLength" props
+        stored_max_length: Maximum length of stored values, if limited;
+                           no left() when values already fit the cell
+
+    Example:
+        >>> compile_truncated_projection('"body"', {"props": {"truncate": True, "maxLength": 100}})
+        'left("body", 101)'
+    """
+    props = (cell_config or {}).get("props") or {}
+    max_length = props.get("maxLength")
+    if not props.get("truncate") or not isinstance(max_length, int) or max_length < 1:
+        return column
+    if stored_max_length is None or stored_max_length > max_length + 1:
+        return f"left({column}, {max_length + 1})"
+    return column
+
+
+def compile_array_slice_projection(column: str, max_items: Optional[int]) -> str:
+    """
+    First max_items elements of a JSONB array column; other JSON values pass through.
+
+    Example:
+        >>> compile_array_slice_projection('"tags"', 5)
+        'CASE WHEN jsonb_typeof("tags") = \\'array\\' THEN jsonb_path_query_array("tags", \\'$[0 to 4]\\') ELSE "tags" END'
+    """
+    if not isinstance(max_items, int) or max_items < 1:
+        return column
+    return (
+        f"CASE WHEN jsonb_typeof({column}) = 'array' "
+        f"THEN jsonb_path_query_array({column}, '$[0 to {max_items - 1}]') ELSE {column} END"
+    )
+
+
+class ProjectionPlan:
+    """
+    SELECT list with only the visible columns of a table view.
+
+    Each column is projected by its field type (compile_projection) from
+    the table cell config, so truncated text is cut with left() and long
+    arrays are sliced in the database instead of after the transfer.
+    Virtual fields (relations without a column, text kept in a side
+    table) are skipped.
+
+    Example:
+        >>> plan = ProjectionPlan(schema, ["body", "tags", "comments"])
+        >>> plan.select
+        'SELECT "id", left("body", 101) AS "body", "tags" FROM "custom"."articles"'
+        >>> plan.previews
+        ('body',)
+    """
+
+    def __init__(
+        self,
+        schema: "SectionSchema",
+        columns: Optional[Iterable[str]] = None,
+        cell_configs: Optional[Dict[str, Dict]] = None
+    ):
+        """
+        Args:
+            schema: Section schema
+            columns: Visible field handles in display order (default: all fields)
+            cell_configs: Table cell config per handle (e.g. SectionUIBundle.columns);
+                          defaults to get_table_cell_config with value None
+        """
+        self.fingerprint = schema.fingerprint
+        self.table_name = schema.table_name
+
+        handles = list(columns) if columns is not None else [field.handle for field in schema]
+        self.fields = []
+        expressions = ['"id"']
+        previews = []
+
+        for handle in handles:
+            field = schema.get_field(handle)
+            if not field.field_type.has_column(field.settings):
+                continue
+
+            if cell_configs is not None and handle in cell_configs:
+                cell_config = cell_configs[handle]
+            else:
+                cell_config = field.field_type.get_table_cell_config(None, field.settings, field.field_config)
+
+            column = quote_identifier(handle)
+            expression = field.field_type.compile_projection(handle, field.settings, cell_config)
+            if expression != column:
+                expression = f"{expression} AS {column}"
+                previews.append(handle)
+
+            self.fields.append(field)
+            expressions.append(expression)
+
+        self.columns: Tuple[str, ...] = tuple(field.handle for field in self.fields)
+        self.previews: Tuple[str, ...] = tuple(previews)
+        self.select_list = ", ".join(expressions)
+        self.select = f"SELECT {self.select_list} FROM {schema.qualified_table_name}"
+
+    def row_to_entry(self, row: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Deserialize a row into an entry dict ("id" first, then the planned columns).
+
+        Values of handles in previews are truncated or sliced; load the
+        entry with CrudStatements.select for the full values.
+        """
+        entry = {"id": row[0]}
+        for field, value in zip(self.fields, row[1:]):
+            entry[field.handle] = None if value is None else field.field_type.deserialize(value, field.settings)
+        return entry
+
+    def __repr__(self) -> str:
+        return f"<ProjectionPlan(table='{self.table_name}', columns={list(self.columns)})>"
+
+
+class ProjectionPlanCache(FingerprintCache[ProjectionPlan]):
+    """
+    LRU cache of ProjectionPlans keyed by schema fingerprint and visible columns.
+
+    Example:
+        >>> cache = ProjectionPlanCache()
+        >>> cache.get(schema, ["title"]) is cache.get(schema, ["title"])
+        True
+    """
+
+    def __init__(self, max_size: int = 1024):
+        super().__init__(max_size)
+
+    def get(self, schema: "SectionSchema", columns: Optional[Iterable[str]] = None) -> ProjectionPlan:
+        """Get the plan for a schema and visible columns, planning on first use"""
+        columns = tuple(columns) if columns is not None else None
+        return self.get_or_create((schema.fingerprint, columns), lambda: ProjectionPlan(schema, columns))
+
+
+_default_cache = ProjectionPlanCache()
+
+
+def get_projection_plan(schema: "SectionSchema", columns: Optional[Iterable[str]] = None) -> ProjectionPlan:
+    """Get a projection plan from the shared process-wide cache"""
+    return _default_cache.get(schema, columns)
@@ -0,0 +1,86 @@
+"""Pre-serialized form and table UI definitions per section schema"""
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .fingerprint_cache import FingerprintCache
+from .manifest import etag_matches
+
+if TYPE_CHECKING:
+    from .section_schema import SectionSchema
+
+
+class SectionUIBundle:
+    """
+    Complete UI definition of a section, serialized once.
+
+    Contains the form input config of every field and a table cell
+    template per field (get_table_cell_template; clients fill in the
+    value per row). The JSON bytes and a content-hash ETag
+    are computed at construction, so editors can send If-None-Match and
+    skip the download while the section is unchanged.
+
+    Example:
+        >>> bundle = get_section_ui_bundle(schema)
+        >>> bundle.not_modified(request.headers.get("If-None-Match"))
+        True
+    """
+
+    def __init__(self, schema: "SectionSchema"):
+        self.fingerprint = schema.ui_fingerprint
+        self.table_name = schema.table_name
+
+        self.forms: List[Dict[str, Any]] = []
+        self.columns: List[Dict[str, Any]] = []
+
+        for field in schema:
+            field_config = field.field_config
+            self.forms.append({
+                "handle": field.handle,
+                "field_type": field.field_type.handle,
+                **field.field_type.get_form_input_config(field.settings, field_config),
+            })
+            self.columns.append({
+                "handle": field.handle,
+                "label": field.label,
+                **field.field_type.get_table_cell_template(field.settings, field_config),
+            })
+
+        self.json_bytes: bytes = json.dumps(
+            {"section": self.table_name, "forms": self.forms, "columns": self.columns},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        ).encode("utf-8")
+        self.etag: str = f'"{hashlib.sha256(self.json_bytes).hexdigest()[:32]}"'
+
+    def not_modified(self, if_none_match: Optional[str]) -> bool:
+        """Whether a client holding If-None-Match already has this bundle"""
+        return etag_matches(self.etag, if_none_match)
+
+    def __repr__(self) -> str:
+        return f"<SectionUIBundle(table='{self.table_name}', etag={self.etag})>"
+
+
+class SectionUIBundleCache(FingerprintCache[SectionUIBundle]):
+    """
+    LRU cache of SectionUIBundles keyed by the schema's ui_fingerprint.
+
+    Example:
+        >>> cache = SectionUIBundleCache()
+        >>> cache.get(schema) is cache.get(schema)
+        True
+    """
+
+    def get(self, schema: "SectionSchema") -> SectionUIBundle:
+        """Get the bundle for a schema, building it on first use"""
+        return self.get_or_create(schema.ui_fingerprint, lambda: SectionUIBundle(schema))
+
+
+_default_cache = SectionUIBundleCache()
+
+
+def get_section_ui_bundle(schema: "SectionSchema") -> SectionUIBundle:
+    """Get the UI bundle for a schema from the shared process-wide cache"""
+    return _default_cache.get(schema)
@@ -8,6 +8,7 @@ from .validators import (
     validate_url,
     validate_uuid
 )
+from .async_validation import AsyncChecker, AsyncValidationPipeline
 
 __all__ = [
     "validate_string_length",
@@ -15,5 +16,7 @@ __all__ = [
     "validate_regex_pattern",
     "validate_email",
     "validate_url",
-    "validate_uuid"
+    "validate_uuid",
+    "AsyncChecker",
+    "AsyncValidationPipeline"
 ]
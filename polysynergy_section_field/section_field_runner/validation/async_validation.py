@@ -0,0 +1,199 @@
+"""Async validation stage for I/O-bound checks (database lookups etc.)"""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from polysynergy_section_field.section_field_runner.section_schema import SectionSchema
+
+
+def _freeze(value: Any) -> str:
+    """Hashable, order-independent representation of a JSON-like value"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class AsyncChecker(ABC):
+    """
+    An I/O-bound check for values of one field type.
+
+    Checkers run after the synchronous validate() passed, so they only see
+    well-formed, non-null values.
+
+    The context dict describes where the value lives:
+    - table_name: Section table
+    - schema_name: Schema of the section table
+    - field_name: Column/handle of the field
+    - entry_id: Id of the entry being saved ("id" key of the entry), None for new entries
+    - entry_index: Position of the entry in the validated batch
+
+    Example:
+        >>> class NotReservedChecker(AsyncChecker):
+        ...     async def check(self, value, settings, context):
+        ...         if await is_reserved(value):
+        ...             return (False, "This value is reserved")
+        ...         return (True, None)
+    """
+
+    @abstractmethod
+    async def check(
+        self,
+        value: Any,
+        settings: Optional[Dict],
+        context: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Check a value.
+
+        Returns:
+            Tuple of (is_valid, error_message), like FieldType.validate
+        """
+        pass
+
+    def cache_key(self, value: Any, settings: Optional[Dict], context: Dict[str, Any]) -> Hashable:
+        """
+        Key identifying this check within a batch.
+
+        Checks with equal keys run once and share their result. Override if
+        the result depends on more (or less) than table, field, value and
+        settings.
+        """
+        return (context.get("table_name"), context.get("field_name"), _freeze(value), _freeze(settings))
+
+    def batch_unique_key(self, value: Any, settings: Optional[Dict], context: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Key that must be unique across the entries of one batch, or None.
+
+        Override for uniqueness checks: a database lookup cannot see other
+        entries of the same batch, so when two entries share a key the
+        later one fails without running check().
+        """
+        return None
+
+    def batch_duplicate_error(self, value: Any) -> str:
+        """Error for a value already used by another entry of the batch"""
+        return f"'{value}' is used by another entry in this batch"
+
+
+class _CheckBatch:
+    """Shared state for one validation batch: concurrency limit and coalesced checks"""
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.tasks: Dict[Hashable, asyncio.Future] = {}
+        self.claims: Dict[Hashable, Any] = {}
+
+    async def run(self, checker: AsyncChecker, value: Any, settings: Optional[Dict], context: Dict[str, Any]):
+        async with self.semaphore:
+            return await checker.check(value, settings, context)
+
+
+class _BatchChecker(AsyncChecker):
+    """Wraps a checker so identical checks in a batch run once, under the batch's limit"""
+
+    def __init__(self, checker: AsyncChecker, batch: _CheckBatch):
+        self.checker = checker
+        self.batch = batch
+
+    async def check(self, value, settings, context):
+        unique_key = self.checker.batch_unique_key(value, settings, context)
+        if unique_key is not None:
+            # Claimed before any check is coalesced, so duplicates are seen
+            owner = self.batch.claims.setdefault((id(self.checker), unique_key), context.get("entry_index"))
+            if owner != context.get("entry_index"):
+                return (False, self.checker.batch_duplicate_error(value))
+
+        key = (id(self.checker), self.checker.cache_key(value, settings, context))
+        task = self.batch.tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.batch.run(self.checker, value, settings, context))
+            self.batch.tasks[key] = task
+        return await task
+
+
+class AsyncValidationPipeline:
+    """
+    Runs async checkers for all fields of one or more entries concurrently.
+
+    Checkers are registered per field type handle. Within one call to
+    validate_entry/validate_entries, at most `concurrency` checks are in
+    flight and duplicate checks (same checker and cache_key) run only once.
+
+    Example:
+        >>> pipeline = AsyncValidationPipeline(concurrency=8)
+        >>> pipeline.register("slug", SlugUniquenessChecker(slug_exists))
+        >>> errors = await pipeline.validate_entry(schema, {"title": "Hello", "slug": "hello"})
+        >>> errors
+        {'slug': "Slug 'hello' is already in use"}
+    """
+
+    def __init__(self, concurrency: int = 10):
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.concurrency = concurrency
+        self._checkers: Dict[str, List[AsyncChecker]] = {}
+
+    def register(self, field_type_handle: str, checker: AsyncChecker) -> None:
+        """Register a checker for all fields of the given field type"""
+        self._checkers.setdefault(field_type_handle, []).append(checker)
+
+    def get_checkers(self, field_type_handle: str) -> List[AsyncChecker]:
+        """Checkers registered for a field type"""
+        return list(self._checkers.get(field_type_handle, []))
+
+    async def validate_entry(self, schema: "SectionSchema", entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Validate one entry.
+
+        Only fields present in the entry are validated.
+
+        Returns:
+            Dict of field handle to error message; empty if the entry is valid
+        """
+        return (await self.validate_entries(schema, [entry]))[0]
+
+    async def validate_entries(
+        self,
+        schema: "SectionSchema",
+        entries: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """
+        Validate a batch of entries, sharing duplicate checks across the batch.
+
+        Returns:
+            One error dict per entry, in input order
+        """
+        entries = list(entries)
+        batch = _CheckBatch(self.concurrency)
+        wrapped = {
+            handle: [_BatchChecker(checker, batch) for checker in checkers]
+            for handle, checkers in self._checkers.items()
+        }
+
+        jobs = []
+        for index, entry in enumerate(entries):
+            for field in schema.fields:
+                if field.handle not in entry:
+                    continue
+                context = {
+                    "table_name": schema.table_name,
+                    "schema_name": schema.schema_name,
+                    "field_name": field.handle,
+                    "entry_id": entry.get("id"),
+                    "entry_index": index,
+                }
+                jobs.append((index, field.handle, field.field_type.avalidate(
+                    entry[field.handle],
+                    field.settings,
+                    wrapped.get(field.field_type.handle),
+                    context
+                )))
+
+        results = await asyncio.gather(*(job[2] for job in jobs))
+
+        errors: List[Dict[str, str]] = [{} for _ in entries]
+        for (index, handle, _), (is_valid, error) in zip(jobs, results):
+            if not is_valid:
+                errors[index][handle] = error
+        return errors
@@ -0,0 +1,95 @@
+from datetime import date, datetime, time, timezone
+
+import pytest
+
+from polysynergy_section_field.field_types.datetime import DateField, DateTimeField, TimeField
+from polysynergy_section_field.field_types.datetime.iso import (
+    parse_date,
+    parse_date_bounds,
+    parse_dates,
+    parse_datetime,
+    parse_datetimes,
+    parse_time,
+)
+
+
+@pytest.mark.parametrize("value", ["20251031", "2025-W44-5", "2025-304", "2025-10-31x"])
+def test_parse_date_rejects_non_extended_forms(value):
+    with pytest.raises(ValueError):
+        parse_date(value)
+    with pytest.raises(ValueError):
+        parse_dates([value])
+
+
+@pytest.mark.parametrize("value", ["20251031T103000Z", "2025-W44-5T10:30", "2025-10-31T1030"])
+def test_parse_datetime_rejects_non_extended_forms(value):
+    with pytest.raises(ValueError):
+        parse_datetime(value)
+    with pytest.raises(ValueError):
+        parse_datetimes([value])
+
+
+def test_parse_datetime_normalizes_offsets_to_utc():
+    assert parse_datetime("2025-10-31T12:30:00+02:00") == datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc)
+    assert parse_datetimes(["2025-10-31 10:30Z", None]) == [datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc), None]
+
+
+def test_parse_time_requires_colons():
+    assert parse_time("10:30") == time(10, 30)
+    assert parse_time("10:30:15.5+02:00") == time(10, 30, 15, 500000)
+    with pytest.raises(ValueError):
+        parse_time("1030")
+
+
+@pytest.mark.parametrize("field, stored", [
+    (DateField(), date(2025, 10, 31)),
+    (DateTimeField(), datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc)),
+    (TimeField(), time(10, 30)),
+])
+def test_none_passes_through(field, stored):
+    assert field.serialize(None) is None
+    assert field.deserialize(None) is None
+    assert field.deserialize(field.serialize(stored)) == stored
+
+
+def test_date_bounds_must_be_strings():
+    with pytest.raises(ValueError):
+        parse_date_bounds(20251031, None)
+    assert parse_date_bounds("2025-01-01", None) == (date(2025, 1, 1), None)
+
+
+@pytest.mark.parametrize("settings", [{"minDate": 20250101}, {"maxDate": ["2025-12-31"]}, {"minDate": "20250101"}])
+def test_validate_reports_invalid_bounds(settings):
+    assert DateField().validate("2025-10-31", settings) == (False, "Invalid minDate/maxDate setting")
+
+
+def test_validate_checks_bounds():
+    settings = {"minDate": "2025-01-01", "maxDate": "2025-12-31"}
+    assert DateField().validate("2025-10-31", settings) == (True, None)
+    assert DateField().validate("2026-01-01", settings)[0] is False
+    assert DateField().validate("20251031", settings)[0] is False
+
+
+def test_serialize_returns_values_a_driver_can_bind():
+    assert DateField().serialize("2025-10-31") == date(2025, 10, 31)
+    assert TimeField().serialize("10:30") == time(10, 30)
+    assert DateTimeField().serialize("2025-10-31T12:30:00+02:00") == datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc)
+    assert DateTimeField().serialize_many(["2025-10-31T10:30:00Z", None]) == [
+        datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc), None
+    ]
+
+
+def test_naive_input_uses_the_default_timezone():
+    field = DateTimeField()
+    settings = {"defaultTimezone": "Europe/Amsterdam"}
+    winter = datetime(2025, 11, 1, 9, 0, tzinfo=timezone.utc)
+    assert field.serialize("2025-11-01T10:00:00", settings) == winter
+    assert field.serialize_many(["2025-11-01T10:00:00"], settings) == [winter]
+    assert field.serialize("2025-11-01T10:00:00", {"defaultTimezone": "-05:00"}).hour == 15
+    assert field.serialize("2025-11-01T10:00:00Z", settings).hour == 10
+
+
+def test_unknown_default_timezone_fails_validation():
+    valid, error = DateTimeField().validate("2025-11-01T10:00:00", {"defaultTimezone": "Mars/Olympus"})
+    assert not valid
+    assert "Unknown timezone" in error
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from polysynergy_section_field.field_types.datetime.vectorized import (
+    bucket,
+    bucket_counts,
+    range_mask,
+    to_datetime64,
+    to_iso_strings,
+)
+
+
+def test_offsets_are_normalised_to_utc():
+    array = to_datetime64([
+        "2025-10-31T12:30:00+02:00",
+        "2025-10-31 10:30:00+02",
+        "2025-10-31T05:00:00-0530",
+        "2025-10-31T10:30:00Z",
+        None,
+    ])
+    assert array.dtype == np.dtype("datetime64[us]")
+    assert to_iso_strings(array) == [
+        "2025-10-31T10:30:00.000000Z",
+        "2025-10-31T08:30:00.000000Z",
+        "2025-10-31T10:30:00.000000Z",
+        "2025-10-31T10:30:00.000000Z",
+        None,
+    ]
+
+
+def test_datetime_objects_are_converted_to_utc():
+    aware = datetime(2025, 10, 31, 12, 0, tzinfo=timezone.utc)
+    array = to_datetime64([aware], unit="s")
+    assert array[0] == np.datetime64("2025-10-31T12:00:00", "s")
+
+
+def test_unsupported_values_are_rejected():
+    with pytest.raises(ValueError, match="Cannot convert int"):
+        to_datetime64([1730370000])
+
+
+def test_week_buckets_start_on_monday():
+    array = to_datetime64(["2025-10-31T10:00:00Z", "2025-11-02T23:59:00Z", "2025-11-03T00:00:00Z", None])
+    starts = bucket(array, "week")
+    assert starts[:3].tolist() == [
+        np.datetime64("2025-10-27", "D").item(),
+        np.datetime64("2025-10-27", "D").item(),
+        np.datetime64("2025-11-03", "D").item(),
+    ]
+    assert np.isnat(starts[3])
+
+
+def test_buckets_follow_the_local_offset():
+    array = to_datetime64(["2025-10-31T23:30:00Z"])
+    assert bucket(array, "day")[0] == np.datetime64("2025-10-31")
+    assert bucket(array, "day", offset_minutes=120)[0] == np.datetime64("2025-11-01")
+    with pytest.raises(ValueError, match="Unknown bucket unit"):
+        bucket(array, "quarter")
+
+
+def test_range_mask_is_half_open_and_skips_nat():
+    array = to_datetime64(["2025-10-01T00:00:00Z", "2025-10-15T00:00:00Z", "2025-11-01T00:00:00Z", None])
+    mask = range_mask(array, "2025-10-01T00:00:00Z", "2025-11-01T00:00:00+00:00")
+    assert mask.tolist() == [True, True, False, False]
+    assert range_mask(array).tolist() == [True, True, True, False]
+
+
+def test_bucket_counts_ignore_nat():
+    array = to_datetime64(["2025-10-01T08:00:00Z", "2025-10-01T09:00:00Z", "2025-10-03T00:00:00Z", None])
+    starts, counts = bucket_counts(array, "day")
+    assert starts.tolist() == [np.datetime64("2025-10-01").item(), np.datetime64("2025-10-03").item()]
+    assert counts.tolist() == [2, 1]
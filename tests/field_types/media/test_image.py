@@ -0,0 +1,83 @@
+import io
+import struct
+
+import pytest
+
+from polysynergy_section_field.field_types.media import ImageField, UploadRejected
+
+
+def png(width, height, padding=0):
+    return (
+        b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR"
+        + struct.pack(">II", width, height) + b"\x08\x06\x00\x00\x00" + b"\x00" * padding
+    )
+
+
+class OneWayStream(io.RawIOBase):
+    """Readable stream that cannot seek, like a socket or pipe"""
+
+    def __init__(self, data):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        data = self._buffer.read(len(target))
+        target[:len(data)] = data
+        return len(data)
+
+
+def test_valid_upload_stream_is_left_at_its_start():
+    stream = io.BytesIO(png(800, 600, padding=500))
+    assert ImageField().validate(stream, {"maxWidth": 1024}) == (True, None)
+    assert stream.tell() == 0
+
+
+@pytest.mark.parametrize("settings, message", [
+    ({"maxFileSize": 100}, "too large"),
+    ({"allowedFormats": ["jpg"]}, "format 'png' is not allowed"),
+    ({"maxWidth": 640}, "too wide"),
+    ({"maxHeight": 480}, "too high"),
+])
+def test_upload_is_checked_against_settings(settings, message):
+    valid, error = ImageField().validate(png(800, 600, padding=500), settings)
+    assert not valid
+    assert message in error
+
+
+def test_stream_that_cannot_seek_is_rejected_unread():
+    stream = OneWayStream(png(10, 10, padding=10_000_000))
+    valid, error = ImageField().validate(stream, {"maxFileSize": 1000})
+    assert not valid
+    assert "seekable" in error
+    assert stream.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+def test_upload_validator_enforces_size_while_streaming():
+    data = png(10, 10, padding=10_000)
+    validator = ImageField().create_upload_validator({"maxFileSize": 1000}, "photo.png")
+    validator.feed(data[:600])
+    assert validator.info.format == "png"
+    with pytest.raises(UploadRejected, match="too large"):
+        validator.feed(data[600:1200])
+
+
+def test_upload_validator_checks_dimensions_and_hashes():
+    data = png(300, 200, padding=100)
+    validator = ImageField().create_upload_validator({"maxWidth": 400}, "photo.png")
+    for start in range(0, len(data), 16):
+        validator.feed(data[start:start + 16])
+    result = validator.finish()
+    assert (result.size, result.mime_type) == (len(data), "image/png")
+
+    validator = ImageField().create_upload_validator({"maxWidth": 200}, "photo.png")
+    with pytest.raises(UploadRejected, match="too wide"):
+        validator.feed(data)
+
+
+def test_upload_validator_rejects_non_images():
+    validator = ImageField().create_upload_validator(filename="notes.txt")
+    validator.feed(b"plain text")
+    with pytest.raises(UploadRejected, match="not a recognized image"):
+        validator.finish()
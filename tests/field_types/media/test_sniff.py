@@ -0,0 +1,32 @@
+import io
+import struct
+
+from polysynergy_section_field.field_types.media import sniff_image
+
+
+def jpeg(width, height, exif_bytes=0):
+    app1 = b"\xff\xe1" + struct.pack(">H", exif_bytes + 2) + b"\x00" * exif_bytes
+    sof = b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 3) + b"\x00" * 6
+    return b"\xff\xd8" + app1 + sof + b"\xff\xd9"
+
+
+def test_jpeg_dimensions_after_metadata():
+    info = sniff_image(jpeg(640, 480, exif_bytes=5000))
+    assert (info.format, info.width, info.height) == ("jpeg", 640, 480)
+    assert info.mime_type == "image/jpeg"
+
+
+def test_stream_is_rewound():
+    stream = io.BytesIO(b"GIF89a" + struct.pack("<HH", 32, 16) + b"\x00" * 8)
+    info = sniff_image(stream)
+    assert (info.format, info.width, info.height) == ("gif", 32, 16)
+    assert stream.tell() == 0
+
+
+def test_svg_without_dimensions():
+    info = sniff_image(b'<?xml version="1.0"?><svg xmlns="http://www.w3.org/2000/svg" width="10em">')
+    assert (info.format, info.width, info.height) == ("svg", None, None)
+
+
+def test_unknown_data():
+    assert sniff_image(b"not an image") is None
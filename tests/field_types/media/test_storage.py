@@ -0,0 +1,60 @@
+import hashlib
+import os
+
+import pytest
+
+from polysynergy_section_field.field_types.media import LocalContentStore, is_content_key
+from polysynergy_section_field.field_types.media.storage import get_storage_mode
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalContentStore(str(tmp_path))
+
+
+def test_identical_content_is_stored_once(store, tmp_path):
+    key = store.put([b"hello ", b"world"])
+    assert is_content_key(key)
+    assert store.path(key).startswith(str(tmp_path / "objects" / key[7:9] / key[9:11]))
+
+    assert store.put_bytes(b"hello world") == key
+    assert store.reference_count(key) == 2
+    assert os.listdir(tmp_path / "tmp") == []
+    with store.open(key) as stored:
+        assert stored.read() == b"hello world"
+
+
+def test_known_digest_skips_reading_chunks(store):
+    key = store.put_bytes(b"data")
+
+    def chunks():
+        raise AssertionError("chunks read for existing content")
+        yield b""
+
+    assert store.put(chunks(), hashlib.sha256(b"data").hexdigest()) == key
+    assert store.reference_count(key) == 2
+
+
+def test_content_is_deleted_with_last_reference(store):
+    key = store.put_bytes(b"data")
+    assert store.add_reference(key) == 2
+    assert store.release(key) == 1
+    assert store.exists(key)
+    assert store.release(key) == 0
+    assert not store.exists(key)
+    with pytest.raises(FileNotFoundError):
+        store.add_reference(key)
+
+
+def test_wrong_digest_is_rejected_and_cleaned_up(store, tmp_path):
+    with pytest.raises(ValueError, match="does not match"):
+        store.put([b"data"], "0" * 64)
+    assert os.listdir(tmp_path / "tmp") == []
+
+
+def test_keys_and_modes_are_validated(store):
+    with pytest.raises(ValueError, match="Invalid content key"):
+        store.path("sha256:../../etc/passwd")
+    assert get_storage_mode({"storageMode": "content"}) == "content"
+    with pytest.raises(ValueError):
+        get_storage_mode({"storageMode": "s3"})
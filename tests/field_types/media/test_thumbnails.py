@@ -0,0 +1,73 @@
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from polysynergy_section_field.field_types.media import thumbnails
+from polysynergy_section_field.field_types.media import (
+    PlaceholderBackend,
+    ThumbnailPipeline,
+    get_thumbnail_sizes,
+    thumbnail_key,
+)
+
+
+def png(width, height):
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    chunk = struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+    return b"\x89PNG\r\n\x1a\n" + chunk
+
+
+class FakeImage:
+    def __init__(self, mode):
+        self.mode = mode
+
+    def convert(self, mode):
+        return FakeImage(mode)
+
+    def save(self, output, format, quality):
+        output.write(f"{format}:{self.mode}".encode("ascii"))
+
+
+def test_sizes_and_keys():
+    sizes = get_thumbnail_sizes({"thumbnailSizes": [{"name": "card", "width": 320, "height": 200}]})
+    assert thumbnail_key("ab12", sizes[0]) == "ab12/card-320x200"
+    assert get_thumbnail_sizes({"generateThumbnails": False}) == ()
+    with pytest.raises(ValueError):
+        get_thumbnail_sizes({"thumbnailSizes": [{"name": "bad", "width": 0, "height": 10}]})
+
+
+def test_pipeline_skips_existing_sizes_and_never_upscales():
+    sizes = get_thumbnail_sizes()
+    job = ThumbnailPipeline.make_job(png(600, 200))
+    small = ThumbnailPipeline.make_job(png(100, 80))
+    stored = {thumbnail_key(job.sha256, sizes[0])}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pipeline = ThumbnailPipeline(PlaceholderBackend(), executor=executor)
+        results = pipeline.run([job, job, small], sizes, exists=stored.__contains__)
+
+    assert set(results[job.sha256]) == {"medium"}
+    assert results[job.sha256]["medium"].endswith(b":300x100")
+    assert results[small.sha256]["thumb"].endswith(b":100x80")
+
+
+def test_pillow_is_imported_lazily(monkeypatch):
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    assert thumbnails.PlaceholderBackend()
+    with pytest.raises(ImportError, match="thumbnails' extra"):
+        thumbnails.PillowBackend()
+
+
+@pytest.mark.parametrize("format, mode, expected", [
+    ("JPEG", "RGBA", b"JPEG:RGB"),
+    ("JPEG", "P", b"JPEG:RGB"),
+    ("JPEG", "RGB", b"JPEG:RGB"),
+    ("webp", "P", b"WEBP:RGBA"),
+    ("PNG", "RGBA", b"PNG:RGBA"),
+])
+def test_encode_drops_alpha_for_formats_without_it(monkeypatch, format, mode, expected):
+    monkeypatch.setattr(thumbnails, "_pillow_image", lambda: None)
+    assert thumbnails.PillowBackend(format).encode(FakeImage(mode)) == expected
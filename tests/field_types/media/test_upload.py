@@ -0,0 +1,56 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from polysynergy_section_field.field_types.media import UploadRejected, UploadValidator, avalidate_upload, validate_upload
+from polysynergy_section_field.field_types.media.upload import detect_mime_type
+
+PDF = b"%PDF-1.7\n" + b"0" * 2000
+
+
+def test_hash_and_type_of_chunked_upload():
+    chunks = [PDF[:100], memoryview(PDF[100:700]), bytearray(PDF[700:])]
+    result = validate_upload(chunks, filename="Report.PDF")
+    assert result.size == len(PDF)
+    assert result.sha256 == hashlib.sha256(PDF).hexdigest()
+    assert (result.mime_type, result.extension) == ("application/pdf", "pdf")
+
+
+def test_oversized_upload_is_rejected_at_the_crossing_chunk():
+    validator = UploadValidator({"maxFileSize": 1000}, filename="report.pdf")
+    validator.feed(PDF[:600])
+    with pytest.raises(UploadRejected, match="too large"):
+        validator.feed(PDF[600:1200])
+
+
+def test_extension_checked_before_any_content():
+    with pytest.raises(UploadRejected, match="extension 'exe'"):
+        UploadValidator(filename="setup.exe")
+
+
+def test_content_must_match_extension():
+    with pytest.raises(UploadRejected, match="does not match extension 'pdf'"):
+        validate_upload([b"plain text, not a pdf"], filename="notes.pdf")
+
+
+def test_mime_wildcards():
+    settings = {"allowedExtensions": [], "allowedMimeTypes": ["text/*"]}
+    assert validate_upload([b"hello"], settings, filename="notes").mime_type == "text/plain"
+    with pytest.raises(UploadRejected, match="application/pdf"):
+        validate_upload([PDF], settings, filename="report")
+
+
+def test_text_cut_inside_a_multibyte_character():
+    head = ("é" * 300).encode("utf-8")[:511]
+    assert detect_mime_type(head) == "text/plain"
+    assert detect_mime_type(b"\xff\xfe\x00binary") == "application/octet-stream"
+
+
+def test_async_stream():
+    async def chunks():
+        yield PDF[:10]
+        yield PDF[10:]
+
+    result = asyncio.run(avalidate_upload(chunks(), filename="report.pdf"))
+    assert result.sha256 == hashlib.sha256(PDF).hexdigest()
@@ -0,0 +1,96 @@
+import asyncio
+import uuid
+
+from polysynergy_section_field.field_types.relation.existence import (
+    RelationExistenceChecker,
+    RelationExistsChecker,
+    build_existence_query,
+)
+from polysynergy_section_field.field_types.relation.many_to_many import RelationManyToManyField
+from polysynergy_section_field.field_types.relation.many_to_one import RelationManyToOneField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+
+A1 = "0b6d5a2e-3f4c-4d8e-9a1b-2c3d4e5f6a71"
+A2 = "0b6d5a2e-3f4c-4d8e-9a1b-2c3d4e5f6a72"
+A3 = "0b6d5a2e-3f4c-4d8e-9a1b-2c3d4e5f6a73"
+A9 = "0b6d5a2e-3f4c-4d8e-9a1b-2c3d4e5f6a79"
+
+
+class AuthorTable:
+    """Fetcher over a fixed set of ids that records every lookup, returning uuid.UUID like asyncpg"""
+
+    def __init__(self, *existing):
+        self.existing = set(existing)
+        self.calls = []
+
+    async def __call__(self, related_section, ids):
+        self.calls.append((related_section, sorted(ids)))
+        return [uuid.UUID(entry_id) for entry_id in ids if entry_id in self.existing]
+
+
+POSTS = SectionSchema("posts", [
+    SectionField("author", RelationManyToOneField(), {"relatedSection": "authors"}),
+    SectionField("editors", RelationManyToManyField(), {"relatedSection": "authors"}),
+])
+
+
+def test_rows_are_checked_with_one_lookup_per_section():
+    authors = AuthorTable(A1, A2)
+    checker = RelationExistenceChecker(authors)
+    rows = [{"author": A1.upper(), "editors": [A2, A3]}, {"author": A3, "editors": None}, {}]
+
+    assert asyncio.run(checker.check_rows(POSTS, rows)) == [{"editors": [A3]}, {"author": [A3]}, {}]
+    assert authors.calls == [("authors", [A1, A2, A3])]
+
+
+def test_accepted_uuid_spellings_match_canonical_ids():
+    authors = AuthorTable(A1)
+    checker = RelationExistenceChecker(authors)
+    spellings = [A1.replace("-", ""), "{" + A1 + "}", "urn:uuid:" + A1, uuid.UUID(A1)]
+
+    assert asyncio.run(checker.find_missing("authors", spellings)) == set()
+    assert authors.calls == [("authors", [A1])]
+
+
+def test_malformed_ids_are_missing_without_a_lookup():
+    authors = AuthorTable(A1)
+    checker = RelationExistenceChecker(authors)
+    rows = [{"author": "not-a-uuid", "editors": [A1, "12"]}]
+
+    assert asyncio.run(checker.check_rows(POSTS, rows)) == [{"author": ["not-a-uuid"], "editors": ["12"]}]
+    assert authors.calls == [("authors", [A1])]
+
+    assert asyncio.run(checker.find_missing("authors", ["nope"])) == {"nope"}
+    assert len(authors.calls) == 1
+
+
+def test_negative_cache_until_marked_present():
+    authors = AuthorTable()
+    checker = RelationExistenceChecker(authors)
+
+    assert asyncio.run(checker.find_missing("authors", [A9])) == {A9}
+    assert asyncio.run(checker.find_missing("authors", [A9])) == {A9}
+    assert len(authors.calls) == 1
+
+    checker.mark_present("authors", [A9.upper()])
+    assert asyncio.run(checker.find_missing("authors", [A9])) == set()
+    checker.invalidate("authors", [uuid.UUID(A9)])
+    assert asyncio.run(checker.find_missing("authors", [A9])) == {A9}
+    assert len(authors.calls) == 2
+
+
+def test_bounded_caches_evict_oldest():
+    authors = AuthorTable(A1, A2, A3)
+    checker = RelationExistenceChecker(authors, max_present=2)
+    asyncio.run(checker.find_missing("authors", [A1, A2, A3]))
+    asyncio.run(checker.find_missing("authors", [A1]))
+    assert authors.calls[-1] == ("authors", [A1])
+
+
+def test_async_checker_adapter():
+    checker = RelationExistsChecker(RelationExistenceChecker(AuthorTable(A1)))
+    assert asyncio.run(checker.check([A1, A2], {"relatedSection": "authors"}, {})) == (
+        False, f"Related entries do not exist: {A2}"
+    )
+    assert asyncio.run(checker.check(A1, {}, {})) == (True, None)
+    assert build_existence_query("authors", None) == 'SELECT "id" FROM "authors" WHERE "id" = ANY($1::uuid[])'
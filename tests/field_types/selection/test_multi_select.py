@@ -0,0 +1,71 @@
+import pytest
+
+from polysynergy_section_field.field_types.selection import MultiSelectField
+from polysynergy_section_field.field_types.selection.option_codes import get_option_codes, pack_options
+
+field = MultiSelectField()
+
+
+def bitmask(options, previous=None):
+    return field.with_option_codes({"options": options, "storageMode": "bitmask"}, previous)
+
+
+def test_pack_and_unpack_in_option_order():
+    settings = bitmask(["a", "b", "c"])
+
+    assert field.serialize(["c", "a"], settings) == 0b101
+    assert field.deserialize(0b101, settings) == ["a", "c"]
+    assert field.deserialize_many([0b111, None], settings) == [["a", "b", "c"], None]
+
+
+def test_bits_survive_reordering():
+    settings = bitmask(["a", "b", "c"])
+    reordered = field.with_option_codes({**settings, "options": ["c", "b", "a"]}, settings)
+
+    assert field.serialize(["a"], reordered) == field.serialize(["a"], settings) == 1
+
+
+def test_strings_are_not_packed_per_character():
+    settings = bitmask(["a", "b", "ab"])
+
+    with pytest.raises(ValueError, match="list"):
+        field.serialize("ab", settings)
+    with pytest.raises(ValueError, match="list"):
+        pack_options("a", settings)
+
+
+def test_code_64_is_the_sign_bit():
+    settings = bitmask([str(index) for index in range(64)])
+
+    assert field.serialize(["63"], settings) == -2 ** 63
+    assert field.deserialize(-2 ** 63, settings) == ["63"]
+
+
+def test_removed_bits_are_cleared_and_reused():
+    full = bitmask([str(index) for index in range(64)])
+    replaced = field.with_option_codes({**full, "options": ["new"]}, full)
+
+    assert get_option_codes(replaced) == {"new": 1}
+    assert field.get_migration_sql("tags", replaced) == '"tags" BIGINT'
+    assert field.get_options_migration_sql("t", "tags", full, replaced) == [
+        'UPDATE t SET "tags" = "tags" & ~(-1)::bigint WHERE ("tags" & (-1)::bigint) <> 0;'
+    ]
+
+
+def test_bitmask_filters():
+    settings = bitmask(["a", "b"])
+    params = []
+
+    assert field.compile_filter("tags", "contains_all", ["a", "b"], params, settings) == '("tags" & $1) = $1'
+    assert field.compile_filter("tags", "contains_any", ["b"], params, settings) == '("tags" & $2) <> 0'
+    assert field.compile_filter("tags", "is_empty", None, params, settings) == '"tags" = 0'
+    assert params == [3, 2]
+    assert field.get_index_sql("t", "tags", settings) is None
+
+
+def test_jsonb_mode_is_unchanged():
+    params = []
+
+    assert field.serialize(["a"], {"options": ["a"]}) == ["a"]
+    assert field.compile_filter("tags", "contains_any", ["a"], params, {"options": ["a"]}) == '"tags" ?| $1::text[]'
+    assert params == [["a"]]
@@ -0,0 +1,98 @@
+import pytest
+
+from polysynergy_section_field.field_types.selection import SelectField
+from polysynergy_section_field.field_types.selection.option_codes import (
+    assign_option_codes,
+    get_option_codes,
+    update_option_codes,
+)
+
+field = SelectField()
+
+
+def smallint(options, previous=None):
+    return field.with_option_codes({"options": options, "storageMode": "smallint"}, previous)
+
+
+def test_reordering_options_keeps_codes():
+    settings = smallint(["draft", "published"])
+    reordered = field.with_option_codes({**settings, "options": ["published", "draft"]}, settings)
+
+    assert field.serialize("draft", settings) == field.serialize("draft", reordered) == 1
+    assert field.deserialize(1, reordered) == "draft"
+
+
+def test_smallint_serialize_checks_values_and_codes():
+    settings = smallint(["draft", "published"])
+
+    assert field.serialize(None, settings) is None
+    assert field.serialize(2, settings) == 2
+    for value in (True, 7, "archived"):
+        with pytest.raises(ValueError, match="Unknown option"):
+            field.serialize(value, settings)
+
+
+def test_smallint_requires_stored_codes():
+    settings = {"options": ["draft", "published"], "storageMode": "smallint"}
+
+    with pytest.raises(ValueError, match="optionCodes"):
+        field.serialize("draft", settings)
+    with pytest.raises(ValueError, match="optionCodes"):
+        field.get_migration_sql("status", settings)
+
+
+def test_removed_codes_are_not_reused():
+    settings = smallint(["a", "b", "c"])
+    removed = field.with_option_codes({**settings, "options": ["a", "c"]}, settings)
+    added = field.with_option_codes({**removed, "options": ["a", "c", "d"]}, removed)
+
+    assert get_option_codes(added) == {"a": 1, "c": 3, "d": 4}
+    assert field.deserialize(2, added) is None
+    assert field.get_options_migration_sql("t", "status", settings, removed) == [
+        'UPDATE t SET "status" = NULL WHERE "status" IN (2);'
+    ]
+
+
+def test_assign_option_codes_can_reuse_free_codes():
+    assert assign_option_codes(["c", "d"], {"a": 1, "b": 2, "c": 3}) == {"c": 3, "d": 4}
+    assert assign_option_codes(["c", "d"], {"a": 1, "b": 2, "c": 3}, reuse_codes=True) == {"c": 3, "d": 1}
+    assert update_option_codes({"options": ["x"]}) == {"x": 1}
+
+
+def test_serialize_many_round_trip_and_unknown_option():
+    settings = smallint(["a", "b"])
+
+    assert field.serialize_many(["b", None, "a"], settings) == [2, None, 1]
+    assert field.deserialize_many([2, None, 9], settings) == ["b", None, None]
+    with pytest.raises(ValueError, match="Unknown option 'z'"):
+        field.serialize_many(["z"], settings)
+
+
+def test_group_by_returns_option_values_in_smallint_mode():
+    settings = smallint(["a", "b"])
+
+    assert field.compile_group_by("status", "value", [], settings) == (
+        "CASE \"status\" WHEN 1 THEN 'a' WHEN 2 THEN 'b' END"
+    )
+    assert field.compile_group_by("status", "value", [], {"options": ["a"]}) == '"status"'
+
+
+def test_enum_migrations():
+    settings = {"options": ["a", "b"], "storageMode": "enum"}
+    added = {**settings, "options": ["a", "b", "it's"]}
+
+    assert field.get_migration_sql("status", settings, True, table_name="posts") == '"status" "posts_status_enum" NOT NULL'
+    assert field.get_options_migration_sql("posts", "status", settings, added) == [
+        "ALTER TYPE \"posts_status_enum\" ADD VALUE IF NOT EXISTS 'it''s';"
+    ]
+    with pytest.raises(ValueError):
+        field.get_migration_sql("status", settings)
+
+
+def test_switch_from_text_to_smallint_maps_values():
+    text = {"options": ["a", "b"]}
+    statements = field.get_options_migration_sql("t", "s", text, smallint(["a", "b"], text))
+
+    assert statements == [
+        "ALTER TABLE t ALTER COLUMN \"s\" TYPE SMALLINT USING CASE \"s\"::text WHEN 'a' THEN 1 WHEN 'b' THEN 2 END;"
+    ]
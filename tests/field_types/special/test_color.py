@@ -0,0 +1,48 @@
+import pytest
+
+from polysynergy_section_field.field_types.special.color import ColorField
+from polysynergy_section_field.field_types.special.color_codec import pack_color, parse_color, unpack_color
+
+
+@pytest.mark.parametrize("settings, expected", [
+    (None, "VARCHAR(7)"),
+    ({"format": "hex"}, "VARCHAR(7)"),
+    ({"allowAlpha": True}, "VARCHAR(9)"),
+    ({"format": "rgba"}, "VARCHAR(32)"),
+    ({"storageMode": "integer"}, "INTEGER"),
+])
+def test_column_type_follows_settings(settings, expected):
+    field = ColorField()
+    assert field.get_postgres_type(settings) == expected
+    assert field.get_migration_sql("color", settings) == f'"color" {expected}'
+
+
+def test_format_migration_only_widens_text_columns():
+    field = ColorField()
+    assert field.get_format_migration_sql("custom.posts", "color", {}, {"allowAlpha": True}) == [
+        'ALTER TABLE custom.posts ALTER COLUMN "color" TYPE VARCHAR(9);'
+    ]
+    assert field.get_format_migration_sql("posts", "color", {"format": "rgb"}, {}) == []
+    assert field.get_format_migration_sql("posts", "color", {}, {"format": "hex"}) == []
+
+
+def test_format_migration_rejects_storage_mode_switch():
+    with pytest.raises(ValueError, match="storage mode is not supported in place"):
+        ColorField().get_format_migration_sql("posts", "color", {}, {"storageMode": "integer"})
+    with pytest.raises(ValueError, match="serialize_many"):
+        ColorField().get_format_migration_sql("posts", "color", {"storageMode": "integer"}, {"format": "rgb"})
+
+
+@pytest.mark.parametrize("allow_alpha", [False, True])
+def test_packing_round_trips(allow_alpha):
+    rgba = parse_color("#11223380" if allow_alpha else "#112233")
+    assert unpack_color(pack_color(rgba, allow_alpha), allow_alpha) == rgba
+
+
+def test_integer_mode_round_trip_and_order():
+    field = ColorField()
+    settings = {"storageMode": "integer", "allowAlpha": True, "format": "rgba"}
+    low, high = field.serialize("#00000080", settings), field.serialize("#ffffffff", settings)
+    assert low < high
+    assert field.deserialize(low, settings) == field.deserialize_many([low], settings)[0]
+    assert field.deserialize(None, settings) is None
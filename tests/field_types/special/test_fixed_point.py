@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+import pytest
+
+from polysynergy_section_field.field_types.special.currency import CurrencyField
+from polysynergy_section_field.field_types.special.fixed_point import (
+    from_minor_units,
+    sum_minor_units,
+    to_minor_units_many,
+)
+from polysynergy_section_field.field_types.special.percentage import PercentageField
+
+
+@pytest.mark.parametrize("field, settings, expected", [
+    (CurrencyField(), None, "NUMERIC(10,2)"),
+    (CurrencyField(), {"decimalPlaces": 4}, "NUMERIC(12,4)"),
+    (CurrencyField(), {"decimalPlaces": 0}, "NUMERIC(8,0)"),
+    (PercentageField(), None, "NUMERIC(5,2)"),
+    (PercentageField(), {"decimalPlaces": 1}, "NUMERIC(4,1)"),
+])
+def test_postgres_type_follows_decimal_places(field, settings, expected):
+    assert field.get_postgres_type(settings) == expected
+    assert field.get_migration_sql("amount", settings, True) == f'"amount" {expected} NOT NULL'
+
+
+def test_default_postgres_type_matches_default_settings():
+    for field in (CurrencyField(), PercentageField()):
+        assert field.get_postgres_type() == field.postgres_type
+
+
+def test_fixed_point_round_trip():
+    field = CurrencyField()
+    settings = {"fixedPoint": True, "decimalPlaces": 2}
+    assert field.serialize(1999, settings) == Decimal("19.99")
+    assert field.deserialize(Decimal("19.99"), settings) == 1999
+    assert field.deserialize_many([Decimal("0.05"), None], settings) == [5, None]
+    with pytest.raises(ValueError, match="minor units"):
+        field.serialize(19.99, settings)
+
+
+def test_sum_of_minor_units_is_exact():
+    prices = to_minor_units_many(["0.10"] * 1000 + [None, "19.99"])
+    total = sum_minor_units(prices)
+    assert total == 11999
+    assert from_minor_units(total) == Decimal("119.99")
+    assert sum(0.10 for _ in range(1000)) != 100.0
+    assert sum_minor_units([]) == 0
@@ -0,0 +1,75 @@
+import pytest
+
+from polysynergy_section_field.field_types.text import TextAreaField, TextField
+from polysynergy_section_field.field_types.text.search import (
+    build_search_sql,
+    compile_search,
+    get_search_column_sql,
+    get_search_index_sql,
+)
+from polysynergy_section_field.section_field_runner.section_schema import SectionField, SectionSchema
+
+
+def test_generated_column_uses_the_configured_language():
+    sql = get_search_column_sql("body", {"fullTextSearch": True, "searchLanguage": "dutch"})
+    assert sql == (
+        '"body_tsv" TSVECTOR GENERATED ALWAYS AS '
+        "(to_tsvector('dutch'::regconfig, coalesce(\"body\", ''))) STORED"
+    )
+    assert get_search_index_sql("articles", "body") == (
+        'CREATE INDEX idx_articles_body_tsv ON articles USING GIN ("body_tsv");'
+    )
+
+
+def test_unknown_language_is_rejected_before_reaching_ddl():
+    with pytest.raises(ValueError, match="Unsupported search language"):
+        get_search_column_sql("body", {"searchLanguage": "english'); DROP TABLE x; --"})
+
+
+def test_compile_search_binds_the_query_once():
+    params = ["existing"]
+    predicate, rank = compile_search("body", "postgres -mysql", params, {"searchLanguage": "english"})
+    assert predicate == '"body_tsv" @@ websearch_to_tsquery(\'english\'::regconfig, $2)'
+    assert rank == 'ts_rank_cd("body_tsv", websearch_to_tsquery(\'english\'::regconfig, $2))'
+    assert params == ["existing", "postgres -mysql"]
+
+
+def test_build_search_sql_on_the_section_table():
+    schema = SectionSchema("articles", [SectionField("title", TextField(), {"fullTextSearch": True})])
+    sql, params = build_search_sql(schema, "title", "hello", limit=10)
+    assert sql.startswith('SELECT "id", ts_rank_cd("title_tsv"')
+    assert 'FROM "custom"."articles" WHERE "title_tsv" @@' in sql
+    assert sql.endswith('ORDER BY "rank" DESC LIMIT $2')
+    assert params == ["hello", 10]
+
+
+def test_build_search_sql_on_a_side_table_is_schema_qualified():
+    settings = {"separateTable": True, "fullTextSearch": True}
+    schema = SectionSchema("articles", [SectionField("body", TextAreaField(), settings)], schema_name="tenant_1")
+    sql, params = build_search_sql(schema, "body", "hello")
+    assert sql.startswith('SELECT "entry_id" AS "id"')
+    assert 'FROM "tenant_1"."articles_body_bodies" WHERE' in sql
+    assert params == ["hello", 50]
+
+
+def test_build_search_sql_requires_search_to_be_enabled():
+    schema = SectionSchema("articles", [SectionField("title", TextField())])
+    with pytest.raises(ValueError, match="not enabled"):
+        build_search_sql(schema, "title", "hello")
+
+
+def test_tsvector_column_is_separate_from_the_field_column():
+    settings = {"fullTextSearch": True, "searchLanguage": "english"}
+    for field in (TextField(), TextAreaField()):
+        column = field.get_migration_sql("body", settings)
+        assert "," not in column and "TSVECTOR" not in column
+        assert field.get_tsvector_column_sql("body", settings).startswith('"body_tsv" TSVECTOR')
+        assert field.get_tsvector_column_sql("body", {}) is None
+
+
+def test_split_text_area_keeps_the_tsvector_in_its_side_table():
+    field = TextAreaField()
+    settings = {"separateTable": True, "fullTextSearch": True}
+    assert field.get_tsvector_column_sql("body", settings) is None
+    sql = field.get_side_table_sql("body", settings, table_name="articles")
+    assert '    "body" TEXT,\n    "body_tsv" TSVECTOR GENERATED ALWAYS AS' in sql
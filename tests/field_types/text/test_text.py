@@ -0,0 +1,32 @@
+import pytest
+
+from polysynergy_section_field.field_types.text.text import TextField
+
+
+def test_starts_with_requires_prefix_search():
+    field = TextField()
+    assert "starts_with" not in field.get_filter_operators()
+    assert field.get_index_sql("posts", "title") is None
+    with pytest.raises(ValueError, match="not supported"):
+        field.compile_filter("title", "starts_with", "Hel", [])
+
+
+@pytest.mark.parametrize("settings, ops", [
+    ({"prefixSearch": True}, "text_pattern_ops"),
+    ({"prefixSearch": True, "maxLength": 200}, "varchar_pattern_ops"),
+])
+def test_prefix_search_adds_pattern_index(settings, ops):
+    field = TextField()
+    assert field.get_index_sql("posts", "title", settings) == (
+        f'CREATE INDEX idx_posts_title_prefix ON posts("title" {ops});'
+    )
+    params = []
+    assert field.compile_filter("title", "starts_with", "50%_off", params, settings) == '"title" LIKE $1'
+    assert params == ["50\\%\\_off%"]
+
+
+def test_prefix_and_full_text_indexes_together():
+    statements = TextField().get_index_sql("posts", "title", {"prefixSearch": True, "fullTextSearch": True})
+    lines = statements.splitlines()
+    assert len(lines) == 2
+    assert "text_pattern_ops" in lines[0] and "USING GIN" in lines[1]
@@ -0,0 +1,57 @@
+import pytest
+
+from polysynergy_section_field.field_types.text.text_area import TextAreaField
+
+SPLIT = {"separateTable": True, "fullTextSearch": True}
+
+
+def test_column_mode_returns_a_column_fragment():
+    field = TextAreaField()
+    settings = {"columnStorage": "external", "columnCompression": "lz4"}
+    assert field.get_migration_sql("body", settings, True) == '"body" TEXT STORAGE EXTERNAL COMPRESSION lz4 NOT NULL'
+    assert field.get_side_table_sql("body", settings) is None
+
+
+def test_split_mode_has_no_column_and_a_side_table():
+    field = TextAreaField()
+    assert field.get_migration_sql("body", SPLIT) is None
+    assert not field.has_column(SPLIT)
+
+    sql = field.get_side_table_sql("body", SPLIT, table_name="articles", schema_name="custom")
+    assert sql.startswith('-- Side table for body')
+    assert 'CREATE TABLE IF NOT EXISTS "custom"."articles_body_bodies" (' in sql
+    assert '"body" TEXT,' in sql
+    assert 'REFERENCES "custom"."articles"("id") ON DELETE CASCADE' in sql
+
+
+def test_side_table_keeps_section_placeholder_without_table_name():
+    sql = TextAreaField().get_side_table_sql("body", {"separateTable": True})
+    assert 'CREATE TABLE IF NOT EXISTS "{section}_body_bodies"' in sql
+    assert 'REFERENCES "{section}"("id")' in sql
+
+
+def test_body_statements_are_schema_qualified():
+    field = TextAreaField()
+    select = field.get_body_select_sql("articles", "body", SPLIT, schema_name="custom")
+    upsert = field.get_body_upsert_sql("articles", "body", SPLIT, schema_name="custom")
+    assert 'FROM "custom"."articles_body_bodies"' in select
+    assert upsert.startswith('INSERT INTO "custom"."articles_body_bodies"')
+    assert field.get_column_options_sql("articles", "body", {**SPLIT, "columnCompression": "lz4"}, "custom") == [
+        'ALTER TABLE "custom"."articles_body_bodies" ALTER COLUMN "body" SET COMPRESSION lz4;'
+    ]
+
+
+def test_split_filter_is_a_qualified_exists_subquery():
+    params = []
+    sql = TextAreaField().compile_filter("body", "is_null", None, params, SPLIT, "articles", "custom")
+    assert sql == (
+        'NOT EXISTS (SELECT 1 FROM "custom"."articles_body_bodies" WHERE '
+        '"custom"."articles_body_bodies"."entry_id" = "custom"."articles"."id" AND '
+        '"custom"."articles_body_bodies"."body" IS NOT NULL)'
+    )
+    assert params == []
+
+
+def test_split_filter_requires_table_name():
+    with pytest.raises(ValueError, match="section table name"):
+        TextAreaField().compile_filter("body", "is_not_null", None, [], SPLIT)
@@ -0,0 +1,62 @@
+import pytest
+
+from polysynergy_section_field.field_types.validated import PhoneField
+from polysynergy_section_field.field_types.validated.phone_numbers import (
+    normalize_phone,
+    normalize_phones,
+    resolve_calling_code,
+)
+
+
+@pytest.mark.parametrize("value, country, expected", [
+    ("06-1234 5678", "NL", "+31612345678"),
+    ("+1 (415) 555-2671", None, "+14155552671"),
+    ("0031 6 12345678", None, "+31612345678"),
+    ("011 44 20 7946 0958", "US", "+442079460958"),
+    ("02 1234 5678", "IT", "+390212345678"),
+])
+def test_normalize_phone(value, country, expected):
+    assert normalize_phone(value, country) == expected
+
+
+def test_normalize_phone_rejects_national_number_without_country():
+    with pytest.raises(ValueError, match="default country"):
+        normalize_phone("06 12345678")
+
+
+def test_resolve_calling_code_stops_at_first_complete_code():
+    assert resolve_calling_code("3161234") == ("31", ("NL",))
+    assert resolve_calling_code("999") is None
+
+
+def test_normalize_phones_parses_repeats_once_and_keeps_invalid():
+    values = ["0612345678", None, "bad", "0612345678"]
+    assert normalize_phones(values, "NL", strict=False, keep_invalid=True) == [
+        "+31612345678", None, "bad", "+31612345678"
+    ]
+    assert normalize_phones(values, "NL", strict=False)[2] is None
+    with pytest.raises(ValueError):
+        normalize_phones(values, "NL")
+
+
+def test_normalization_is_opt_in():
+    field = PhoneField()
+    assert field.validate("06 12345678", {}) == (True, None)
+    assert field.validate("+31 6 12345678 ext 12", {}) == (True, None)
+    assert field.serialize("06 12345678", {}) == "06 12345678"
+    assert field.get_index_sql("t", "phone", {}) is None
+
+
+def test_e164_format_normalizes_by_default():
+    field = PhoneField()
+    settings = {"format": "E.164", "defaultCountry": "NL"}
+    assert field.serialize("06 12345678", settings) == "+31612345678"
+    assert field.validate("12", settings)[0] is False
+    assert field.serialize("06 12345678", {**settings, "normalize": False}) == "06 12345678"
+
+
+def test_serialize_passes_through_values_it_cannot_normalize():
+    field = PhoneField()
+    settings = {"normalize": True}
+    assert field.serialize("06 12345678", settings) == "06 12345678"
+    assert field.serialize_many(["ext 12", "+31612345678"], settings) == ["ext 12", "+31612345678"]
@@ -0,0 +1,47 @@
+import asyncio
+
+from polysynergy_section_field.field_types.validated import SlugField, SlugUniquenessChecker
+from polysynergy_section_field.section_field_runner import SectionSchema
+from polysynergy_section_field.section_field_runner.section_schema import SectionField
+from polysynergy_section_field.section_field_runner.validation.async_validation import AsyncValidationPipeline
+
+# Slugs stored in the table, by entry id
+STORED = {"hello": "entry-1"}
+
+
+class FakeTable:
+    """exists() backed by STORED, recording each lookup"""
+
+    def __init__(self):
+        self.lookups = []
+
+    async def exists(self, context, slug):
+        self.lookups.append((slug, context["entry_id"]))
+        owner = STORED.get(slug)
+        return owner is not None and owner != context["entry_id"]
+
+
+def validate(entries):
+    table = FakeTable()
+    pipeline = AsyncValidationPipeline()
+    pipeline.register("slug", SlugUniquenessChecker(table.exists))
+    schema = SectionSchema("posts", [SectionField("slug", SlugField())])
+    return asyncio.run(pipeline.validate_entries(schema, entries)), table.lookups
+
+
+def test_entry_can_keep_its_own_slug():
+    errors, _ = validate([{"id": "entry-1", "slug": "hello"}])
+    assert errors == [{}]
+
+
+def test_slug_of_another_entry_is_rejected():
+    for entry in ({"id": "entry-2", "slug": "hello"}, {"slug": "hello"}):
+        errors, _ = validate([entry])
+        assert errors == [{"slug": "Slug 'hello' is already in use"}]
+
+
+def test_duplicates_within_a_batch_are_rejected_before_lookup():
+    errors, lookups = validate([{"slug": "fresh"}, {"slug": "fresh"}, {"slug": "other"}])
+
+    assert errors == [{}, {"slug": "Slug 'fresh' is used by another entry in this batch"}, {}]
+    assert sorted(lookups) == [("fresh", None), ("other", None)]
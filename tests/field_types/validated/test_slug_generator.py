@@ -0,0 +1,41 @@
+import asyncio
+
+from polysynergy_section_field.field_types.validated.slug_generator import FALLBACK_SLUG, SlugGenerator
+
+
+def test_year_like_slugs_are_not_taken_for_suffixes():
+    generator = SlugGenerator()
+    assert generator.allocate(["post", "post"], existing=["post", "post-2024"]) == ["post-2", "post-3"]
+
+
+def test_first_free_suffix_is_probed():
+    generator = SlugGenerator()
+    existing = ["hello", "hello-2", "hello-4"]
+    assert generator.allocate(["hello", "hello", "hello"], existing) == ["hello-3", "hello-5", "hello-6"]
+
+
+def test_prefix_is_slugified():
+    generator = SlugGenerator({"prefix": " Über Blog! "})
+    assert generator.prefix == "uber-blog"
+    assert generator.base_slug("Hello World") == "uber-blog-hello-world"
+    assert generator.base_slug("!!!") == f"uber-blog-{FALLBACK_SLUG}"
+
+
+def test_base_slug_leaves_room_for_suffix():
+    generator = SlugGenerator({"prefix": "blog"}, max_length=20)
+    assert len(generator.base_slug("a very long title indeed")) <= 12
+
+
+def test_assign_slugs_uses_one_prefix_query():
+    queries = []
+
+    async def fetch_existing(sql, params):
+        queries.append((sql, params))
+        return ["news-hello"]
+
+    entries = [{"title": "Hello"}, {"title": "Hello"}, {"title": "Other", "slug": "news-hello-2"}]
+    generator = SlugGenerator({"prefix": "news"})
+    asyncio.run(generator.assign_slugs(entries, "slug", "posts", fetch_existing))
+
+    assert [entry["slug"] for entry in entries] == ["news-hello-3", "news-hello-4", "news-hello-2"]
+    assert queries == [('SELECT "slug" FROM "custom"."posts" WHERE "slug" LIKE $1', ["news-hello%"])]
@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+
+from polysynergy_section_field.field_types.datetime import DateField
+from polysynergy_section_field.field_types.relation.one_to_many import RelationOneToManyField
+from polysynergy_section_field.field_types.text.text import TextField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.records.lazy_record import (
+    LazyRecord,
+    collect_touched_fields,
+    lazy_records,
+)
+
+
+class CountingDate(DateField):
+    calls = 0
+
+    def deserialize(self, value, settings=None):
+        CountingDate.calls += 1
+        return super().deserialize(value, settings)
+
+
+EVENTS = SectionSchema("event_items", [
+    SectionField("title", TextField()),
+    SectionField("starts_on", CountingDate()),
+    SectionField("talks", RelationOneToManyField(), {"relatedSection": "talks", "foreignKeyField": "event"}),
+])
+
+
+def test_lazy_record_deserializes_once_on_access():
+    CountingDate.calls = 0
+    records = lazy_records([["e1", "Launch", "2025-10-31"], ["e2", "Demo", None]], EVENTS)
+
+    assert CountingDate.calls == 0
+    assert records[0].starts_on == date(2025, 10, 31)
+    assert records[0]["starts_on"] == date(2025, 10, 31)
+    assert CountingDate.calls == 1
+    assert records[1].get("starts_on") is None
+    assert collect_touched_fields(records) == ["starts_on"]
+
+
+def test_lazy_record_mapping_protocol():
+    record = LazyRecord(["e1", "Launch", None], EVENTS)
+    assert "talks" not in record and "id" in record
+    assert record.get("talks", "n/a") == "n/a"
+    with pytest.raises(AttributeError, match="has no field 'talks'"):
+        record.talks
+    assert record.to_dict() == {"id": "e1", "title": "Launch", "starts_on": None}
+    assert record.touched_fields == ("title", "starts_on")
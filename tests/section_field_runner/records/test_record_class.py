@@ -0,0 +1,34 @@
+from datetime import date
+
+import pytest
+
+from polysynergy_section_field.field_types.datetime import DateField
+from polysynergy_section_field.field_types.relation.one_to_many import RelationOneToManyField
+from polysynergy_section_field.field_types.text.text import TextField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema, get_record_class
+from polysynergy_section_field.section_field_runner.records.record_class import build_record_class
+
+EVENTS = SectionSchema("event_items", [
+    SectionField("title", TextField()),
+    SectionField("starts_on", DateField()),
+    SectionField("talks", RelationOneToManyField(), {"relatedSection": "talks", "foreignKeyField": "event"}),
+])
+
+
+def test_record_class_has_slots_for_columns_only():
+    EventItemsRecord = get_record_class(EVENTS)
+    assert EventItemsRecord.__name__ == "EventItemsRecord"
+    assert EventItemsRecord.__slots__ == ("id", "title", "starts_on")
+
+    record = EventItemsRecord.from_row(["e1", "Launch", "2025-10-31"])
+    assert record.starts_on == date(2025, 10, 31)
+    assert dict(record) == {"id": "e1", "title": "Launch", "starts_on": date(2025, 10, 31)}
+    assert EventItemsRecord.from_dict({"id": "e1", "extra": 1}).title is None
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+@pytest.mark.parametrize("handle", ["to_dict", "class", "two words"])
+def test_unusable_handles_are_rejected(handle):
+    with pytest.raises(ValueError):
+        build_record_class(SectionSchema("things", [SectionField(handle, TextField())]))
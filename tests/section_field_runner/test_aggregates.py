@@ -0,0 +1,59 @@
+import pytest
+
+from polysynergy_section_field.field_types.datetime import DateField, DateTimeField
+from polysynergy_section_field.field_types.selection.select import SelectField
+from polysynergy_section_field.field_types.special.currency import CurrencyField
+from polysynergy_section_field.field_types.text.text_area import TextAreaField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.sql.aggregates import compile_aggregate_query
+
+STATUS = {
+    "options": [{"value": "draft", "label": "Draft"}, {"value": "live", "label": "Live"}],
+    "storageMode": "smallint",
+    "optionCodes": {"draft": 1, "live": 2},
+}
+
+ORDERS = SectionSchema("orders", [
+    SectionField("status", SelectField(), STATUS),
+    SectionField("total", CurrencyField()),
+    SectionField("placed_at", DateTimeField()),
+    SectionField("due_on", DateField()),
+    SectionField("notes", TextAreaField()),
+])
+
+
+def test_grouped_metrics_with_filters_and_limit():
+    sql, params = compile_aggregate_query(ORDERS, {
+        "metrics": [{"function": "count"}, {"field": "total", "function": "percentile", "percentile": 0.9}],
+        "groupBy": [{"field": "placed_at", "bucket": "week", "timezone": "Europe/Amsterdam"}],
+        "filters": [{"field": "status", "operator": "eq", "value": "live"}],
+        "limit": 10,
+    })
+    assert sql == (
+        "SELECT date_trunc('week', \"placed_at\", $1) AS \"placed_at_week\", count(*) AS \"count\", "
+        "percentile_cont($2::float8) WITHIN GROUP (ORDER BY \"total\") AS \"percentile_total\" "
+        "FROM \"custom\".\"orders\" WHERE (\"status\" = $3) GROUP BY 1 ORDER BY 1 LIMIT $4"
+    )
+    assert params == ["Europe/Amsterdam", 0.9, 2, 10]
+
+
+def test_smallint_select_groups_by_option_value():
+    sql, _ = compile_aggregate_query(ORDERS, {"groupBy": [{"field": "status"}]})
+    assert sql.startswith("SELECT CASE \"status\" WHEN 1 THEN 'draft' WHEN 2 THEN 'live' END AS \"status\"")
+
+
+def test_date_buckets_stay_dates():
+    sql, params = compile_aggregate_query(ORDERS, {"groupBy": [{"field": "due_on", "bucket": "month"}]})
+    assert "date_trunc('month', \"due_on\")::date AS \"due_on_month\"" in sql
+    assert params == []
+
+
+@pytest.mark.parametrize("request_, message", [
+    ({"metrics": [{"field": "notes", "function": "sum"}]}, "sum"),
+    ({"metrics": [{"function": "avg"}]}, "needs a field"),
+    ({"metrics": [{"field": "total", "function": "percentile", "percentile": 2}]}, "between 0 and 1"),
+    ({"groupBy": [{"field": "total", "bucket": "histogram", "min": 10, "max": 0, "buckets": 5}]}, "max > min"),
+])
+def test_invalid_requests(request_, message):
+    with pytest.raises(ValueError, match=message):
+        compile_aggregate_query(ORDERS, request_)
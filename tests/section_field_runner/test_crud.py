@@ -0,0 +1,46 @@
+import pytest
+
+from polysynergy_section_field.field_types.text.text import TextField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.sql.crud import MAX_IDENTIFIER_LENGTH, CrudStatements
+
+
+def articles(label="Title", table_name="articles"):
+    return SectionSchema(table_name, [SectionField("title", TextField(), is_required=True, label=label)])
+
+
+def test_ui_texts_only_change_the_ui_fingerprint():
+    before, after = articles("Title"), articles("Headline")
+    assert before.fingerprint == after.fingerprint
+    assert before.ui_fingerprint != after.ui_fingerprint
+    assert CrudStatements(before).statement_name("insert") == CrudStatements(after).statement_name("insert")
+
+
+def test_statement_name_fits_identifier_limit():
+    long_name = "research_" + "x" * 80
+    name = CrudStatements(articles(table_name=long_name)).statement_name("select_many")
+    assert len(name.encode("utf-8")) <= MAX_IDENTIFIER_LENGTH
+    assert name.endswith("_select_many_" + articles(table_name=long_name).fingerprint[:16])
+
+    other = CrudStatements(articles(table_name=long_name + "y")).statement_name("select_many")
+    assert other != name
+
+
+def test_statement_name_cuts_multibyte_names_on_character_boundaries():
+    name = CrudStatements(articles(table_name="ä" * 40)).statement_name("insert")
+    assert len(name.encode("utf-8")) <= MAX_IDENTIFIER_LENGTH
+    assert name.startswith("ä")
+
+
+def test_short_statement_names_are_unchanged():
+    statements = CrudStatements(articles())
+    assert statements.statement_name("insert") == f"articles_insert_{statements.fingerprint[:16]}"
+
+
+def test_args_and_rows():
+    statements = CrudStatements(articles())
+    assert statements.insert == 'INSERT INTO "custom"."articles" ("title") VALUES ($1) RETURNING "id"'
+    assert statements.update_args("6f1c", {"title": "Hello"}) == ["Hello", "6f1c"]
+    with pytest.raises(ValueError, match="missing: title"):
+        statements.update_args("6f1c", {})
+    assert statements.row_to_entry(["6f1c", None]) == {"id": "6f1c", "title": None}
@@ -0,0 +1,55 @@
+import threading
+
+from polysynergy_section_field.field_types.text.text import TextField
+from polysynergy_section_field.section_field_runner import FingerprintCache, SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.records.record_class import RecordClassCache
+from polysynergy_section_field.section_field_runner.sql.crud import CrudStatementCache
+from polysynergy_section_field.section_field_runner.sql.projection import ProjectionPlanCache
+from polysynergy_section_field.section_field_runner.ui_bundle import SectionUIBundleCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FingerprintCache(max_size=2)
+    cache.get_or_create("a", lambda: "A")
+    cache.get_or_create("b", lambda: "B")
+    cache.get_or_create("a", lambda: "never built")
+    cache.get_or_create("c", lambda: "C")
+
+    assert len(cache) == 2
+    assert cache.get_or_create("a", lambda: "rebuilt") == "A"
+    assert cache.get_or_create("b", lambda: "rebuilt") == "rebuilt"
+
+
+def test_concurrent_builds_keep_one_object():
+    cache = FingerprintCache()
+    barrier = threading.Barrier(4)
+    results = []
+
+    def build():
+        barrier.wait()
+        return object()
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_create("key", build))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(result) for result in results}) == 1
+
+
+def test_section_caches_share_the_helper():
+    schema = SectionSchema("articles", [SectionField("title", TextField())])
+    changed = SectionSchema("articles", [SectionField("title", TextField(), {"maxLength": 80})])
+
+    for cache in (CrudStatementCache(), RecordClassCache(), SectionUIBundleCache()):
+        assert isinstance(cache, FingerprintCache)
+        assert cache.get(schema) is cache.get(schema)
+        assert cache.get(changed) is not cache.get(schema)
+        cache.clear()
+        assert len(cache) == 0
+
+    plans = ProjectionPlanCache()
+    assert plans.max_size == 1024
+    assert plans.get(schema, ["title"]) is plans.get(schema, iter(["title"]))
+    assert plans.get(schema, ["title"]) is not plans.get(schema)
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from polysynergy_section_field.section_field_runner.manifest import (
+    etag_matches,
+    get_field_type_manifest,
+    reset_field_type_manifest,
+)
+
+
+@pytest.fixture
+def manifest():
+    reset_field_type_manifest()
+    yield get_field_type_manifest()
+    reset_field_type_manifest()
+
+
+def test_entries_are_read_only(manifest):
+    entry = manifest.get("currency")
+    with pytest.raises(TypeError):
+        entry["postgres_type"] = "TEXT"
+    assert json.loads(manifest.json_bytes)[0]["handle"] == manifest.entries[0]["handle"]
+
+
+def test_postgres_type_reports_default_and_effective_type(manifest):
+    assert manifest.get("currency")["postgres_type"] == "NUMERIC(10,2)"
+    assert manifest.get_postgres_type("currency", {"decimalPlaces": 4}) == "NUMERIC(12,4)"
+    assert manifest.get_postgres_type("percentage", {"decimalPlaces": 0}) == "NUMERIC(3,0)"
+    with pytest.raises(ValueError, match="Unknown field type"):
+        manifest.get_postgres_type("nope")
+
+
+def test_etag_matching(manifest):
+    assert manifest.not_modified(manifest.etag)
+    assert manifest.not_modified(f'"other", W/{manifest.etag}')
+    assert etag_matches(manifest.etag, "*")
+    assert not manifest.not_modified(None)
@@ -0,0 +1,117 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from polysynergy_section_field.field_types.datetime import DateField, DateTimeField
+from polysynergy_section_field.field_types.special.currency import CurrencyField
+from polysynergy_section_field.field_types.special.json_field import JsonField
+from polysynergy_section_field.field_types.text import TextField
+from polysynergy_section_field.field_types.text.text_area import TextAreaField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.sql.pagination import (
+    KeysetPagination,
+    decode_cursor,
+    encode_cursor,
+)
+
+ARTICLES = SectionSchema("articles", [
+    SectionField("published_at", DateTimeField()),
+    SectionField("body", TextAreaField()),
+    SectionField("meta", JsonField()),
+])
+
+PRODUCTS = SectionSchema("products", [
+    SectionField("name", TextField()),
+    SectionField("price", CurrencyField()),
+    SectionField("launched_on", DateField()),
+])
+
+ENTRY_ID = UUID("6f1c2d3e-0000-4000-8000-000000000001")
+
+
+@pytest.mark.parametrize("sort_value, expected", [
+    (datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc), "2025-10-31T10:30:00+00:00"),
+    (Decimal("19.99"), "19.99"),
+    (None, None),
+    (42, 42),
+])
+def test_cursor_round_trip(sort_value, expected):
+    cursor = encode_cursor("published_at:DESC", sort_value, ENTRY_ID)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "published_at:DESC") == (expected, str(ENTRY_ID))
+
+
+def test_cursor_is_bound_to_its_sort():
+    cursor = encode_cursor("published_at:DESC", 1, 2)
+    with pytest.raises(ValueError, match="sort order"):
+        decode_cursor(cursor, "published_at:ASC")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("not-a-cursor!", "published_at:DESC")
+
+
+def test_pages_continue_after_cursor_with_nulls_last():
+    pagination = KeysetPagination(ARTICLES, "published_at", "DESC", limit=2)
+    first_sql, first_params = pagination.build(columns=["published_at", "body"])
+    assert first_sql.endswith(
+        'ORDER BY "custom"."articles"."published_at" DESC NULLS LAST, "custom"."articles"."id" DESC LIMIT $1'
+    )
+    assert 'left("body", 101) AS "body"' in first_sql
+    assert first_params == [3]
+
+    rows = [
+        ["a", "2025-10-31T10:00:00Z", "x", "2025-10-31T10:00:00Z"],
+        ["b", "2025-10-30T10:00:00Z", "y", "2025-10-30T10:00:00Z"],
+        ["c", None, "z", None],
+    ]
+    entries, cursor = pagination.page(rows, columns=["published_at", "body"])
+    assert [entry["id"] for entry in entries] == ["a", "b"]
+
+    sql, params = pagination.build(cursor=cursor, columns=["published_at", "body"])
+    assert '(("published_at", "id") < ($1, $2) OR "published_at" IS NULL)' in sql
+    assert params == [datetime(2025, 10, 30, 10, 0, tzinfo=timezone.utc), "b", 3]
+
+    null_cursor = encode_cursor(pagination.sort_key, None, "c")
+    sql, params = pagination.build(cursor=null_cursor)
+    assert '"published_at" IS NULL AND "id" < $1' in sql
+
+
+@pytest.mark.parametrize("schema, sort_by, sort_value, expected", [
+    (ARTICLES, "created_at", datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc),
+     datetime(2025, 10, 31, 10, 30, tzinfo=timezone.utc)),
+    (PRODUCTS, "price", Decimal("19.99"), Decimal("19.99")),
+    (PRODUCTS, "launched_on", date(2025, 10, 31), date(2025, 10, 31)),
+    (PRODUCTS, "name", "Lamp", "Lamp"),
+])
+def test_cursor_values_are_bound_as_column_types(schema, sort_by, sort_value, expected):
+    pagination = KeysetPagination(schema, sort_by, "ASC", limit=1)
+    _, cursor = pagination.page([[ENTRY_ID, sort_value], [ENTRY_ID, sort_value]], columns=[])
+    _, params = pagination.build(cursor=cursor, columns=[])
+    assert params[0] == expected
+    assert type(params[0]) is type(expected)
+
+
+def test_cursor_with_unparseable_value_is_invalid():
+    pagination = KeysetPagination(ARTICLES, "created_at")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        pagination.build(cursor=encode_cursor(pagination.sort_key, "yesterday", "a"))
+
+
+def test_last_page_has_no_cursor():
+    pagination = KeysetPagination(ARTICLES, limit=2)
+    entries, cursor = pagination.page([["a", "a"]], columns=[])
+    assert entries == [{"id": "a"}] and cursor is None
+    assert pagination.index_sql() is None
+
+
+def test_index_and_validation():
+    pagination = KeysetPagination(ARTICLES, "published_at", "asc", index_prefix=["meta"])
+    assert pagination.index_sql() == (
+        'CREATE INDEX idx_articles_meta_published_at_keyset ON "custom"."articles"'
+        '("meta", "published_at" ASC NULLS LAST, "id" ASC);'
+    )
+    with pytest.raises(ValueError, match="not sortable"):
+        KeysetPagination(ARTICLES, "body")
+    with pytest.raises(ValueError, match="Unknown sort field"):
+        KeysetPagination(ARTICLES, "missing")
@@ -0,0 +1,42 @@
+from polysynergy_section_field.field_types.relation.one_to_many import RelationOneToManyField
+from polysynergy_section_field.field_types.text.text import TextField
+from polysynergy_section_field.field_types.text.text_area import TextAreaField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.sql.projection import (
+    ProjectionPlan,
+    compile_array_slice_projection,
+    compile_truncated_projection,
+)
+
+PREVIEW = {"props": {"truncate": True, "maxLength": 100}}
+
+
+def test_truncation_keeps_one_extra_character():
+    assert compile_truncated_projection('"body"', PREVIEW) == 'left("body", 101)'
+
+
+def test_no_truncation_when_stored_values_fit():
+    assert compile_truncated_projection('"body"', PREVIEW, stored_max_length=100) == '"body"'
+    assert compile_truncated_projection('"body"', PREVIEW, stored_max_length=101) == '"body"'
+    assert compile_truncated_projection('"body"', PREVIEW, stored_max_length=102) == 'left("body", 101)'
+    assert compile_truncated_projection('"body"', {"props": {"maxLength": 100}}) == '"body"'
+
+
+def test_array_slice():
+    assert compile_array_slice_projection('"tags"', None) == '"tags"'
+    assert "'$[0 to 2]'" in compile_array_slice_projection('"tags"', 3)
+
+
+def test_plan_skips_virtual_columns_and_marks_previews():
+    schema = SectionSchema("articles", [
+        SectionField("title", TextField(), {"maxLength": 80}),
+        SectionField("body", TextAreaField()),
+        SectionField("notes", TextAreaField(), {"separateTable": True}),
+        SectionField("comments", RelationOneToManyField(), {"relatedSection": "comments", "foreignKeyField": "article"}),
+    ])
+    plan = ProjectionPlan(schema, ["body", "title", "notes", "comments"])
+
+    assert plan.columns == ("body", "title")
+    assert plan.previews == ("body",)
+    assert plan.select == 'SELECT "id", left("body", 101) AS "body", "title" FROM "custom"."articles"'
+    assert plan.row_to_entry(["6f1c", None, "Hello"]) == {"id": "6f1c", "body": None, "title": "Hello"}
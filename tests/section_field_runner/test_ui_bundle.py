@@ -0,0 +1,60 @@
+import json
+
+from polysynergy_section_field.field_types.selection.multi_select import MultiSelectField
+from polysynergy_section_field.field_types.selection.select import SelectField
+from polysynergy_section_field.field_types.text.text import TextField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.ui_bundle import SectionUIBundle, SectionUIBundleCache
+
+OPTIONS = [{"value": "news", "label": "News"}, {"value": "tech", "label": "Technology"}]
+
+
+def articles(label="Title"):
+    return SectionSchema("articles", [
+        SectionField("title", TextField(), is_required=True, label=label),
+        SectionField("tags", MultiSelectField(), {"options": OPTIONS, "tableMaxTags": 3}, label="Tags"),
+        SectionField("status", SelectField(), {"options": ["draft", {"value": "live", "label": "Live"}]}),
+    ])
+
+
+def test_column_templates_keep_the_value_dependent_components():
+    columns = {column["handle"]: column for column in SectionUIBundle(articles()).columns}
+
+    assert columns["tags"]["component"] == "TagsCell"
+    assert columns["tags"]["props"]["maxTags"] == 3
+    assert columns["tags"]["props"]["labels"] == {"news": "News", "tech": "Technology"}
+    assert columns["status"]["component"] == "TextCell"
+    assert columns["status"]["props"]["labels"] == {"draft": "draft", "live": "Live"}
+    assert columns["title"] == {
+        "handle": "title",
+        "label": "Title",
+        "component": "TextCell",
+        "props": {"value": None, "truncate": True, "maxLength": 50},
+    }
+
+
+def test_forms_and_json_encoding():
+    bundle = SectionUIBundle(articles())
+    assert [form["handle"] for form in bundle.forms] == ["title", "tags", "status"]
+    assert bundle.forms[1]["component"] == "MultiSelect"
+    assert bundle.forms[1]["field_type"] == "multi_select"
+
+    decoded = json.loads(bundle.json_bytes)
+    assert decoded["section"] == "articles"
+    assert decoded["columns"][1]["component"] == "TagsCell"
+
+
+def test_etag_follows_content():
+    bundle = SectionUIBundle(articles())
+    assert bundle.etag == SectionUIBundle(articles()).etag
+    assert bundle.etag != SectionUIBundle(articles("Headline")).etag
+    assert bundle.not_modified(f'W/{bundle.etag}, "other"')
+    assert not bundle.not_modified(None)
+
+
+def test_ui_texts_give_a_new_bundle():
+    before, after = articles("Title"), articles("Headline")
+    bundles = SectionUIBundleCache()
+    assert bundles.get(before) is bundles.get(articles("Title"))
+    assert bundles.get(before) is not bundles.get(after)
+    assert b'"Headline"' in bundles.get(after).json_bytes
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from polysynergy_section_field.field_types.text.text import TextField
+from polysynergy_section_field.section_field_runner import SectionField, SectionSchema
+from polysynergy_section_field.section_field_runner.validation.async_validation import (
+    AsyncChecker,
+    AsyncValidationPipeline,
+)
+
+ARTICLES = SectionSchema("articles", [SectionField("title", TextField()), SectionField("subtitle", TextField())])
+
+
+class SlowChecker(AsyncChecker):
+    """Records every check and the peak number of checks in flight"""
+
+    def __init__(self, rejected=()):
+        self.rejected = set(rejected)
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def check(self, value, settings, context):
+        self.calls.append(value)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if value in self.rejected:
+            return (False, f"'{value}' is taken")
+        return (True, None)
+
+
+def validate(checker, entries, concurrency=10):
+    pipeline = AsyncValidationPipeline(concurrency=concurrency)
+    pipeline.register("text", checker)
+    return asyncio.run(pipeline.validate_entries(ARTICLES, entries))
+
+
+def test_concurrency_limit_is_respected():
+    checker = SlowChecker()
+    entries = [{"title": f"title {index}", "subtitle": f"subtitle {index}"} for index in range(20)]
+
+    assert validate(checker, entries, concurrency=3) == [{}] * 20
+    assert len(checker.calls) == 40
+    assert checker.peak == 3
+
+
+def test_identical_checks_run_once_and_share_their_result():
+    checker = SlowChecker(rejected={"taken"})
+    entries = [{"title": "taken"}, {"title": "free"}, {"title": "taken"}, {"title": "free"}]
+
+    errors = validate(checker, entries)
+    assert errors == [{"title": "'taken' is taken"}, {}, {"title": "'taken' is taken"}, {}]
+    assert sorted(checker.calls) == ["free", "taken"]
+
+
+def test_checks_are_not_shared_across_fields_or_batches():
+    checker = SlowChecker()
+    validate(checker, [{"title": "same", "subtitle": "same"}])
+    validate(checker, [{"title": "same"}])
+    assert checker.calls == ["same", "same", "same"]
+
+
+def test_concurrency_must_be_positive():
+    with pytest.raises(ValueError, match="at least 1"):
+        AsyncValidationPipeline(concurrency=0)